@@ -72,6 +72,7 @@ try:
         AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
     )
     from gui_algorithm_manager import MockProblemProvider
+    from app_warmup import AppWarmup, WarmupProgressView, build_challenge_warmup_steps
 except ImportError:
     # 상대 경로로 임포트 시도
     try:
@@ -83,6 +84,7 @@ except ImportError:
             AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
         )
         from .gui_algorithm_manager import MockProblemProvider
+        from .app_warmup import AppWarmup, WarmupProgressView, build_challenge_warmup_steps
     except ImportError:
         # 절대 경로로 임포트 시도
         import sys
@@ -95,6 +97,7 @@ except ImportError:
             AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
         )
         from gui_algorithm_manager import MockProblemProvider
+        from app_warmup import AppWarmup, WarmupProgressView, build_challenge_warmup_steps
 
 
 class MemoryMonitor:
@@ -922,6 +925,10 @@ class IntegratedFocusTimer:
         self.setup_gui()
         self.load_initial_data()
 
+        # 첫 화면을 그린 뒤 백그라운드 워커에서 문제/진도/추천 데이터 워밍업
+        self.warmup: Optional[AppWarmup] = None
+        self.root.after_idle(self.start_warmup)
+
         # 주기적 업데이트
         self.schedule_updates()
 
@@ -1943,9 +1950,8 @@ class IntegratedFocusTimer:
 
     # 알고리즘 시스템 관련 메서드들 (기존 GUI와 동일)
     def load_initial_data(self):
-        """초기 데이터 로드"""
+        """초기 데이터 로드 (추천 문제는 워밍업 완료 후 표시)"""
         self.refresh_statistics()
-        self.refresh_recommendations()
         self.refresh_challenges()
         self.refresh_detailed_statistics()
         self.refresh_performance_stats()  # 성능 통계 로드
@@ -1978,25 +1984,39 @@ if __name__ == "__main__":
         except Exception as e:
             messagebox.showerror("오류", f"통계 로드 실패: {e}")
 
+    def start_warmup(self):
+        """BackgroundTaskOptimizer 워커에서 워밍업을 시작하고 진행 상황 폴링을 예약합니다."""
+        self.warmup = AppWarmup(
+            build_challenge_warmup_steps(self.challenge_system, 10),
+            scheduler=self.background_optimizer
+        )
+        WarmupProgressView(
+            self.root, self.warmup, self.recommendations_tree,
+            self._show_recommendations, self.refresh_recommendations
+        ).start()
+
     def refresh_recommendations(self):
         """추천 문제 새로고침"""
         try:
-            # 기존 항목 삭제
-            for item in self.recommendations_tree.get_children():
-                self.recommendations_tree.delete(item)
-
             # 새로운 추천 문제 로드
             recommendations = self.challenge_system.get_personalized_recommendations(10)
-
-            for problem in recommendations:
-                tags_str = ', '.join(tag.name for tag in problem.tags)
-                self.recommendations_tree.insert('', 'end',
-                                               values=(problem.title, problem.difficulty.name, tags_str),
-                                               tags=(problem.id,))
+            self._show_recommendations(recommendations)
 
         except Exception as e:
             messagebox.showerror("오류", f"추천 문제 로드 실패: {e}")
 
+    def _show_recommendations(self, recommendations: List[AlgorithmProblem]):
+        """추천 문제 목록을 표시합니다."""
+        # 기존 항목 삭제
+        for item in self.recommendations_tree.get_children():
+            self.recommendations_tree.delete(item)
+
+        for problem in recommendations:
+            tags_str = ', '.join(tag.name for tag in problem.tags)
+            self.recommendations_tree.insert('', 'end',
+                                           values=(problem.title, problem.difficulty.name, tags_str),
+                                           tags=(problem.id,))
+
     def refresh_challenges(self):
         """챌린지 새로고침"""
         try:
@@ -2056,6 +2076,8 @@ if __name__ == "__main__":
                 return
 
             item = tree.item(selection[0])
+            if not item['tags']:
+                return  # 워밍업 진행 표시 행
             problem_id = item['tags'][0]
 
             # 문제 정보 로드
@@ -11,7 +11,8 @@ from .problem_data_structures import (
     ProblemTag,
     ProblemTestCase,
     ProblemMetadata,
-    ProblemCollection
+    ProblemCollection,
+    CompactProblem
 )
 
 from .remote_problem_provider import (
@@ -22,6 +23,21 @@ from .remote_problem_provider import (
     RemoteProblemManager
 )
 
+from .problem_catalog import ProblemCatalog
+from .memory_cache import LRUCache
+from .lazy_catalog import LazyProblemCatalog
+from .request_layer import RequestLayer, get_default_request_layer
+from .async_provider import AsyncProblemProvider, AsyncRemoteProblemManager
+from .problem_hydration import ProblemHydrator
+from .content_store import ContentStore
+from .catalog_snapshot import LocalSnapshotProvider, export_snapshot, import_snapshot
+from .app_warmup import AppWarmup, WarmupProgressView
+from .provider_registry import register_provider, get_registered_platforms
+from .duplicate_index import DuplicateIndex
+from .provider_metrics import MetricsRegistry, get_default_metrics, start_metrics_server
+from .problem_query_engine import ProblemQueryEngine
+from .columnar_export import export_columnar, load_columnar
+
 __version__ = "1.0.0"
 __author__ = "Focus Timer Team"
 
@@ -33,9 +49,33 @@ __all__ = [
     "ProblemTestCase",
     "ProblemMetadata",
     "ProblemCollection",
+    "CompactProblem",
     "RemoteProblemProvider",
     "CodeforcesProvider",
     "LeetCodeProvider",
     "KaggleProvider",
-    "RemoteProblemManager"
+    "RemoteProblemManager",
+    "ProblemCatalog",
+    "LRUCache",
+    "LazyProblemCatalog",
+    "RequestLayer",
+    "get_default_request_layer",
+    "AsyncProblemProvider",
+    "AsyncRemoteProblemManager",
+    "ProblemHydrator",
+    "ContentStore",
+    "LocalSnapshotProvider",
+    "export_snapshot",
+    "import_snapshot",
+    "AppWarmup",
+    "WarmupProgressView",
+    "register_provider",
+    "get_registered_platforms",
+    "DuplicateIndex",
+    "MetricsRegistry",
+    "get_default_metrics",
+    "start_metrics_server",
+    "ProblemQueryEngine",
+    "export_columnar",
+    "load_columnar"
 ]
\ No newline at end of file
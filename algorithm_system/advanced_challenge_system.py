@@ -35,11 +35,15 @@ try:
         AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
     )
     from .user_progress_tracker import UserProgressTracker, ProblemSubmission, SubmissionStatus
+    from .duplicate_index import DuplicateIndex
+    from .problem_query_engine import ProblemQueryEngine
 except ImportError:
     from problem_data_structures import (
         AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
     )
     from user_progress_tracker import UserProgressTracker, ProblemSubmission, SubmissionStatus
+    from duplicate_index import DuplicateIndex
+    from problem_query_engine import ProblemQueryEngine
 
 
 class ChallengeType(Enum):
@@ -265,6 +269,12 @@ class UserBasedRecommender:
         self.progress_tracker = progress_tracker
         self.problem_provider = problem_provider
 
+        # 다른 플랫폼의 같은 문제를 함께 추천하지 않도록 사용
+        self.duplicate_index = DuplicateIndex()
+
+        # 문제 목록의 난이도/플랫폼/태그 비트셋 (목록이 바뀌면 다시 생성)
+        self._query_engine: Optional[ProblemQueryEngine] = None
+
     def get_personalized_recommendations(self, count: int = 5) -> List[AlgorithmProblem]:
         """개인화된 문제 추천"""
         user_level = self.progress_tracker.get_user_level()
@@ -311,78 +321,70 @@ class UserBasedRecommender:
         )
         recommendations.extend(strong_tag_problems)
 
-        # 중복 제거 및 개수 조정
+        # 중복 제거 (다른 플랫폼의 같은 문제 포함) 및 개수 조정
         unique_recommendations = []
         seen_ids = set()
-        for problem in recommendations:
+        for problem in self.duplicate_index.deduplicate(recommendations):
             if problem.id not in seen_ids and len(unique_recommendations) < count:
                 unique_recommendations.append(problem)
                 seen_ids.add(problem.id)
 
         return unique_recommendations
 
+    def _get_query_engine(self) -> ProblemQueryEngine:
+        """현재 문제 목록의 질의 엔진을 반환합니다 (목록이 바뀌었으면 다시 생성)."""
+        all_problems = self.problem_provider.get_all_problems()
+        if self._query_engine is None or not self._query_engine.matches(all_problems):
+            self._query_engine = ProblemQueryEngine(all_problems)
+        return self._query_engine
+
+    def _get_difficulties_in_range(self, min_score: int, max_score: int) -> List[ProblemDifficulty]:
+        """점수가 범위 안에 있는 난이도 목록"""
+        return [
+            difficulty for difficulty in ProblemDifficulty
+            if min_score <= self._get_difficulty_score(difficulty) <= max_score
+        ]
+
     def _get_problems_by_tags(self, tags: List[str], count: int,
                              exclude_problems: set, user_level: int) -> List[AlgorithmProblem]:
         """태그 기반 문제 추천"""
-        all_problems = self.problem_provider.get_all_problems()
-        tagged_problems = []
-
-        for problem in all_problems:
-            if problem.id in exclude_problems:
-                continue
-
-            problem_tags = {tag.name for tag in problem.tags}
-            if any(tag in problem_tags for tag in tags):
-                # 사용자 레벨에 맞는 난이도 필터링
-                difficulty_score = self._get_difficulty_score(problem.difficulty)
-                if abs(difficulty_score - user_level) <= 2:  # 레벨 차이가 2 이하
-                    tagged_problems.append(problem)
-
-        return random.sample(tagged_problems, min(count, len(tagged_problems)))
+        engine = self._get_query_engine()
+        mask = engine.query_mask(
+            # 사용자 레벨에 맞는 난이도 필터링 (레벨 차이가 2 이하)
+            difficulty=self._get_difficulties_in_range(user_level - 2, user_level + 2),
+            any_tags=[ProblemTag[tag] for tag in tags if tag in ProblemTag.__members__],
+            exclude_mask=engine.ids_mask(exclude_problems)
+        )
+        return engine.sample(mask, count)
 
     def _get_problems_by_difficulty(self, difficulty: ProblemDifficulty,
                                    count: int, exclude_problems: set) -> List[AlgorithmProblem]:
         """난이도 기반 문제 추천"""
-        all_problems = self.problem_provider.get_all_problems()
-        filtered_problems = [
-            p for p in all_problems
-            if p.difficulty == difficulty and p.id not in exclude_problems
-        ]
-        return random.sample(filtered_problems, min(count, len(filtered_problems)))
+        engine = self._get_query_engine()
+        mask = engine.query_mask(difficulty=difficulty, exclude_mask=engine.ids_mask(exclude_problems))
+        return engine.sample(mask, count)
 
     def _get_next_level_problems(self, count: int, exclude_problems: set,
                                 user_level: int) -> List[AlgorithmProblem]:
         """다음 레벨 준비 문제 추천"""
-        all_problems = self.problem_provider.get_all_problems()
-        next_level_problems = []
-
-        for problem in all_problems:
-            if problem.id in exclude_problems:
-                continue
-
-            difficulty_score = self._get_difficulty_score(problem.difficulty)
-            if user_level + 1 <= difficulty_score <= user_level + 2:
-                next_level_problems.append(problem)
-
-        return random.sample(next_level_problems, min(count, len(next_level_problems)))
+        engine = self._get_query_engine()
+        mask = engine.query_mask(
+            difficulty=self._get_difficulties_in_range(user_level + 1, user_level + 2),
+            exclude_mask=engine.ids_mask(exclude_problems)
+        )
+        return engine.sample(mask, count)
 
     def _get_advanced_problems_by_tags(self, tags: List[str], count: int,
                                       exclude_problems: set) -> List[AlgorithmProblem]:
         """강한 태그 심화 문제 추천"""
-        all_problems = self.problem_provider.get_all_problems()
-        advanced_problems = []
-
-        for problem in all_problems:
-            if problem.id in exclude_problems:
-                continue
-
-            problem_tags = {tag.name for tag in problem.tags}
-            if any(tag in problem_tags for tag in tags):
-                # 어려운 난이도만 선택
-                if problem.difficulty in [ProblemDifficulty.HARD, ProblemDifficulty.EXPERT]:
-                    advanced_problems.append(problem)
-
-        return random.sample(advanced_problems, min(count, len(advanced_problems)))
+        engine = self._get_query_engine()
+        mask = engine.query_mask(
+            # 어려운 난이도만 선택
+            difficulty=[ProblemDifficulty.HARD, ProblemDifficulty.EXPERT],
+            any_tags=[ProblemTag[tag] for tag in tags if tag in ProblemTag.__members__],
+            exclude_mask=engine.ids_mask(exclude_problems)
+        )
+        return engine.sample(mask, count)
 
     def _get_difficulty_score(self, difficulty: ProblemDifficulty) -> int:
         """난이도를 점수로 변환"""
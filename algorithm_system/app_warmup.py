@@ -0,0 +1,220 @@
+"""
+애플리케이션 시작 워밍업
+
+이 모듈은 GUI 시작 시 문제 카탈로그, 사용자 진도 데이터, 추천 결과를 백그라운드에서 미리 불러오는
+워밍업 단계를 제공합니다. 첫 화면은 워밍업을 기다리지 않고 그려지며, 진행 상황은 이벤트 큐로 전달되어
+Tk 메인 스레드에서 root.after 폴링으로 안전하게 표시할 수 있습니다.
+
+작업 실행은 add_task(task_id, func, priority, callback) 인터페이스를 가진 스케줄러
+(예: BackgroundTaskOptimizer)에 맡기며, 스케줄러가 없으면 데몬 스레드에서 실행합니다.
+WarmupProgressView는 두 GUI가 공유하는 진행 표시/폴링 로직입니다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupStep:
+    """워밍업 단계 (같은 stage의 단계들은 동시에 실행)"""
+    name: str
+    label: str
+    func: Callable[[], Any]
+    stage: int = 0
+
+
+class AppWarmup:
+    """단계별 백그라운드 워밍업 실행기"""
+
+    def __init__(self, steps: List[WarmupStep], scheduler=None, priority: int = 2,
+                 task_prefix: str = "warmup"):
+        self.steps = list(steps)
+        self.scheduler = scheduler
+        self.priority = priority
+        self.task_prefix = task_prefix
+
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, str] = {}
+        self.events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+
+        self._stages = sorted({step.stage for step in self.steps})
+        self._stage_index = 0
+        self._pending_in_stage = 0
+        self._completed = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._started_at: Optional[float] = None
+
+    @property
+    def total(self) -> int:
+        return len(self.steps)
+
+    @property
+    def is_complete(self) -> bool:
+        return self._done.is_set()
+
+    def start(self) -> None:
+        """첫 번째 단계의 작업들을 예약합니다."""
+        self._started_at = time.time()
+        if not self.steps:
+            self._finish()
+            return
+        self._submit_stage()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """워밍업이 끝날 때까지 기다립니다 (GUI 스레드에서는 사용하지 마세요)."""
+        return self._done.wait(timeout)
+
+    def poll_events(self) -> List[Tuple[str, Any]]:
+        """쌓인 진행 이벤트를 모두 꺼내 반환합니다.
+
+        이벤트는 ("progress", (완료 수, 전체 수, 단계 이름)) 또는 ("complete", 소요 시간(초)) 입니다.
+        """
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _submit_stage(self) -> None:
+        stage = self._stages[self._stage_index]
+        stage_steps = [step for step in self.steps if step.stage == stage]
+        with self._lock:
+            self._pending_in_stage = len(stage_steps)
+
+        for step in stage_steps:
+            task = lambda step=step: self._run_step(step)
+            if self.scheduler is not None:
+                self.scheduler.add_task(self._task_id(step), task, self.priority)
+            else:
+                threading.Thread(target=task, name=f"{self.task_prefix}-{step.name}", daemon=True).start()
+
+    def take_results(self) -> Dict[str, Any]:
+        """단계별 결과를 넘겨주고 워밍업과 스케줄러에 남은 참조를 지웁니다.
+
+        스케줄러(BackgroundTaskOptimizer)는 작업 반환값을 task_results에 계속 보관하므로,
+        결과를 읽은 뒤 워밍업 작업 항목을 제거해 전체 문제 목록이 프로세스 수명 동안 남지 않게 합니다.
+        """
+        results, self.results = self.results, {}
+        task_results = getattr(self.scheduler, 'task_results', None)
+        if task_results is not None:
+            for step in self.steps:
+                task_results.pop(self._task_id(step), None)
+        return results
+
+    def _task_id(self, step: WarmupStep) -> str:
+        return f"{self.task_prefix}_{step.name}"
+
+    def _run_step(self, step: WarmupStep) -> None:
+        """단계를 실행하고 결과를 기록합니다. 예외는 기록만 하고 다음 단계로 진행합니다.
+
+        결과는 self.results로만 전달하고 반환하지 않습니다. 마지막 단계의 반환값은 완료 이벤트 뒤에
+        스케줄러에 저장되므로, 반환하면 take_results()가 지운 뒤에 다시 남을 수 있습니다.
+        """
+        try:
+            self.results[step.name] = step.func()
+        except Exception as e:
+            self.errors[step.name] = str(e)
+            logger.warning(f"워밍업 단계 실패 ({step.name}): {e}")
+
+        with self._lock:
+            self._completed += 1
+            self._pending_in_stage -= 1
+            completed = self._completed
+            stage_finished = self._pending_in_stage == 0
+
+        self.events.put(("progress", (completed, self.total, step.label)))
+
+        if stage_finished:
+            self._stage_index += 1
+            if self._stage_index < len(self._stages):
+                self._submit_stage()
+            else:
+                self._finish()
+
+    def _finish(self) -> None:
+        elapsed = time.time() - self._started_at if self._started_at else 0.0
+        logger.info(f"워밍업 완료: {self._completed}/{self.total}단계 ({elapsed:.2f}초)")
+        self.events.put(("complete", elapsed))
+        self._done.set()
+
+
+class WarmupProgressView:
+    """워밍업 진행 상황을 추천 목록(ttk.Treeview) 자리에 표시하고 완료되면 추천 결과로 바꿉니다.
+
+    이벤트 큐는 root.after 폴링으로 Tk 메인 스레드에서만 읽습니다. 완료 시 미리 계산된 추천이 있으면
+    show_recommendations(추천 목록)을, 없으면 refresh_recommendations()를 호출합니다.
+    """
+
+    def __init__(self, root, warmup: AppWarmup, tree,
+                 show_recommendations: Callable[[List[Any]], None],
+                 refresh_recommendations: Callable[[], None],
+                 poll_interval_ms: int = 100):
+        self.root = root
+        self.warmup = warmup
+        self.tree = tree
+        self.show_recommendations = show_recommendations
+        self.refresh_recommendations = refresh_recommendations
+        self.poll_interval_ms = poll_interval_ms
+
+    def start(self) -> None:
+        """워밍업을 시작하고 진행 상황 폴링을 예약합니다."""
+        self.show_progress(0, self.warmup.total, "")
+        self.warmup.start()
+        self.root.after(self.poll_interval_ms, self.poll)
+
+    def poll(self) -> None:
+        """워밍업 진행 이벤트를 Tk 스레드에서 반영합니다."""
+        for event, payload in self.warmup.poll_events():
+            if event == "progress":
+                self.show_progress(*payload)
+            elif event == "complete":
+                recommendations = self.warmup.take_results().get('recommendations')
+                if recommendations is None:
+                    self.refresh_recommendations()
+                else:
+                    self.show_recommendations(recommendations)
+                return
+
+        self.root.after(self.poll_interval_ms, self.poll)
+
+    def show_progress(self, completed: int, total: int, label: str) -> None:
+        """추천 목록 자리에 워밍업 진행 상황을 표시합니다."""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        status = f"추천 준비 중... ({completed}/{total})"
+        if label:
+            status += f" {label} 로드 완료"
+        self.tree.insert('', 'end', values=(status, '', ''))
+
+
+def build_challenge_warmup_steps(challenge_system, recommendation_count: int = 10) -> List[WarmupStep]:
+    """챌린지 시스템의 문제 목록, 진도 통계, 첫 추천 결과를 미리 계산하는 워밍업 단계를 만듭니다."""
+    provider = challenge_system.problem_provider
+    tracker = challenge_system.progress_tracker
+
+    def load_tracker_summary() -> Dict[str, Any]:
+        return {
+            'user_level': tracker.get_user_level(),
+            'solved_problems': tracker.get_solved_problems(),
+            'weak_tags': tracker.get_weak_tags(3),
+            'strong_tags': tracker.get_strong_tags(3)
+        }
+
+    return [
+        WarmupStep("problems", "문제 카탈로그", provider.get_all_problems, stage=0),
+        WarmupStep("tracker", "학습 진도", load_tracker_summary, stage=0),
+        WarmupStep(
+            "recommendations", "추천 문제",
+            lambda: challenge_system.get_personalized_recommendations(recommendation_count),
+            stage=1
+        )
+    ]
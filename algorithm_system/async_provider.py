@@ -0,0 +1,176 @@
+"""
+비동기 원격 문제 제공자
+
+이 모듈은 원격 문제 제공자를 asyncio 코루틴으로 사용할 수 있는 비동기 인터페이스를 제공합니다.
+GUI나 웹 서버의 이벤트 루프에서 스레드를 직접 만들지 않고도 문제 목록과 상세 정보를
+await 할 수 있으며, 여러 상세 정보 요청을 하나의 루프에서 동시에 처리할 수 있습니다.
+
+요청은 공유 스레드 풀에서 기존 프로바이더 코드를 그대로 실행하므로 캐시, 요청 계층
+(속도 제한/재시도/서킷 브레이커) 동작이 동기 API와 동일합니다. 비동기 래퍼는 동시 요청 수만큼의
+연결 풀을 가진 자체 세션으로 요청하므로, 동기 API가 쓰는 프로바이더 세션 설정은 바뀌지 않습니다.
+"""
+
+import asyncio
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .problem_data_structures import AlgorithmProblem, ProblemPlatform, ProblemCollection
+    from .remote_problem_provider import RemoteProblemProvider, RemoteProblemManager
+except ImportError:
+    from problem_data_structures import AlgorithmProblem, ProblemPlatform, ProblemCollection
+    from remote_problem_provider import RemoteProblemProvider, RemoteProblemManager
+
+
+def create_pooled_session(provider: RemoteProblemProvider, pool_size: int) -> requests.Session:
+    """프로바이더 세션의 헤더를 복사하고 연결 풀 크기를 동시 요청 수에 맞춘 새 세션을 만듭니다."""
+    session = requests.Session()
+    session.headers.update(provider.session.headers)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class AsyncProblemProvider:
+    """RemoteProblemProvider의 비동기 인터페이스"""
+
+    def __init__(self, provider: RemoteProblemProvider, max_concurrency: int = 8,
+                 executor: Optional[ThreadPoolExecutor] = None):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix=f"async-{provider.platform.name.lower()}"
+        )
+        self._owns_executor = executor is None
+        self.session = create_pooled_session(provider, max_concurrency)
+        # 세마포어는 처음 사용한 이벤트 루프에 묶이므로 루프마다 따로 만듦
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def platform(self) -> ProblemPlatform:
+        return self.provider.platform
+
+    async def _run(self, func: Callable[..., Any], *args) -> Any:
+        """동시 요청 수를 제한하며 동기 함수를 스레드 풀에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(loop, asyncio.Semaphore(self.max_concurrency))
+
+        async with semaphore:
+            return await loop.run_in_executor(
+                self._executor, self.provider.call_with_session, self.session, func, *args
+            )
+
+    async def get_problems(self, limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """문제 목록을 비동기로 가져옵니다."""
+        return await self._run(self.provider.get_problems, limit)
+
+    async def get_problem_details(self, problem_id: str) -> Optional[AlgorithmProblem]:
+        """특정 문제의 상세 정보를 비동기로 가져옵니다."""
+        return await self._run(self.provider.get_problem_details, problem_id)
+
+    async def get_many_problem_details(self, problem_ids: List[str]) -> Dict[str, Optional[AlgorithmProblem]]:
+        """여러 문제의 상세 정보를 동시에 가져옵니다. 실패한 문제는 None으로 채웁니다."""
+        results = await asyncio.gather(
+            *(self.get_problem_details(problem_id) for problem_id in problem_ids),
+            return_exceptions=True
+        )
+
+        details = {}
+        for problem_id, result in zip(problem_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"문제 상세 정보 가져오기 실패 ({problem_id}): {result}")
+                result = None
+            details[problem_id] = result
+        return details
+
+    def close(self) -> None:
+        """자체 세션과 직접 생성한 스레드 풀을 종료합니다."""
+        self.session.close()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> 'AsyncProblemProvider':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class AsyncRemoteProblemManager:
+    """RemoteProblemManager의 비동기 인터페이스"""
+
+    def __init__(self, manager: Optional[RemoteProblemManager] = None, max_concurrency: int = 8):
+        self.manager = manager or RemoteProblemManager()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="async-provider")
+        self.max_concurrency = max_concurrency
+        self.providers: Dict[ProblemPlatform, AsyncProblemProvider] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def get_provider(self, platform: ProblemPlatform) -> Optional[AsyncProblemProvider]:
+        """플랫폼별 비동기 프로바이더를 반환합니다. 처음 요청될 때 감쌉니다."""
+        provider = self.providers.get(platform)
+        if provider is None:
+            remote_provider = self.manager.get_provider(platform)
+            if remote_provider is None:
+                return None
+            provider = self.providers.setdefault(
+                platform, AsyncProblemProvider(remote_provider, self.max_concurrency, executor=self._executor)
+            )
+        return provider
+
+    async def get_all_problems(self, platform: ProblemPlatform,
+                               limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """특정 플랫폼에서 모든 문제를 비동기로 가져옵니다."""
+        provider = self.get_provider(platform)
+        if not provider:
+            self.logger.error(f"지원하지 않는 플랫폼: {platform}")
+            return []
+
+        try:
+            return await provider.get_problems(limit)
+        except Exception as e:
+            self.logger.error(f"문제 가져오기 실패 ({platform}): {e}")
+            return []
+
+    async def get_problem_details(self, platform: ProblemPlatform,
+                                  problem_id: str) -> Optional[AlgorithmProblem]:
+        """특정 문제의 상세 정보를 비동기로 가져옵니다."""
+        provider = self.get_provider(platform)
+        if not provider:
+            self.logger.error(f"지원하지 않는 플랫폼: {platform}")
+            return None
+
+        try:
+            return await provider.get_problem_details(problem_id)
+        except Exception as e:
+            self.logger.error(f"문제 상세 정보 가져오기 실패 ({platform}): {e}")
+            return None
+
+    async def get_problems_from_all_platforms(self, limit: Optional[int] = None,
+                                              timeout: Optional[float] = 60.0) -> ProblemCollection:
+        """모든 플랫폼의 문제를 동시에 가져와 하나의 컬렉션으로 합칩니다."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.manager.get_problems_from_all_platforms, limit, timeout
+        )
+
+    def close(self) -> None:
+        """비동기 프로바이더 세션과 스레드 풀을 종료합니다."""
+        for provider in self.providers.values():
+            provider.close()
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> 'AsyncRemoteProblemManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
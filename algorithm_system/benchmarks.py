@@ -0,0 +1,247 @@
+"""
+알고리즘 시스템 마이크로 벤치마크
+
+네트워크 없이 합성 데이터로 변환/역직렬화 경로의 처리량을 측정합니다.
+
+    python algorithm_system/benchmarks.py --size 10000 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithm_system.problem_data_structures import AlgorithmProblem, ProblemDifficulty, ProblemTag
+from algorithm_system.remote_problem_provider import CodeforcesProvider, LeetCodeProvider
+
+
+CODEFORCES_TAGS = [
+    'brute force', 'greedy', 'dp', 'math', 'number theory', 'graphs', 'trees', 'strings',
+    'binary search', 'sortings', 'implementation', 'constructive algorithms', 'dfs and similar',
+    'data structures', 'two pointers', 'bitmasks', 'combinatorics', 'geometry', 'shortest paths'
+]
+
+LEETCODE_TAGS = [
+    'Array', 'String', 'Hash Table', 'Dynamic Programming', 'Math', 'Sorting', 'Greedy',
+    'Depth-First Search', 'Binary Search', 'Tree', 'Breadth-First Search', 'Two Pointers',
+    'Bit Manipulation', 'Stack', 'Design', 'Simulation', 'Sliding Window', 'Graph'
+]
+
+
+def make_codeforces_payload(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """problemset.problems 응답 형식의 합성 문제 목록을 만듭니다."""
+    rng = random.Random(seed)
+    problems = []
+    for i in range(size):
+        problem = {
+            'contestId': 1 + i // 6,
+            'index': 'ABCDEF'[i % 6],
+            'name': f"Problem {i}",
+            'type': 'PROGRAMMING',
+            'tags': rng.sample(CODEFORCES_TAGS, rng.randint(0, 4))
+        }
+        if rng.random() < 0.9:
+            problem['rating'] = rng.randrange(800, 3600, 100)
+        problems.append(problem)
+    return problems
+
+
+def make_leetcode_payload(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """problemsetQuestionList 응답 형식의 합성 질문 목록을 만듭니다."""
+    rng = random.Random(seed)
+    return [
+        {
+            'frontendQuestionId': str(i + 1),
+            'title': f"Question {i}",
+            'titleSlug': f"question-{i}",
+            'difficulty': rng.choice(['Easy', 'Medium', 'Hard']),
+            'acRate': rng.uniform(10, 90),
+            'topicTags': [{'name': name, 'slug': name.lower()} for name in rng.sample(LEETCODE_TAGS, rng.randint(1, 4))]
+        }
+        for i in range(size)
+    ]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """func를 repeat번 실행한 최소 소요 시간(초)을 반환합니다."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name: str, size: int, timings: Dict[str, float]) -> None:
+    """측정 결과를 출력합니다."""
+    baseline = next(iter(timings.values()))
+    print(f"\n[{name}] {size:,}개")
+    for label, elapsed in timings.items():
+        print(f"  {label:<16} {elapsed * 1000:8.1f} ms  {size / elapsed:>12,.0f}개/초  x{baseline / elapsed:.2f}")
+
+
+class LegacyCodeforcesProvider(CodeforcesProvider):
+    """클래스 수준 조회표 도입 전의 매핑 (비교 기준선)"""
+
+    def _map_difficulty(self, rating: int) -> ProblemDifficulty:
+        if rating < 1200:
+            return ProblemDifficulty.EASY
+        elif rating < 1800:
+            return ProblemDifficulty.MEDIUM
+        elif rating < 2400:
+            return ProblemDifficulty.HARD
+        else:
+            return ProblemDifficulty.EXPERT
+
+    def _map_tag(self, cf_tag: str):
+        tag_mapping = {
+            'brute force': ProblemTag.BRUTE_FORCE,
+            'greedy': ProblemTag.GREEDY,
+            'dp': ProblemTag.DYNAMIC_PROGRAMMING,
+            'divide and conquer': ProblemTag.DIVIDE_AND_CONQUER,
+            'backtracking': ProblemTag.BACKTRACKING,
+            'arrays': ProblemTag.ARRAY,
+            'strings': ProblemTag.STRING,
+            'stacks': ProblemTag.STACK,
+            'queues': ProblemTag.QUEUE,
+            'trees': ProblemTag.TREE,
+            'graphs': ProblemTag.GRAPH,
+            'dfs and similar': ProblemTag.DFS,
+            'bfs': ProblemTag.BFS,
+            'shortest paths': ProblemTag.DIJKSTRA,
+            'math': ProblemTag.MATH,
+            'number theory': ProblemTag.NUMBER_THEORY,
+            'combinatorics': ProblemTag.COMBINATORICS,
+            'geometry': ProblemTag.GEOMETRY,
+            'binary search': ProblemTag.BINARY_SEARCH,
+            'sortings': ProblemTag.SORTING,
+            'bitmasks': ProblemTag.BIT_MANIPULATION,
+            'data structures': ProblemTag.HASH_TABLE,
+            'two pointers': ProblemTag.TWO_POINTERS,
+            'sliding window': ProblemTag.SLIDING_WINDOW
+        }
+        return tag_mapping.get(cf_tag.lower())
+
+
+class LegacyLeetCodeProvider(LeetCodeProvider):
+    """클래스 수준 조회표 도입 전의 매핑 (비교 기준선)"""
+
+    def _map_difficulty(self, lc_difficulty: str) -> ProblemDifficulty:
+        mapping = {
+            'Easy': ProblemDifficulty.EASY,
+            'Medium': ProblemDifficulty.MEDIUM,
+            'Hard': ProblemDifficulty.HARD
+        }
+        return mapping.get(lc_difficulty, ProblemDifficulty.MEDIUM)
+
+    def _map_tag(self, lc_tag: str):
+        tag_mapping = {
+            'Array': ProblemTag.ARRAY,
+            'String': ProblemTag.STRING,
+            'Linked List': ProblemTag.LINKED_LIST,
+            'Stack': ProblemTag.STACK,
+            'Queue': ProblemTag.QUEUE,
+            'Tree': ProblemTag.TREE,
+            'Graph': ProblemTag.GRAPH,
+            'Hash Table': ProblemTag.HASH_TABLE,
+            'Trie': ProblemTag.TRIE,
+            'Depth-First Search': ProblemTag.DFS,
+            'Breadth-First Search': ProblemTag.BFS,
+            'Dynamic Programming': ProblemTag.DYNAMIC_PROGRAMMING,
+            'Greedy': ProblemTag.GREEDY,
+            'Backtracking': ProblemTag.BACKTRACKING,
+            'Binary Search': ProblemTag.BINARY_SEARCH,
+            'Two Pointers': ProblemTag.TWO_POINTERS,
+            'Sliding Window': ProblemTag.SLIDING_WINDOW,
+            'Sorting': ProblemTag.SORTING,
+            'Bit Manipulation': ProblemTag.BIT_MANIPULATION,
+            'Math': ProblemTag.MATH,
+            'Geometry': ProblemTag.GEOMETRY,
+            'Combinatorics': ProblemTag.COMBINATORICS
+        }
+        return tag_mapping.get(lc_tag)
+
+
+def benchmark_conversion(size: int, repeat: int) -> None:
+    """호출마다 매핑 딕셔너리를 만드는 기존 변환과 클래스 수준 조회표를 쓰는 변환의 처리량을 비교합니다."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cases = [
+            ("Codeforces 변환", LegacyCodeforcesProvider(cache_dir), CodeforcesProvider(cache_dir),
+             make_codeforces_payload(size)),
+            ("LeetCode 변환", LegacyLeetCodeProvider(cache_dir), LeetCodeProvider(cache_dir),
+             make_leetcode_payload(size))
+        ]
+
+        for name, legacy_provider, provider, records in cases:
+            def legacy():
+                return [legacy_provider._convert_to_algorithm_problem(record) for record in records]
+
+            def current():
+                return [provider._convert_to_algorithm_problem(record) for record in records]
+
+            # 두 경로의 결과가 같은지 확인 (생성 시 정해지는 ID/메타데이터 시각 제외)
+            expected = [problem.to_dict() for problem in legacy()]
+            actual = [problem.to_dict() for problem in current()]
+            for problem_data in expected + actual:
+                del problem_data['id'], problem_data['metadata']
+                problem_data['tags'].sort()
+            assert expected == actual, f"{name}: 변환 결과가 다릅니다"
+
+            report(name, size, {
+                "호출마다 매핑표": measure(legacy, repeat),
+                "클래스 조회표": measure(current, repeat)
+            })
+
+
+def benchmark_deserialization(size: int, repeat: int) -> None:
+    """캐시된 카탈로그를 from_dict() 반복과 from_dicts() 일괄 변환으로 읽는 처리량을 비교합니다."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        provider = CodeforcesProvider(cache_dir)
+        problems = provider._convert_batch(make_codeforces_payload(size))
+
+        # 디스크 캐시와 같은 형식으로 저장했다가 읽은 딕셔너리 목록
+        cache_path = os.path.join(cache_dir, "catalog.json")
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'problems': [problem.to_dict() for problem in problems]}, f, ensure_ascii=False)
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            problems_data = json.load(f)['problems']
+
+    def per_item():
+        return [AlgorithmProblem.from_dict(problem_data) for problem_data in problems_data]
+
+    def bulk():
+        return AlgorithmProblem.from_dicts(problems_data)
+
+    expected = [problem.to_dict() for problem in per_item()]
+    actual = [problem.to_dict() for problem in bulk()]
+    for problem_data in expected + actual:
+        problem_data['tags'].sort()
+        problem_data['metadata']['tags'].sort()
+    assert expected == actual, "캐시 카탈로그 역직렬화 결과가 다릅니다"
+
+    report("캐시 카탈로그 역직렬화", size, {
+        "from_dict 반복": measure(per_item, repeat),
+        "from_dicts 일괄": measure(bulk, repeat)
+    })
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="알고리즘 시스템 마이크로 벤치마크")
+    parser.add_argument("--size", type=int, default=10000, help="합성 문제 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    benchmark_conversion(args.size, args.repeat)
+    benchmark_deserialization(args.size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
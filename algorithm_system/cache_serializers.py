@@ -0,0 +1,220 @@
+"""
+프로바이더 캐시 직렬화 모듈
+
+이 모듈은 원격 문제 제공자의 캐시 파일 형식을 교체할 수 있도록 직렬화기를 제공합니다.
+JSON(기존 형식), msgpack 바이너리 인코딩, gzip/zstd 압축을 지원하며
+기존 JSON 캐시를 새 형식으로 변환하는 마이그레이션 함수를 포함합니다.
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+# <platform>_<md5> 형식의 프로바이더 캐시 파일 이름 (확장자 제외)
+CACHE_FILE_STEM_PATTERN = re.compile(r"^[a-z]+_[0-9a-f]{32}$")
+
+
+class CacheSerializer(ABC):
+    """캐시 직렬화기 추상 클래스"""
+
+    name: str = ""
+    extension: str = ""
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """데이터를 바이트로 직렬화합니다."""
+        pass
+
+    @abstractmethod
+    def loads(self, payload: bytes) -> Any:
+        """바이트를 데이터로 역직렬화합니다."""
+        pass
+
+
+class JSONSerializer(CacheSerializer):
+    """JSON 직렬화기 (기존 캐시 형식과 호환)"""
+
+    name = "json"
+    extension = ".json"
+
+    def __init__(self, indent: Optional[int] = None):
+        self.indent = indent
+
+    def dumps(self, data: Any) -> bytes:
+        if self.indent is None:
+            text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=self.indent)
+        return text.encode('utf-8')
+
+    def loads(self, payload: bytes) -> Any:
+        return json.loads(payload.decode('utf-8'))
+
+
+class MsgpackSerializer(CacheSerializer):
+    """msgpack 바이너리 직렬화기 (msgpack 패키지 필요)"""
+
+    name = "msgpack"
+    extension = ".msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ValueError("msgpack 패키지가 설치되어 있지 않습니다")
+
+    def dumps(self, data: Any) -> bytes:
+        return msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, payload: bytes) -> Any:
+        return msgpack.unpackb(payload, raw=False)
+
+
+class CompressedSerializer(CacheSerializer):
+    """다른 직렬화기의 출력을 gzip 또는 zstd로 압축하는 래퍼"""
+
+    CODEC_EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+    def __init__(self, inner: CacheSerializer, codec: str = "gzip", level: Optional[int] = None):
+        if codec not in self.CODEC_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식: {codec}")
+        if codec == 'zstd' and zstandard is None:
+            raise ValueError("zstandard 패키지가 설치되어 있지 않습니다")
+
+        self.inner = inner
+        self.codec = codec
+        self.level = level
+        self.name = f"{inner.name}+{codec}"
+        self.extension = inner.extension + self.CODEC_EXTENSIONS[codec]
+
+    def dumps(self, data: Any) -> bytes:
+        payload = self.inner.dumps(data)
+        if self.codec == 'gzip':
+            return gzip.compress(payload, compresslevel=self.level if self.level is not None else 6)
+        return zstandard.ZstdCompressor(level=self.level if self.level is not None else 3).compress(payload)
+
+    def loads(self, payload: bytes) -> Any:
+        if self.codec == 'gzip':
+            return self.inner.loads(gzip.decompress(payload))
+        return self.inner.loads(zstandard.ZstdDecompressor().decompress(payload))
+
+
+SERIALIZERS = {
+    'json': JSONSerializer,
+    'msgpack': MsgpackSerializer
+}
+
+
+def get_known_extensions() -> List[str]:
+    """지원하는 모든 형식/압축 조합의 캐시 파일 확장자를 반환합니다."""
+    extensions = []
+    for serializer_class in SERIALIZERS.values():
+        extensions.append(serializer_class.extension)
+        extensions.extend(serializer_class.extension + codec_extension
+                          for codec_extension in CompressedSerializer.CODEC_EXTENSIONS.values())
+    return extensions
+
+
+def get_serializer(format_name: str = "json", compression: Optional[str] = None) -> CacheSerializer:
+    """형식 이름과 압축 방식으로 직렬화기를 생성합니다."""
+    serializer_class = SERIALIZERS.get(format_name)
+    if serializer_class is None:
+        raise ValueError(f"지원하지 않는 캐시 형식: {format_name}")
+
+    serializer = serializer_class()
+    if compression:
+        serializer = CompressedSerializer(serializer, compression)
+    return serializer
+
+
+def get_available_formats() -> Dict[str, bool]:
+    """선택적 의존성 설치 여부에 따른 형식/압축 사용 가능 여부를 반환합니다."""
+    return {
+        'json': True,
+        'msgpack': msgpack is not None,
+        'gzip': True,
+        'zstd': zstandard is not None
+    }
+
+
+def serializer_for_path(path: str) -> CacheSerializer:
+    """파일 확장자로부터 직렬화기를 결정합니다."""
+    compression = None
+    base = path
+    for codec, extension in CompressedSerializer.CODEC_EXTENSIONS.items():
+        if base.endswith(extension):
+            compression = codec
+            base = base[:-len(extension)]
+            break
+
+    for format_name, serializer_class in SERIALIZERS.items():
+        if base.endswith(serializer_class.extension):
+            return get_serializer(format_name, compression)
+
+    raise ValueError(f"캐시 형식을 알 수 없습니다: {path}")
+
+
+def read_cache_file(path: str) -> Any:
+    """확장자에 맞는 직렬화기로 캐시 파일을 읽습니다."""
+    with open(path, 'rb') as f:
+        return serializer_for_path(path).loads(f.read())
+
+
+def write_cache_file(path: str, data: Any, serializer: CacheSerializer) -> None:
+    """캐시 파일을 임시 파일에 쓴 뒤 교체하여 원자적으로 저장합니다."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(serializer.dumps(data))
+    os.replace(temp_path, path)
+
+
+def migrate_cache_dir(cache_dir: str, serializer: CacheSerializer,
+                      recursive: bool = True) -> List[str]:
+    """디렉토리의 프로바이더 캐시 파일을 지정한 형식으로 제자리 변환합니다.
+
+    파일 수정 시각은 그대로 유지하여 캐시 만료 판단에 영향을 주지 않습니다.
+    변환된 파일 경로 목록을 반환합니다.
+    """
+    migrated = []
+    known_extensions = get_known_extensions()
+
+    for root, _, files in os.walk(cache_dir):
+        for file_name in files:
+            stem, _, extension = file_name.partition('.')
+            extension = '.' + extension
+            if (not CACHE_FILE_STEM_PATTERN.match(stem) or extension not in known_extensions
+                    or extension == serializer.extension):
+                continue
+
+            source_path = os.path.join(root, file_name)
+            target_path = os.path.join(root, stem + serializer.extension)
+
+            try:
+                data = read_cache_file(source_path)
+                mtime = os.path.getmtime(source_path)
+                write_cache_file(target_path, data, serializer)
+                os.utime(target_path, (mtime, mtime))
+                os.remove(source_path)
+                migrated.append(target_path)
+            except Exception as e:
+                logger.warning(f"캐시 변환 실패 ({source_path}): {e}")
+
+        if not recursive:
+            break
+
+    return migrated
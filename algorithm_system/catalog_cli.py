@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+문제 카탈로그 / 캐시 관리 CLI
+
+프로바이더 캐시와 로컬 문제 카탈로그를 관리하는 명령어를 제공합니다.
+
+사용 예:
+    python -m algorithm_system.catalog_cli migrate-cache --cache-dir cache --format json --compression gzip
+    python -m algorithm_system.catalog_cli gc --cache-dir cache --dry-run
+    python -m algorithm_system.catalog_cli export catalog_snapshot.json.gz --cache-dir cache --sync
+    python -m algorithm_system.catalog_cli import catalog_snapshot.json.gz --cache-dir cache
+    python -m algorithm_system.catalog_cli hydrate codeforces --cache-dir cache --limit 100
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# 스크립트로 직접 실행할 때도 패키지 임포트가 가능하도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithm_system.cache_serializers import (
+    get_serializer, get_available_formats, migrate_cache_dir
+)
+from algorithm_system.content_store import collect_garbage, find_store_dirs
+from algorithm_system.catalog_snapshot import export_snapshot, import_snapshot
+from algorithm_system.problem_catalog import ProblemCatalog
+from algorithm_system.problem_data_structures import ProblemPlatform
+
+
+def command_migrate_cache(args) -> int:
+    """기존 캐시 파일들을 지정한 형식으로 변환합니다."""
+    try:
+        serializer = get_serializer(args.format, args.compression)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if not os.path.isdir(args.cache_dir):
+        print(f"❌ 캐시 디렉토리가 없습니다: {args.cache_dir}")
+        return 1
+
+    migrated = migrate_cache_dir(args.cache_dir, serializer, recursive=not args.no_recursive)
+    print(f"✅ 캐시 {len(migrated)}개를 {serializer.name} 형식으로 변환했습니다")
+    return 0
+
+
+def command_gc(args) -> int:
+    """어떤 캐시 항목도 참조하지 않는 문제 객체를 정리합니다."""
+    if not os.path.isdir(args.cache_dir):
+        print(f"❌ 캐시 디렉토리가 없습니다: {args.cache_dir}")
+        return 1
+
+    removed = []
+    for store_dir in find_store_dirs(args.cache_dir):
+        removed.extend(collect_garbage(store_dir, args.min_age, dry_run=args.dry_run))
+
+    action = "삭제 대상" if args.dry_run else "삭제"
+    print(f"✅ 참조되지 않는 객체 {len(removed)}개 {action}")
+    return 0
+
+
+def _parse_platforms(names):
+    return [ProblemPlatform.from_string(name) for name in names] if names else None
+
+
+def command_export(args) -> int:
+    """동기화된 카탈로그를 스냅샷 파일로 내보냅니다."""
+    platforms = _parse_platforms(args.platform)
+
+    if args.sync:
+        from algorithm_system.remote_problem_provider import RemoteProblemManager
+        manager = RemoteProblemManager(cache_dir=args.cache_dir)
+        for platform in platforms or manager.get_supported_platforms():
+            if not manager.sync_catalog(platform):
+                print(f"⚠️ {platform} 동기화 실패, 기존 카탈로그를 사용합니다")
+        manager.catalog.close()
+
+    catalog_path = os.path.join(args.cache_dir, "catalog.sqlite3")
+    if not os.path.exists(catalog_path):
+        print(f"❌ 카탈로그가 없습니다: {catalog_path}")
+        return 1
+
+    catalog = ProblemCatalog(catalog_path)
+    try:
+        counts = export_snapshot(catalog, args.output, platforms)
+    finally:
+        catalog.close()
+
+    if not any(counts.values()):
+        print("❌ 내보낼 문제가 없습니다")
+        return 1
+
+    summary = ", ".join(f"{name} {count}개" for name, count in counts.items())
+    print(f"✅ 스냅샷 내보내기 완료: {args.output} ({summary})")
+    return 0
+
+
+def command_import(args) -> int:
+    """스냅샷 파일을 카탈로그로 가져옵니다."""
+    if not os.path.exists(args.snapshot):
+        print(f"❌ 스냅샷 파일이 없습니다: {args.snapshot}")
+        return 1
+
+    os.makedirs(args.cache_dir, exist_ok=True)
+    catalog = ProblemCatalog(os.path.join(args.cache_dir, "catalog.sqlite3"))
+    try:
+        counts = import_snapshot(catalog, args.snapshot)
+    except (OSError, ValueError) as e:
+        print(f"❌ 스냅샷 가져오기 실패: {e}")
+        return 1
+    finally:
+        catalog.close()
+
+    summary = ", ".join(f"{name} {count}개" for name, count in counts.items())
+    print(f"✅ 스냅샷 가져오기 완료 ({summary})")
+    return 0
+
+
+def command_hydrate(args) -> int:
+    """문제 본문을 일괄로 가져와 프로바이더 캐시와 카탈로그에 반영합니다."""
+    from algorithm_system.problem_hydration import ProblemHydrator
+    from algorithm_system.remote_problem_provider import RemoteProblemManager
+
+    platform = ProblemPlatform.from_string(args.platform)
+    manager = RemoteProblemManager(cache_dir=args.cache_dir)
+    try:
+        provider = manager.get_provider(platform)
+        if provider is None:
+            print(f"❌ 지원하지 않는 플랫폼: {args.platform}")
+            return 1
+
+        problems = manager.get_all_problems(platform)
+        if not problems:
+            print(f"❌ {platform} 문제 목록을 가져오지 못했습니다")
+            return 1
+
+        checkpoint_path = args.checkpoint or os.path.join(
+            args.cache_dir, f"hydration_{platform.name.lower()}.json"
+        )
+        hydrator = ProblemHydrator(provider, checkpoint_path=checkpoint_path, max_workers=args.workers)
+        targets = problems[:args.limit] if args.limit else problems
+        stats = hydrator.hydrate(targets, resume=not args.no_resume)
+
+        # 본문이 적용된 전체 목록으로 카탈로그를 갱신해야 추천/제출 경로에서도 본문을 볼 수 있음
+        manager.catalog.replace_platform(platform, problems)
+    finally:
+        manager.catalog.close()
+
+    print(f"✅ 본문 하이드레이션 완료: 성공 {stats['hydrated']}개, "
+          f"건너뜀 {stats['skipped']}개, 실패 {stats['failed']}개")
+    return 0 if not stats['failed'] else 2
+
+
+def command_formats(args) -> int:
+    """사용 가능한 캐시 형식을 표시합니다."""
+    for name, available in get_available_formats().items():
+        print(f"{name}: {'사용 가능' if available else '패키지 미설치'}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령행 파서를 구성합니다."""
+    parser = argparse.ArgumentParser(description="FocusTimer 문제 카탈로그 관리 CLI")
+    subparsers = parser.add_subparsers(dest='command', help='사용 가능한 명령어')
+
+    # migrate-cache 명령어
+    migrate_parser = subparsers.add_parser('migrate-cache', help='캐시 파일 형식 변환')
+    migrate_parser.add_argument('--cache-dir', default='cache', help='캐시 디렉토리')
+    migrate_parser.add_argument('--format', default='json', choices=['json', 'msgpack'], help='대상 직렬화 형식')
+    migrate_parser.add_argument('--compression', choices=['gzip', 'zstd'], help='압축 방식')
+    migrate_parser.add_argument('--no-recursive', action='store_true', help='하위 디렉토리는 변환하지 않음')
+    migrate_parser.set_defaults(handler=command_migrate_cache)
+
+    # gc 명령어
+    gc_parser = subparsers.add_parser('gc', help='참조되지 않는 문제 객체 정리')
+    gc_parser.add_argument('--cache-dir', default='cache', help='캐시 디렉토리 (하위 디렉토리 포함)')
+    gc_parser.add_argument('--min-age', type=float, default=3600.0,
+                           help='이 시간(초)보다 최근에 만들어진 객체는 유지')
+    gc_parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상만 표시')
+    gc_parser.set_defaults(handler=command_gc)
+
+    # export 명령어
+    export_parser = subparsers.add_parser('export', help='카탈로그를 오프라인 스냅샷으로 내보내기')
+    export_parser.add_argument('output', help='스냅샷 파일 경로 (.json.gz)')
+    export_parser.add_argument('--cache-dir', default='cache', help='캐시 디렉토리')
+    export_parser.add_argument('--platform', action='append', help='내보낼 플랫폼 (여러 번 지정 가능)')
+    export_parser.add_argument('--sync', action='store_true', help='내보내기 전에 카탈로그 동기화')
+    export_parser.set_defaults(handler=command_export)
+
+    # import 명령어
+    import_parser = subparsers.add_parser('import', help='오프라인 스냅샷을 카탈로그로 가져오기')
+    import_parser.add_argument('snapshot', help='스냅샷 파일 경로')
+    import_parser.add_argument('--cache-dir', default='cache', help='캐시 디렉토리')
+    import_parser.set_defaults(handler=command_import)
+
+    # hydrate 명령어
+    hydrate_parser = subparsers.add_parser('hydrate', help='문제 본문 일괄 하이드레이션')
+    hydrate_parser.add_argument('platform', help='플랫폼 (codeforces, leetcode)')
+    hydrate_parser.add_argument('--cache-dir', default='cache', help='캐시 디렉토리')
+    hydrate_parser.add_argument('--limit', type=int, help='처리할 최대 문제 수')
+    hydrate_parser.add_argument('--workers', type=int, default=4, help='동시 요청 수')
+    hydrate_parser.add_argument('--checkpoint', help='체크포인트 파일 경로 (기본값: 캐시 디렉토리 안)')
+    hydrate_parser.add_argument('--no-resume', action='store_true', help='체크포인트와 저장된 본문을 무시하고 다시 처리')
+    hydrate_parser.set_defaults(handler=command_hydrate)
+
+    # formats 명령어
+    formats_parser = subparsers.add_parser('formats', help='사용 가능한 캐시 형식 표시')
+    formats_parser.set_defaults(handler=command_formats)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not getattr(args, 'handler', None):
+        parser.print_help()
+        return 1
+
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
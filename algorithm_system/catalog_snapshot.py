@@ -0,0 +1,157 @@
+"""
+오프라인 카탈로그 스냅샷
+
+이 모듈은 동기화된 문제 카탈로그 전체를 하나의 압축된 버전 관리 스냅샷 파일로 내보내고,
+네트워크가 없는 환경에서 그 파일을 가져와 바로 조회할 수 있게 하는 기능을 제공합니다.
+
+스냅샷 형식 (gzip 압축 JSON):
+    {
+        "format": "focus-timer-catalog-snapshot",
+        "version": 1,
+        "created_at": "...",
+        "platforms": {
+            "CODEFORCES": {"synced_at": 1700000000.0, "problem_count": 2, "problems": [...]}
+        }
+    }
+"""
+
+import gzip
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    from .problem_catalog import ProblemCatalog
+    from .problem_data_structures import AlgorithmProblem, ProblemPlatform
+except ImportError:
+    from problem_catalog import ProblemCatalog
+    from problem_data_structures import AlgorithmProblem, ProblemPlatform
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = "focus-timer-catalog-snapshot"
+SNAPSHOT_VERSION = 1
+
+
+def export_snapshot(catalog: ProblemCatalog, path: str,
+                    platforms: Optional[List[ProblemPlatform]] = None) -> Dict[str, int]:
+    """카탈로그를 스냅샷 파일로 내보내고 플랫폼별 문제 수를 반환합니다."""
+    statistics = catalog.get_statistics()
+    platforms = platforms or catalog.get_platforms()
+
+    snapshot = {
+        'format': SNAPSHOT_FORMAT,
+        'version': SNAPSHOT_VERSION,
+        'created_at': datetime.now().isoformat(),
+        'platforms': {}
+    }
+
+    counts = {}
+    for platform in platforms:
+        problems_data = list(catalog.iter_problem_data(platform))
+        synced_at = statistics.get(platform.name, {}).get('synced_at')
+        snapshot['platforms'][platform.name] = {
+            'synced_at': synced_at,
+            'problem_count': len(problems_data),
+            'problems': problems_data
+        }
+        counts[platform.name] = len(problems_data)
+
+    temp_path = f"{path}.tmp"
+    with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+    logger.info(f"카탈로그 스냅샷 내보내기 완료: {path} ({sum(counts.values())}개)")
+    return counts
+
+
+def load_snapshot(path: str) -> Dict[str, Any]:
+    """스냅샷 파일을 읽고 형식과 버전을 검증합니다."""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        snapshot = json.load(f)
+
+    if not isinstance(snapshot, dict) or snapshot.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError(f"카탈로그 스냅샷 파일이 아닙니다: {path}")
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 버전: {snapshot.get('version')}")
+
+    return snapshot
+
+
+def import_snapshot(catalog: ProblemCatalog, path: str) -> Dict[str, int]:
+    """스냅샷을 카탈로그에 일괄 적재하고 플랫폼별 문제 수를 반환합니다.
+
+    스냅샷에 포함된 플랫폼의 기존 데이터는 교체되며, 동기화 시각은 스냅샷 값이 유지됩니다.
+    """
+    snapshot = load_snapshot(path)
+
+    counts = {}
+    for platform_name, platform_data in snapshot.get('platforms', {}).items():
+        platform = ProblemPlatform.from_string(platform_name)
+        counts[platform.name] = catalog.bulk_load(
+            platform, platform_data.get('problems', []), platform_data.get('synced_at')
+        )
+
+    logger.info(f"카탈로그 스냅샷 가져오기 완료: {path} ({sum(counts.values())}개)")
+    return counts
+
+
+class LocalSnapshotProvider:
+    """가져온 스냅샷 카탈로그로 문제를 제공하는 오프라인 문제 제공자
+
+    GUI와 챌린지 시스템이 사용하는 get_all_problems / get_problem_by_id와
+    원격 프로바이더의 get_problems / get_problem_details를 모두 지원합니다.
+    """
+
+    def __init__(self, catalog_path: str = os.path.join("cache", "catalog.sqlite3"),
+                 snapshot_path: Optional[str] = None,
+                 platforms: Optional[List[ProblemPlatform]] = None):
+        directory = os.path.dirname(catalog_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.catalog = ProblemCatalog(catalog_path)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        if snapshot_path:
+            import_snapshot(self.catalog, snapshot_path)
+
+        self.platforms = platforms or self.catalog.get_platforms()
+        self._all_problems: Optional[List[AlgorithmProblem]] = None
+
+    def get_all_problems(self) -> List[AlgorithmProblem]:
+        """모든 플랫폼의 문제를 반환합니다."""
+        if self._all_problems is None:
+            problems = []
+            for platform in self.platforms:
+                problems.extend(self.catalog.get_problems(platform))
+            self._all_problems = problems
+        return self._all_problems
+
+    def get_problem_by_id(self, problem_id: str) -> AlgorithmProblem:
+        """ID로 문제를 조회합니다."""
+        problem = self.catalog.get_by_id(problem_id)
+        if problem is None:
+            raise ValueError(f"문제를 찾을 수 없습니다: {problem_id}")
+        return problem
+
+    def get_problems(self, limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """문제 목록을 반환합니다."""
+        problems = self.get_all_problems()
+        return problems[:limit] if limit else problems
+
+    def get_problem_details(self, problem_id: str) -> Optional[AlgorithmProblem]:
+        """플랫폼 문제 ID로 문제를 조회합니다."""
+        for platform in self.platforms:
+            problem = self.catalog.get_by_platform_problem_id(platform, problem_id)
+            if problem is not None:
+                return problem
+        return None
+
+    def close(self) -> None:
+        """카탈로그 연결을 닫습니다."""
+        self.catalog.close()
@@ -0,0 +1,296 @@
+"""
+문제 카탈로그 열 지향 내보내기
+
+이 모듈은 ProblemCollection이나 프로바이더 카탈로그(ProblemCatalog)의 문제들을 열 지향 형식으로 내보내고,
+다시 읽어 난이도 분포, 태그 동시 출현, 플랫폼별 비율 같은 집계를 벡터 연산으로 계산하는 기능을 제공합니다.
+
+지원 형식 (format 인자):
+    feather  Arrow IPC 파일, 비압축 (pyarrow 필요) - 메모리 맵으로 복사 없이 읽음
+    parquet  Parquet 파일 (pyarrow 필요) - 압축되므로 읽을 때 디코딩 필요
+    numpy    NumPy 구조화 배열 .npy 파일 (numpy 필요) - mmap_mode='r'로 복사 없이 읽음
+    auto     pyarrow가 있으면 feather, 없으면 numpy
+
+열 구성: id, platform_problem_id, title (문자열), platform, difficulty (열거형 value),
+tag_mask (ProblemTag 비트마스크, TAG_BITS 기준), time_limit (없으면 NaN), memory_limit (없으면 -1),
+solved_count, submission_count, success_rate, is_active
+"""
+
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+try:
+    from .problem_catalog import ProblemCatalog
+    from .problem_data_structures import (
+        AlgorithmProblem, ProblemCollection, ProblemDifficulty, ProblemPlatform, ProblemTag,
+        TAG_BITS, tags_to_mask
+    )
+except ImportError:
+    from problem_catalog import ProblemCatalog
+    from problem_data_structures import (
+        AlgorithmProblem, ProblemCollection, ProblemDifficulty, ProblemPlatform, ProblemTag,
+        TAG_BITS, tags_to_mask
+    )
+
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_FORMAT = "focus-timer-columnar-catalog"
+COLUMNAR_VERSION = 1
+SUPPORTED_FORMATS = ('auto', 'feather', 'parquet', 'numpy')
+
+STRING_COLUMNS = ('id', 'platform_problem_id', 'title')
+
+# 숫자 열 이름 -> NumPy dtype
+NUMERIC_COLUMNS: Dict[str, str] = {
+    'platform': 'u1',
+    'difficulty': 'u1',
+    'tag_mask': 'u8',
+    'time_limit': 'f8',
+    'memory_limit': 'i4',
+    'solved_count': 'i8',
+    'submission_count': 'i8',
+    'success_rate': 'f8',
+    'is_active': '?'
+}
+
+# 파일 앞부분으로 형식 판별
+_MAGIC_BYTES = ((b'ARROW1', 'feather'), (b'PAR1', 'parquet'), (b'\x93NUMPY', 'numpy'))
+
+
+def problems_to_columns(problems: Iterable[AlgorithmProblem]) -> Dict[str, List[Any]]:
+    """문제 목록을 열 이름 -> 값 목록 딕셔너리로 변환합니다."""
+    columns: Dict[str, List[Any]] = {name: [] for name in STRING_COLUMNS + tuple(NUMERIC_COLUMNS)}
+    nan = float('nan')
+
+    for problem in problems:
+        metadata = problem.metadata
+        tag_mask = getattr(problem, 'tag_mask', None)
+        columns['id'].append(problem.id)
+        columns['platform_problem_id'].append(problem.platform_problem_id or '')
+        columns['title'].append(problem.title)
+        columns['platform'].append(problem.platform.value)
+        columns['difficulty'].append(problem.difficulty.value)
+        columns['tag_mask'].append(tag_mask if tag_mask is not None else tags_to_mask(problem.tags))
+        columns['time_limit'].append(nan if problem.time_limit is None else problem.time_limit)
+        columns['memory_limit'].append(-1 if problem.memory_limit is None else problem.memory_limit)
+        columns['solved_count'].append(metadata.solved_count)
+        columns['submission_count'].append(metadata.submission_count)
+        columns['success_rate'].append(metadata.success_rate)
+        columns['is_active'].append(bool(problem.is_active))
+
+    return columns
+
+
+def _resolve_format(format_name: str) -> str:
+    if format_name not in SUPPORTED_FORMATS:
+        raise ValueError(f"지원하지 않는 열 지향 형식: {format_name}")
+    if format_name == 'auto':
+        format_name = 'feather' if pyarrow is not None else 'numpy'
+    if format_name in ('feather', 'parquet') and pyarrow is None:
+        raise ValueError("pyarrow 패키지가 설치되어 있지 않습니다")
+    if format_name == 'numpy' and numpy is None:
+        raise ValueError("numpy 패키지가 설치되어 있지 않습니다")
+    return format_name
+
+
+def _write_arrow(columns: Dict[str, List[Any]], path: str, format_name: str) -> None:
+    arrays = {name: pyarrow.array(columns[name], type=pyarrow.string()) for name in STRING_COLUMNS}
+    arrays.update({
+        name: pyarrow.array(columns[name], type=pyarrow.from_numpy_dtype(numpy.dtype(dtype)))
+        if numpy is not None else pyarrow.array(columns[name])
+        for name, dtype in NUMERIC_COLUMNS.items()
+    })
+    table = pyarrow.table(arrays).replace_schema_metadata({
+        'format': COLUMNAR_FORMAT,
+        'version': str(COLUMNAR_VERSION)
+    })
+
+    if format_name == 'feather':
+        # 메모리 맵으로 복사 없이 읽을 수 있도록 압축하지 않음
+        pyarrow.feather.write_feather(table, path, compression='uncompressed')
+    else:
+        pyarrow.parquet.write_table(table, path)
+
+
+def _write_numpy(columns: Dict[str, List[Any]], path: str) -> None:
+    dtype = [
+        (name, f"U{max([1] + [len(value) for value in columns[name]])}") for name in STRING_COLUMNS
+    ] + list(NUMERIC_COLUMNS.items())
+
+    array = numpy.zeros(len(columns['id']), dtype=dtype)
+    for name in columns:
+        array[name] = columns[name]
+
+    # 파일 객체로 저장해야 np.save가 확장자를 덧붙이지 않음
+    with open(path, 'wb') as f:
+        numpy.save(f, array, allow_pickle=False)
+
+
+def export_columnar(problems: Iterable[AlgorithmProblem], path: str, format: str = "auto") -> str:
+    """문제 목록을 열 지향 파일로 내보내고 사용한 형식 이름을 반환합니다."""
+    format_name = _resolve_format(format)
+    columns = problems_to_columns(problems)
+
+    temp_path = f"{path}.tmp"
+    if format_name == 'numpy':
+        _write_numpy(columns, temp_path)
+    else:
+        _write_arrow(columns, temp_path, format_name)
+    os.replace(temp_path, path)
+
+    logger.info(f"열 지향 내보내기 완료: {path} ({format_name}, {len(columns['id'])}개)")
+    return format_name
+
+
+def export_collection(collection: ProblemCollection, path: str, format: str = "auto") -> str:
+    """ProblemCollection의 문제들을 열 지향 파일로 내보냅니다."""
+    return export_columnar(collection.problems.values(), path, format)
+
+
+def export_catalog(catalog: ProblemCatalog, path: str,
+                   platforms: Optional[List[ProblemPlatform]] = None, format: str = "auto") -> str:
+    """동기화된 프로바이더 카탈로그를 열 지향 파일로 내보냅니다."""
+    problems = []
+    for platform in platforms or catalog.get_platforms():
+        problems.extend(AlgorithmProblem.from_dicts(catalog.iter_problem_data(platform)))
+    return export_columnar(problems, path, format)
+
+
+def detect_format(path: str) -> str:
+    """파일 앞부분의 매직 바이트로 열 지향 형식을 판별합니다."""
+    with open(path, 'rb') as f:
+        head = f.read(8)
+    for magic, format_name in _MAGIC_BYTES:
+        if head.startswith(magic):
+            return format_name
+    raise ValueError(f"열 지향 카탈로그 파일이 아닙니다: {path}")
+
+
+def load_columnar(path: str) -> 'ProblemColumns':
+    """열 지향 파일을 읽습니다. feather/numpy 파일은 메모리 맵으로 열어 복사하지 않습니다."""
+    format_name = _resolve_format(detect_format(path))
+
+    if format_name == 'numpy':
+        try:
+            array = numpy.load(path, mmap_mode='r', allow_pickle=False)
+        except ValueError:
+            # 문제가 0개인 배열은 메모리 맵을 만들 수 없음
+            array = numpy.load(path, allow_pickle=False)
+        return ProblemColumns(array, format_name)
+
+    if format_name == 'feather':
+        table = pyarrow.feather.read_table(path, memory_map=True)
+    else:
+        table = pyarrow.parquet.read_table(path, memory_map=True)
+
+    metadata = table.schema.metadata or {}
+    if metadata.get(b'format') != COLUMNAR_FORMAT.encode():
+        raise ValueError(f"열 지향 카탈로그 파일이 아닙니다: {path}")
+    if metadata.get(b'version') != str(COLUMNAR_VERSION).encode():
+        raise ValueError(f"지원하지 않는 열 지향 카탈로그 버전: {metadata.get(b'version')}")
+    return ProblemColumns(table, format_name)
+
+
+class ProblemColumns:
+    """열 지향으로 읽은 문제 카탈로그와 벡터화된 집계
+
+    data는 pyarrow.Table 또는 NumPy 구조화 배열입니다. 집계에는 numpy가 필요합니다.
+    """
+
+    def __init__(self, data: Any, format_name: str):
+        self.data = data
+        self.format = format_name
+        self._columns: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return self.data.num_rows if self.format != 'numpy' else len(self.data)
+
+    def column(self, name: str) -> Any:
+        """열을 NumPy 배열로 반환합니다.
+
+        numpy 형식은 메모리 맵 배열의 필드 뷰를, Arrow 형식은 하나의 청크로 된 숫자 열이면
+        Arrow 버퍼를 공유하는 배열을 반환합니다 (문자열 열은 변환 시 복사됨).
+        """
+        if numpy is None:
+            raise ValueError("numpy 패키지가 설치되어 있지 않습니다")
+
+        array = self._columns.get(name)
+        if array is None:
+            if self.format == 'numpy':
+                array = self.data[name]
+            else:
+                chunked = self.data.column(name)
+                zero_copy = chunked.num_chunks == 1 and name in NUMERIC_COLUMNS and name != 'is_active'
+                array = chunked.chunk(0).to_numpy(zero_copy_only=True) if zero_copy else chunked.to_numpy()
+            self._columns[name] = array
+        return array
+
+    def _platform_mask(self, platform: Optional[ProblemPlatform]) -> Any:
+        return None if platform is None else self.column('platform') == platform.value
+
+    def difficulty_histogram(self, platform: Optional[ProblemPlatform] = None) -> Dict[str, int]:
+        """난이도별 문제 수 (platform을 주면 해당 플랫폼만)"""
+        codes = self.column('difficulty')
+        mask = self._platform_mask(platform)
+        if mask is not None:
+            codes = codes[mask]
+        counts = numpy.bincount(codes, minlength=max(d.value for d in ProblemDifficulty) + 1)
+        return {difficulty.name: int(counts[difficulty.value]) for difficulty in ProblemDifficulty}
+
+    def tag_matrix(self, platform: Optional[ProblemPlatform] = None) -> Any:
+        """문제 × 태그 0/1 행렬 (열 순서는 ProblemTag 정의 순서)"""
+        tag_masks = self.column('tag_mask')
+        mask = self._platform_mask(platform)
+        if mask is not None:
+            tag_masks = tag_masks[mask]
+        shifts = numpy.arange(len(TAG_BITS), dtype=numpy.uint64)
+        return ((tag_masks[:, None] >> shifts) & numpy.uint64(1)).astype(numpy.int32)
+
+    def tag_counts(self, platform: Optional[ProblemPlatform] = None) -> Dict[str, int]:
+        """태그별 문제 수"""
+        counts = self.tag_matrix(platform).sum(axis=0)
+        return {tag.name: int(count) for tag, count in zip(ProblemTag, counts) if count}
+
+    def tag_cooccurrence(self, platform: Optional[ProblemPlatform] = None) -> Tuple[List[ProblemTag], Any]:
+        """태그 동시 출현 행렬을 반환합니다. matrix[i][j]는 tags[i]와 tags[j]를 모두 가진 문제 수입니다."""
+        matrix = self.tag_matrix(platform)
+        return list(ProblemTag), matrix.T @ matrix
+
+    def platform_summary(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """플랫폼별 문제 수, 활성 비율, 평균 성공률, 풀이/제출 수와 풀이 비율"""
+        codes = self.column('platform')
+        size = max(p.value for p in ProblemPlatform) + 1
+        counts = numpy.bincount(codes, minlength=size)
+        active = numpy.bincount(codes, weights=self.column('is_active'), minlength=size)
+        success = numpy.bincount(codes, weights=self.column('success_rate'), minlength=size)
+        solved = numpy.bincount(codes, weights=self.column('solved_count'), minlength=size)
+        submissions = numpy.bincount(codes, weights=self.column('submission_count'), minlength=size)
+
+        summary = {}
+        for platform in ProblemPlatform:
+            count = int(counts[platform.value])
+            if not count:
+                continue
+            value = platform.value
+            summary[platform.name] = {
+                'count': count,
+                'active_rate': float(active[value] / count),
+                'mean_success_rate': float(success[value] / count),
+                'solved_count': int(solved[value]),
+                'submission_count': int(submissions[value]),
+                'solve_rate': float(solved[value] / submissions[value]) if submissions[value] else 0.0
+            }
+        return summary
@@ -0,0 +1,243 @@
+"""
+콘텐츠 주소 기반 문제 저장소
+
+이 모듈은 프로바이더 캐시의 문제 본문을 내용 해시(SHA-256)로 한 번만 저장하는 저장소를 제공합니다.
+문제 목록 캐시(problems_list_*, 카탈로그, 페이지 캐시 등)는 문제 딕셔너리 대신 해시 참조만 저장하므로
+같은 문제가 여러 캐시 항목에 중복 저장되지 않고, 새로고침 시 바뀌지 않은 문제는 다시 쓰지 않습니다.
+
+저장 구조:
+    <cache_dir>/objects/<해시 앞 2자리>/<해시><확장자>
+
+어떤 캐시 항목도 참조하지 않는 객체는 collect_garbage()로 정리합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+try:
+    from .cache_serializers import (
+        CACHE_FILE_STEM_PATTERN, CacheSerializer, JSONSerializer,
+        get_known_extensions, read_cache_file, write_cache_file
+    )
+except ImportError:
+    from cache_serializers import (
+        CACHE_FILE_STEM_PATTERN, CacheSerializer, JSONSerializer,
+        get_known_extensions, read_cache_file, write_cache_file
+    )
+
+
+logger = logging.getLogger(__name__)
+
+OBJECTS_DIR_NAME = "objects"
+
+# 캐시 항목에서 문제 목록 대신 저장하는 참조 키
+PROBLEM_REFS_KEY = "problem_refs"
+
+
+# 변환할 때마다 새로 만들어지는 메타데이터 시각은 문제 내용 해시에서 제외
+VOLATILE_METADATA_FIELDS = ('created_at', 'updated_at')
+
+
+def compute_digest(data: Any) -> str:
+    """데이터의 정규화된 JSON 표현으로 SHA-256 해시를 계산합니다."""
+    canonical = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def compute_problem_digest(problem_data: Dict[str, Any]) -> str:
+    """문제 딕셔너리의 내용 해시를 계산합니다.
+
+    변환할 때마다 새로 만들어지는 메타데이터 시각은 제외하므로, 새로고침으로 다시 변환한 같은 문제는
+    같은 해시를 가집니다 (저장된 객체의 시각은 처음 저장한 값으로 유지). id는 해시에 포함되므로
+    프로바이더는 같은 문제에 같은 id를 부여해야 객체를 다시 쓰지 않습니다.
+    """
+    if not isinstance(problem_data, dict):
+        return compute_digest(problem_data)
+
+    stable = dict(problem_data)
+    metadata = stable.get('metadata')
+    if isinstance(metadata, dict):
+        stable['metadata'] = {
+            key: value for key, value in metadata.items() if key not in VOLATILE_METADATA_FIELDS
+        }
+    return compute_digest(stable)
+
+
+class ContentStore:
+    """해시로 주소가 지정되는 불변 객체 저장소"""
+
+    def __init__(self, cache_dir: str, serializer: Optional[CacheSerializer] = None):
+        self.root = os.path.join(cache_dir, OBJECTS_DIR_NAME)
+        self.serializer = serializer or JSONSerializer()
+
+    def _get_object_stem(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def find(self, digest: str) -> Optional[str]:
+        """객체 파일 경로를 반환합니다. 형식과 관계없이 찾고, 없으면 None."""
+        object_stem = self._get_object_stem(digest)
+        preferred_path = object_stem + self.serializer.extension
+        if os.path.exists(preferred_path):
+            return preferred_path
+
+        for extension in get_known_extensions():
+            if os.path.exists(object_stem + extension):
+                return object_stem + extension
+
+        return None
+
+    def put(self, data: Any, digest: Optional[str] = None) -> str:
+        """객체를 저장하고 해시를 반환합니다. digest를 주지 않으면 전체 내용으로 계산합니다.
+
+        이미 있는 객체는 다시 쓰지 않고 수정 시각만 갱신하여, 다시 참조된 객체가
+        collect_garbage()의 min_age_seconds 보호를 받도록 합니다.
+        """
+        digest = digest or compute_digest(data)
+        existing_path = self.find(digest)
+        if existing_path is not None:
+            try:
+                os.utime(existing_path)
+                return digest
+            except FileNotFoundError:
+                # 확인 직후 정리된 객체는 다시 씀
+                pass
+
+        object_path = self._get_object_stem(digest) + self.serializer.extension
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        write_cache_file(object_path, data, self.serializer)
+        return digest
+
+    def get(self, digest: str) -> Optional[Any]:
+        """해시로 객체를 읽습니다. 없거나 읽을 수 없으면 None."""
+        object_path = self.find(digest)
+        if object_path is None:
+            return None
+
+        try:
+            return read_cache_file(object_path)
+        except Exception as e:
+            logger.warning(f"객체 로드 실패 ({digest}): {e}")
+            return None
+
+    def iter_objects(self) -> Iterator[str]:
+        """저장된 객체 파일 경로를 모두 반환합니다."""
+        if not os.path.isdir(self.root):
+            return
+
+        for root, _, files in os.walk(self.root):
+            for file_name in files:
+                if not file_name.endswith('.tmp'):
+                    yield os.path.join(root, file_name)
+
+
+def pack_problem_refs(store: ContentStore, data: Dict[str, Any]) -> Dict[str, Any]:
+    """캐시 데이터의 문제 목록을 객체 저장소 참조로 바꿉니다."""
+    problems = data.get("problems") if isinstance(data, dict) else None
+    if not isinstance(problems, list):
+        return data
+
+    packed = {key: value for key, value in data.items() if key != "problems"}
+    packed[PROBLEM_REFS_KEY] = [
+        store.put(problem_data, compute_problem_digest(problem_data)) for problem_data in problems
+    ]
+    return packed
+
+
+def unpack_problem_refs(store: ContentStore, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """참조로 저장된 문제 목록을 복원합니다. 참조된 객체가 없으면 None을 반환합니다."""
+    if not isinstance(data, dict) or PROBLEM_REFS_KEY not in data:
+        return data
+
+    problems = []
+    for digest in data[PROBLEM_REFS_KEY]:
+        problem_data = store.get(digest)
+        if problem_data is None:
+            logger.warning(f"참조된 문제 객체가 없습니다: {digest}")
+            return None
+        problems.append(problem_data)
+
+    unpacked = {key: value for key, value in data.items() if key != PROBLEM_REFS_KEY}
+    unpacked["problems"] = problems
+    return unpacked
+
+
+def _iter_cache_files(cache_dir: str) -> Iterator[str]:
+    """디렉토리 바로 아래의 프로바이더 캐시 파일 경로를 반환합니다."""
+    known_extensions = get_known_extensions()
+    for file_name in os.listdir(cache_dir):
+        stem, _, extension = file_name.partition('.')
+        if CACHE_FILE_STEM_PATTERN.match(stem) and '.' + extension in known_extensions:
+            yield os.path.join(cache_dir, file_name)
+
+
+def collect_referenced_digests(cache_dir: str) -> Optional[Set[str]]:
+    """캐시 디렉토리의 캐시 항목들이 참조하는 객체 해시 집합을 반환합니다.
+
+    읽을 수 없는 캐시 파일이 있으면 참조를 확정할 수 없으므로 None을 반환합니다.
+    """
+    referenced: Set[str] = set()
+    for cache_path in _iter_cache_files(cache_dir):
+        try:
+            data = read_cache_file(cache_path)
+        except Exception as e:
+            logger.warning(f"캐시 파일을 읽을 수 없어 정리를 중단합니다 ({cache_path}): {e}")
+            return None
+
+        if isinstance(data, dict):
+            referenced.update(data.get(PROBLEM_REFS_KEY, []))
+    return referenced
+
+
+def collect_garbage(cache_dir: str, min_age_seconds: float = 3600.0,
+                    dry_run: bool = False) -> List[str]:
+    """어떤 캐시 항목도 참조하지 않는 객체를 삭제하고 삭제한(삭제할) 경로 목록을 반환합니다.
+
+    다른 프로세스가 객체를 쓴 뒤 아직 캐시 항목을 저장하지 않았을 수 있으므로
+    min_age_seconds보다 최근에 만들어진 객체는 남겨 둡니다.
+    """
+    store = ContentStore(cache_dir)
+    if not os.path.isdir(store.root):
+        return []
+
+    referenced = collect_referenced_digests(cache_dir)
+    if referenced is None:
+        return []
+
+    now = time.time()
+    removed = []
+    for object_path in store.iter_objects():
+        digest = os.path.basename(object_path).partition('.')[0]
+        if digest in referenced:
+            continue
+
+        try:
+            if now - os.path.getmtime(object_path) < min_age_seconds:
+                continue
+            if not dry_run:
+                os.remove(object_path)
+            removed.append(object_path)
+        except OSError as e:
+            logger.warning(f"객체 삭제 실패 ({object_path}): {e}")
+
+    if not dry_run:
+        # 비어 있는 하위 디렉토리 정리
+        for entry in os.listdir(store.root):
+            entry_path = os.path.join(store.root, entry)
+            if os.path.isdir(entry_path) and not os.listdir(entry_path):
+                os.rmdir(entry_path)
+
+    return removed
+
+
+def find_store_dirs(cache_root: str) -> List[str]:
+    """하위 디렉토리까지 포함하여 객체 저장소를 가진 캐시 디렉토리 목록을 반환합니다."""
+    store_dirs = []
+    for root, dirs, _ in os.walk(cache_root):
+        if OBJECTS_DIR_NAME in dirs:
+            store_dirs.append(root)
+            dirs.remove(OBJECTS_DIR_NAME)
+    return store_dirs
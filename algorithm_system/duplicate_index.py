@@ -0,0 +1,244 @@
+"""
+플랫폼 간 중복 문제 인덱스
+
+이 모듈은 여러 플랫폼에 같은 문제가 올라와 있는 경우를 찾기 위한 근사 중복 인덱스를 제공합니다.
+본문이 있는 문제는 본문을 단어 shingle로 나눈 뒤 MinHash 서명을 계산하고, LSH 밴드 버킷으로 후보를
+찾으므로 조회 비용은 전체 문제 수가 아니라 같은 버킷에 들어간 후보 수에 비례합니다.
+목록 동기화만 된 (본문이 없는) 문제는 정규화한 제목의 해시 인덱스로 찾습니다.
+
+같은 플랫폼 안의 문제는 제목이 같아도 서로 다른 문제로 보고, 다른 플랫폼의 문제끼리만 묶습니다.
+문제를 추가할 때 찾은 중복끼리는 union-find로 클러스터를 유지합니다.
+"""
+
+import hashlib
+import re
+import struct
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .problem_data_structures import AlgorithmProblem
+except ImportError:
+    from problem_data_structures import AlgorithmProblem
+
+
+ProblemKey = Tuple[Hashable, str]
+
+_NON_WORD_PATTERN = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize_title(title: str) -> str:
+    """대소문자, 악센트, 구두점 차이를 없앤 제목을 반환합니다."""
+    text = unicodedata.normalize('NFKD', title or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return _NON_WORD_PATTERN.sub(' ', text.lower()).strip()
+
+
+def problem_key(problem: AlgorithmProblem) -> ProblemKey:
+    """인덱스에서 문제를 구분하는 키 (플랫폼, 플랫폼 문제 ID)"""
+    return (problem.platform, problem.platform_problem_id or problem.id)
+
+
+def shingles(problem: AlgorithmProblem) -> Set[str]:
+    """본문의 단어 3-gram 집합을 만듭니다. 본문이 없으면 빈 집합.
+
+    플랫폼마다 제목을 다르게 붙이는 경우가 많으므로 제목은 shingle에 넣지 않고 제목 인덱스로만 비교합니다.
+    """
+    words = normalize_title(problem.problem_statement).split()
+    return {' '.join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+@dataclass
+class _IndexEntry:
+    """인덱스에 저장된 문제 정보"""
+    fingerprint: int
+    signature: Optional[Tuple[int, ...]]
+    title_key: Optional[str]
+
+
+class DuplicateIndex:
+    """MinHash LSH + 정규화 제목 해시 기반 중복 문제 인덱스
+
+    threshold는 MinHash로 추정한 Jaccard 유사도의 기준이며, bands × rows가 서명 길이입니다.
+    한쪽이라도 본문이 없으면 min_title_words 단어 이상의 정규화 제목이 완전히 같을 때 중복으로 봅니다.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4, threshold: float = 0.7,
+                 min_title_words: int = 2):
+        self.bands = bands
+        self.rows = rows
+        self.num_perm = bands * rows
+        self.threshold = threshold
+        self.min_title_words = min_title_words
+
+        self._entries: Dict[ProblemKey, _IndexEntry] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[ProblemKey]] = {}
+        self._titles: Dict[str, Set[ProblemKey]] = {}
+        self._parent: Dict[ProblemKey, ProblemKey] = {}
+        self._lock = threading.RLock()
+        self._unpack = struct.Struct(f"<{self.num_perm}I").unpack
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, problem: AlgorithmProblem) -> bool:
+        return problem_key(problem) in self._entries
+
+    def signature(self, problem: AlgorithmProblem) -> Optional[Tuple[int, ...]]:
+        """문제의 MinHash 서명을 계산합니다. shingle이 없으면 None."""
+        problem_shingles = shingles(problem)
+        if not problem_shingles:
+            return None
+
+        # shingle마다 한 번의 해시로 num_perm개의 32비트 해시값을 만들고 위치별 최솟값을 취함
+        digest_size = 4 * self.num_perm
+        hashed = [
+            self._unpack(hashlib.shake_128(shingle.encode('utf-8')).digest(digest_size))
+            for shingle in problem_shingles
+        ]
+        return tuple(map(min, zip(*hashed)))
+
+    def add(self, problem: AlgorithmProblem) -> List[ProblemKey]:
+        """문제를 인덱스에 추가하고 다른 플랫폼의 중복 문제 키 목록을 반환합니다.
+
+        이미 같은 내용으로 추가된 문제는 다시 계산하지 않으며 빈 목록을 반환합니다.
+        """
+        key = problem_key(problem)
+        fingerprint = hash((problem.title, problem.problem_statement))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.fingerprint == fingerprint:
+                return []
+            if entry is not None:
+                self._remove_entry(key, entry)
+
+        title_key = normalize_title(problem.title)
+        if len(title_key.split()) < self.min_title_words:
+            title_key = None
+        entry = _IndexEntry(fingerprint, self.signature(problem), title_key)
+
+        with self._lock:
+            duplicates = self._find(key, entry)
+
+            self._entries[key] = entry
+            self._parent.setdefault(key, key)
+            if entry.signature is not None:
+                for band_key in self._band_keys(entry.signature):
+                    self._buckets.setdefault(band_key, set()).add(key)
+            if entry.title_key is not None:
+                self._titles.setdefault(entry.title_key, set()).add(key)
+
+            for duplicate in duplicates:
+                self._union(key, duplicate)
+
+        return duplicates
+
+    def add_many(self, problems: Iterable[AlgorithmProblem]) -> int:
+        """여러 문제를 추가하고 새로 찾은 중복 쌍의 수를 반환합니다."""
+        return sum(len(self.add(problem)) for problem in problems)
+
+    def find_duplicates(self, problem: AlgorithmProblem) -> List[ProblemKey]:
+        """다른 플랫폼의 중복 문제 키 목록을 반환합니다 (인덱스는 변경하지 않음)."""
+        key = problem_key(problem)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            title_key = normalize_title(problem.title)
+            if len(title_key.split()) < self.min_title_words:
+                title_key = None
+            entry = _IndexEntry(0, self.signature(problem), title_key)
+
+        with self._lock:
+            return self._find(key, entry)
+
+    def canonical_key(self, problem: AlgorithmProblem) -> ProblemKey:
+        """문제가 속한 클러스터의 대표 키를 반환합니다."""
+        key = problem_key(problem)
+        with self._lock:
+            return self._root(key) if key in self._parent else key
+
+    def clusters(self, min_size: int = 2) -> List[Set[ProblemKey]]:
+        """min_size개 이상의 문제로 이루어진 중복 클러스터 목록을 반환합니다."""
+        with self._lock:
+            groups: Dict[ProblemKey, Set[ProblemKey]] = {}
+            for key in self._parent:
+                groups.setdefault(self._root(key), set()).add(key)
+        return [group for group in groups.values() if len(group) >= min_size]
+
+    def deduplicate(self, problems: Iterable[AlgorithmProblem]) -> List[AlgorithmProblem]:
+        """순서를 유지하면서 이미 나온 문제와 같은 문제(다른 플랫폼 포함)를 제외합니다."""
+        unique = []
+        seen: Set[ProblemKey] = set()
+        for problem in problems:
+            key = problem_key(problem)
+            if key in seen:
+                continue
+            self.add(problem)
+            if any(duplicate in seen for duplicate in self.find_duplicates(problem)):
+                continue
+            unique.append(problem)
+            seen.add(key)
+        return unique
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def _find(self, key: ProblemKey, entry: _IndexEntry) -> List[ProblemKey]:
+        """LSH 버킷과 제목 인덱스에서 후보를 모아 유사도를 확인합니다."""
+        platform = key[0]
+        title_matches = set(self._titles.get(entry.title_key, ())) if entry.title_key else set()
+
+        candidates = set(title_matches)
+        if entry.signature is not None:
+            for band_key in self._band_keys(entry.signature):
+                candidates.update(self._buckets.get(band_key, ()))
+
+        duplicates = []
+        for candidate in candidates:
+            if candidate == key or candidate[0] == platform:
+                continue
+            other = self._entries[candidate]
+            if entry.signature is not None and other.signature is not None:
+                # 양쪽 모두 본문이 있으면 제목이 같아도 본문 유사도로 판단
+                if self._similarity(entry, other) >= self.threshold:
+                    duplicates.append(candidate)
+            elif candidate in title_matches:
+                duplicates.append(candidate)
+        return duplicates
+
+    def _similarity(self, first: _IndexEntry, second: _IndexEntry) -> float:
+        """두 MinHash 서명의 일치 비율로 Jaccard 유사도를 추정합니다."""
+        matches = sum(a == b for a, b in zip(first.signature, second.signature))
+        return matches / self.num_perm
+
+    def _remove_entry(self, key: ProblemKey, entry: _IndexEntry) -> None:
+        """내용이 바뀐 문제의 버킷/제목 인덱스 항목을 제거합니다 (클러스터는 유지)."""
+        if entry.signature is not None:
+            for band_key in self._band_keys(entry.signature):
+                bucket = self._buckets.get(band_key)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._buckets[band_key]
+        if entry.title_key is not None:
+            titles = self._titles.get(entry.title_key)
+            if titles is not None:
+                titles.discard(key)
+                if not titles:
+                    del self._titles[entry.title_key]
+
+    def _root(self, key: ProblemKey) -> ProblemKey:
+        parent = self._parent
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def _union(self, first: ProblemKey, second: ProblemKey) -> None:
+        first_root, second_root = self._root(first), self._root(second)
+        if first_root != second_root:
+            self._parent[second_root] = first_root
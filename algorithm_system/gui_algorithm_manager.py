@@ -23,6 +23,8 @@ try:
         AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
     )
     from .remote_problem_provider import RemoteProblemProvider
+    from .catalog_snapshot import LocalSnapshotProvider
+    from .app_warmup import AppWarmup, WarmupProgressView, build_challenge_warmup_steps
 except ImportError:
     from advanced_challenge_system import (
         AdvancedChallengeSystem, Challenge, ChallengeType, ChallengeStatus,
@@ -32,6 +34,8 @@ except ImportError:
         AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
     )
     from remote_problem_provider import RemoteProblemProvider
+    from catalog_snapshot import LocalSnapshotProvider
+    from app_warmup import AppWarmup, WarmupProgressView, build_challenge_warmup_steps
 
 
 class MockProblemProvider:
@@ -168,7 +172,7 @@ class AlgorithmManagerGUI:
         self.root.configure(bg='#f0f0f0')
 
         # 시스템 초기화
-        self.problem_provider = MockProblemProvider()
+        self.problem_provider = self._create_problem_provider()
         self.challenge_system = AdvancedChallengeSystem("gui_user", self.problem_provider)
 
         # 현재 선택된 문제
@@ -179,9 +183,25 @@ class AlgorithmManagerGUI:
         self.setup_gui()
         self.load_initial_data()
 
+        # 첫 화면을 그린 뒤 문제/진도/추천 데이터를 백그라운드에서 미리 로드
+        self.warmup: Optional[AppWarmup] = None
+        self.root.after_idle(self.start_warmup)
+
         # 주기적 업데이트
         self.schedule_updates()
 
+    def _create_problem_provider(self, catalog_path: str = os.path.join("cache", "catalog.sqlite3")):
+        """가져온 카탈로그가 있으면 오프라인 스냅샷 제공자를, 없으면 샘플 문제 제공자를 사용합니다."""
+        if os.path.exists(catalog_path):
+            try:
+                provider = LocalSnapshotProvider(catalog_path)
+                if provider.catalog.count() > 0:
+                    return provider
+                provider.close()
+            except Exception as e:
+                print(f"로컬 카탈로그 로드 실패: {e}")
+        return MockProblemProvider()
+
     def setup_gui(self):
         """GUI 구성"""
         # 메인 프레임
@@ -463,9 +483,8 @@ class AlgorithmManagerGUI:
         self.result_text.pack(fill=tk.BOTH, expand=True)
 
     def load_initial_data(self):
-        """초기 데이터 로드"""
+        """초기 데이터 로드 (추천 문제는 워밍업 완료 후 표시)"""
         self.refresh_statistics()
-        self.refresh_recommendations()
         self.refresh_challenges()
         self.refresh_detailed_statistics()
 
@@ -498,25 +517,36 @@ if __name__ == "__main__":
         except Exception as e:
             messagebox.showerror("오류", f"통계 로드 실패: {e}")
 
+    def start_warmup(self):
+        """워밍업을 시작하고 진행 상황 폴링을 예약합니다."""
+        self.warmup = AppWarmup(build_challenge_warmup_steps(self.challenge_system, 10))
+        WarmupProgressView(
+            self.root, self.warmup, self.recommendations_tree,
+            self._show_recommendations, self.refresh_recommendations
+        ).start()
+
     def refresh_recommendations(self):
         """추천 문제 새로고침"""
         try:
-            # 기존 항목 삭제
-            for item in self.recommendations_tree.get_children():
-                self.recommendations_tree.delete(item)
-
             # 새로운 추천 문제 로드
             recommendations = self.challenge_system.get_personalized_recommendations(10)
-
-            for problem in recommendations:
-                tags_str = ', '.join(tag.name for tag in problem.tags)
-                self.recommendations_tree.insert('', 'end',
-                                               values=(problem.title, problem.difficulty.name, tags_str),
-                                               tags=(problem.id,))
+            self._show_recommendations(recommendations)
 
         except Exception as e:
             messagebox.showerror("오류", f"추천 문제 로드 실패: {e}")
 
+    def _show_recommendations(self, recommendations: List[AlgorithmProblem]):
+        """추천 문제 목록을 표시합니다."""
+        # 기존 항목 삭제
+        for item in self.recommendations_tree.get_children():
+            self.recommendations_tree.delete(item)
+
+        for problem in recommendations:
+            tags_str = ', '.join(tag.name for tag in problem.tags)
+            self.recommendations_tree.insert('', 'end',
+                                           values=(problem.title, problem.difficulty.name, tags_str),
+                                           tags=(problem.id,))
+
     def refresh_challenges(self):
         """챌린지 새로고침"""
         try:
@@ -574,6 +604,8 @@ if __name__ == "__main__":
                 return
 
             item = self.recommendations_tree.item(selection[0])
+            if not item['tags']:
+                return  # 워밍업 진행 표시 행
             problem_id = item['tags'][0]
 
             # 문제 정보 로드
@@ -0,0 +1,118 @@
+"""
+메모리 매핑 기반 지연 디코딩 문제 카탈로그
+
+이 모듈은 전체 문제 카탈로그를 레코드 오프셋 테이블이 있는 단일 파일로 저장하고,
+mmap으로 열어 접근한 문제만 AlgorithmProblem으로 변환하는 읽기 전용 뷰를 제공합니다.
+
+파일 형식:
+    MAGIC(8바이트) | 레코드 수(uint32) | 오프셋 테이블((레코드 수 + 1) x uint64) | JSON 레코드들
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+try:
+    from .problem_data_structures import AlgorithmProblem
+except ImportError:
+    from problem_data_structures import AlgorithmProblem
+
+
+MAGIC = b"FTCATLG1"
+COUNT_FORMAT = struct.Struct("<I")
+OFFSET_FORMAT = struct.Struct("<Q")
+
+
+def write_lazy_catalog(path: str, problems_data: Iterable[Dict[str, Any]]) -> int:
+    """문제 딕셔너리 목록을 지연 디코딩 카탈로그 파일로 저장합니다. 저장한 레코드 수를 반환합니다."""
+    records = [
+        json.dumps(problem_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        for problem_data in problems_data
+    ]
+
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(COUNT_FORMAT.pack(len(records)))
+        f.write(b"".join(OFFSET_FORMAT.pack(offset) for offset in offsets))
+        for record in records:
+            f.write(record)
+    os.replace(temp_path, path)
+
+    return len(records)
+
+
+class LazyProblemCatalog(Sequence):
+    """mmap 기반 읽기 전용 문제 카탈로그 뷰
+
+    리스트처럼 len(), 인덱싱, 슬라이싱, 반복을 지원하며
+    문제는 접근할 때마다 해당 레코드만 디코딩하여 생성합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"카탈로그 파일 형식이 아닙니다: {path}")
+
+        self._count = COUNT_FORMAT.unpack_from(self._mmap, len(MAGIC))[0]
+        self._offsets_start = len(MAGIC) + COUNT_FORMAT.size
+        self._data_start = self._offsets_start + (self._count + 1) * OFFSET_FORMAT.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[AlgorithmProblem, List[AlgorithmProblem]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        return AlgorithmProblem.from_dict(self.get_raw(index))
+
+    def __iter__(self) -> Iterator[AlgorithmProblem]:
+        for i in range(self._count):
+            yield self[i]
+
+    def get_raw(self, index: int) -> Dict[str, Any]:
+        """레코드를 AlgorithmProblem으로 변환하지 않고 딕셔너리로 반환합니다."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("카탈로그 인덱스 범위를 벗어났습니다")
+
+        offset_position = self._offsets_start + index * OFFSET_FORMAT.size
+        start = OFFSET_FORMAT.unpack_from(self._mmap, offset_position)[0]
+        end = OFFSET_FORMAT.unpack_from(self._mmap, offset_position + OFFSET_FORMAT.size)[0]
+        record = self._mmap[self._data_start + start:self._data_start + end]
+        return json.loads(record.decode('utf-8'))
+
+    def close(self) -> None:
+        """메모리 매핑과 파일을 닫습니다."""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap.closed
+
+    def __enter__(self) -> 'LazyProblemCatalog':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"LazyProblemCatalog(path='{self.path}', count={self._count})"
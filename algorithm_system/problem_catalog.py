@@ -0,0 +1,261 @@
+"""
+로컬 문제 카탈로그 저장소
+
+이 모듈은 외부 플랫폼에서 동기화한 문제들을 SQLite 기반 카탈로그에 저장합니다.
+플랫폼, 난이도, 태그, 플랫폼 문제 ID에 보조 인덱스를 유지하여
+전체 목록을 다시 만들지 않고 인덱스 조회만으로 문제를 찾을 수 있게 합니다.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Optional, Iterable, Any
+
+try:
+    from .problem_data_structures import (
+        AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
+    )
+except ImportError:
+    from problem_data_structures import (
+        AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
+    )
+
+
+class ProblemCatalog:
+    """SQLite 기반 인덱스 문제 카탈로그"""
+
+    SCHEMA = [
+        """
+        CREATE TABLE IF NOT EXISTS problems (
+            platform TEXT NOT NULL,
+            platform_problem_id TEXT NOT NULL,
+            id TEXT NOT NULL,
+            difficulty TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (platform, platform_problem_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS problem_tags (
+            platform TEXT NOT NULL,
+            platform_problem_id TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (platform, tag, platform_problem_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sync_state (
+            platform TEXT PRIMARY KEY,
+            synced_at REAL NOT NULL,
+            problem_count INTEGER NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_problems_difficulty ON problems (platform, difficulty, position)",
+        "CREATE INDEX IF NOT EXISTS idx_problems_position ON problems (platform, position)",
+        "CREATE INDEX IF NOT EXISTS idx_problem_tags_problem ON problem_tags (platform, platform_problem_id)",
+        "CREATE INDEX IF NOT EXISTS idx_problems_id ON problems (id)"
+    ]
+
+    def __init__(self, db_path: str = "catalog.sqlite3"):
+        self.db_path = db_path
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.RLock()
+
+        # GUI 워커 스레드에서도 사용하므로 스레드 검사를 끄고 락으로 보호
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        """테이블과 인덱스를 생성합니다."""
+        with self._lock, self.connection:
+            for statement in self.SCHEMA:
+                self.connection.execute(statement)
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self.connection.close()
+
+    def replace_platform(self, platform: ProblemPlatform, problems: Iterable[AlgorithmProblem],
+                         synced_at: Optional[float] = None) -> int:
+        """플랫폼의 문제 전체를 주어진 목록으로 교체합니다. synced_at은 bulk_load와 같습니다."""
+        count = self.bulk_load(platform, (problem.to_dict() for problem in problems), synced_at)
+        self.logger.info(f"{platform} 카탈로그 동기화 완료: {count}개")
+        return count
+
+    def bulk_load(self, platform: ProblemPlatform, problems_data: Iterable[Dict[str, Any]],
+                  synced_at: Optional[float] = None) -> int:
+        """문제 딕셔너리 목록으로 플랫폼 데이터를 한 트랜잭션에서 일괄 교체합니다.
+
+        AlgorithmProblem으로 변환하지 않으며, synced_at을 지정하면 동기화 시각을 그 값으로 기록합니다.
+        id가 없는 레코드가 있으면 기존 데이터를 건드리지 않고 ValueError를 발생시킵니다.
+        """
+        problem_rows = []
+        tag_rows = []
+
+        for position, problem_data in enumerate(problems_data):
+            if not isinstance(problem_data, dict) or not problem_data.get('id'):
+                raise ValueError(f"{platform} 문제 레코드 {position}번에 id가 없습니다")
+            platform_problem_id = problem_data.get('platform_problem_id') or problem_data['id']
+            problem_rows.append((
+                platform.name,
+                platform_problem_id,
+                problem_data['id'],
+                problem_data.get('difficulty', ProblemDifficulty.MEDIUM.name),
+                position,
+                json.dumps(problem_data, ensure_ascii=False)
+            ))
+            tag_rows.extend((platform.name, platform_problem_id, tag) for tag in problem_data.get('tags', []))
+
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM problems WHERE platform = ?", (platform.name,))
+            self.connection.execute("DELETE FROM problem_tags WHERE platform = ?", (platform.name,))
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO problems VALUES (?, ?, ?, ?, ?, ?)", problem_rows
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO problem_tags VALUES (?, ?, ?)", tag_rows
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (platform.name, synced_at if synced_at is not None else time.time(), len(problem_rows))
+            )
+
+        return len(problem_rows)
+
+    def iter_problem_data(self, platform: ProblemPlatform) -> Iterable[Dict[str, Any]]:
+        """플랫폼의 문제를 AlgorithmProblem으로 변환하지 않고 딕셔너리로 반환합니다."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT data FROM problems WHERE platform = ? ORDER BY position", (platform.name,)
+            ).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def get_platforms(self) -> List[ProblemPlatform]:
+        """동기화 기록이 있는 플랫폼 목록을 반환합니다."""
+        with self._lock:
+            rows = self.connection.execute("SELECT platform FROM sync_state ORDER BY platform").fetchall()
+        return [ProblemPlatform.from_string(platform) for (platform,) in rows]
+
+    def clear_platform(self, platform: ProblemPlatform) -> None:
+        """플랫폼의 카탈로그 데이터를 삭제합니다."""
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM problems WHERE platform = ?", (platform.name,))
+            self.connection.execute("DELETE FROM problem_tags WHERE platform = ?", (platform.name,))
+            self.connection.execute("DELETE FROM sync_state WHERE platform = ?", (platform.name,))
+
+    def get_sync_age_hours(self, platform: ProblemPlatform) -> Optional[float]:
+        """마지막 동기화 이후 경과 시간(시간 단위)을 반환합니다. 동기화 기록이 없으면 None."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT synced_at FROM sync_state WHERE platform = ?", (platform.name,)
+            ).fetchone()
+        if row is None:
+            return None
+        return (time.time() - row[0]) / 3600
+
+    def is_synced(self, platform: ProblemPlatform, max_age_hours: Optional[float] = None) -> bool:
+        """플랫폼이 동기화되어 있고 만료되지 않았는지 확인합니다."""
+        age = self.get_sync_age_hours(platform)
+        if age is None:
+            return False
+        return max_age_hours is None or age <= max_age_hours
+
+    def count(self, platform: Optional[ProblemPlatform] = None) -> int:
+        """카탈로그의 문제 개수를 반환합니다."""
+        with self._lock:
+            if platform is None:
+                row = self.connection.execute("SELECT COUNT(*) FROM problems").fetchone()
+            else:
+                row = self.connection.execute(
+                    "SELECT COUNT(*) FROM problems WHERE platform = ?", (platform.name,)
+                ).fetchone()
+        return row[0]
+
+    def get_problems(self, platform: ProblemPlatform, limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """플랫폼의 문제를 동기화 순서대로 가져옵니다."""
+        return self._query(
+            "SELECT data FROM problems WHERE platform = ? ORDER BY position",
+            (platform.name,), limit
+        )
+
+    def get_by_difficulty(self, platform: ProblemPlatform, difficulty: ProblemDifficulty,
+                          limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """난이도 인덱스로 문제를 조회합니다."""
+        return self._query(
+            "SELECT data FROM problems WHERE platform = ? AND difficulty = ? ORDER BY position",
+            (platform.name, difficulty.name), limit
+        )
+
+    def get_by_tag(self, platform: ProblemPlatform, tag: ProblemTag,
+                   limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """태그 인덱스로 문제를 조회합니다."""
+        return self._query(
+            """
+            SELECT p.data FROM problem_tags t
+            JOIN problems p
+              ON p.platform = t.platform AND p.platform_problem_id = t.platform_problem_id
+            WHERE t.platform = ? AND t.tag = ?
+            ORDER BY p.position
+            """,
+            (platform.name, tag.name), limit
+        )
+
+    def get_by_platform_problem_id(self, platform: ProblemPlatform,
+                                   platform_problem_id: str) -> Optional[AlgorithmProblem]:
+        """플랫폼 문제 ID로 단일 문제를 조회합니다."""
+        problems = self._query(
+            "SELECT data FROM problems WHERE platform = ? AND platform_problem_id = ?",
+            (platform.name, platform_problem_id), 1
+        )
+        return problems[0] if problems else None
+
+    def get_by_id(self, problem_id: str) -> Optional[AlgorithmProblem]:
+        """AlgorithmProblem.id로 단일 문제를 조회합니다."""
+        problems = self._query("SELECT data FROM problems WHERE id = ?", (problem_id,), 1)
+        return problems[0] if problems else None
+
+    def _query(self, sql: str, params: tuple, limit: Optional[int]) -> List[AlgorithmProblem]:
+        """쿼리를 실행하고 결과 행을 AlgorithmProblem으로 변환합니다."""
+        if limit:
+            sql += " LIMIT ?"
+            params = params + (limit,)
+
+        with self._lock:
+            rows = self.connection.execute(sql, params).fetchall()
+
+        problems_data = []
+        for (data,) in rows:
+            try:
+                problems_data.append(json.loads(data))
+            except Exception as e:
+                self.logger.warning(f"카탈로그 문제 변환 실패: {e}")
+
+        try:
+            return AlgorithmProblem.from_dicts(problems_data)
+        except Exception:
+            # 잘못된 행이 섞여 있으면 행 단위로 변환해 그 행만 건너뜀
+            problems = []
+            for problem_data in problems_data:
+                try:
+                    problems.append(AlgorithmProblem.from_dict(problem_data))
+                except Exception as e:
+                    self.logger.warning(f"카탈로그 문제 변환 실패: {e}")
+            return problems
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """플랫폼별 동기화 상태를 반환합니다."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT platform, synced_at, problem_count FROM sync_state"
+            ).fetchall()
+        return {
+            platform: {'synced_at': synced_at, 'problem_count': problem_count}
+            for platform, synced_at, problem_count in rows
+        }
@@ -5,11 +5,12 @@
 대기업 코딩테스트 수준의 알고리즘 문제 시스템을 위한 핵심 데이터 클래스들을 포함합니다.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
-from typing import List, Dict, Optional, Set, Any
+from typing import List, Dict, Optional, Set, Any, Iterable, Collection, Tuple, Union
 from datetime import datetime
 import json
+import sys
 import uuid
 
 
@@ -193,6 +194,20 @@ class ProblemTestCase:
         )
 
 
+# from_dicts()에서 사용하는 이름 -> 열거형 조회 테이블 (from_string()과 같이 대문자 이름 기준)
+_DIFFICULTY_BY_NAME: Dict[str, ProblemDifficulty] = dict(ProblemDifficulty.__members__)
+_PLATFORM_BY_NAME: Dict[str, ProblemPlatform] = dict(ProblemPlatform.__members__)
+_TAG_BY_NAME: Dict[str, ProblemTag] = dict(ProblemTag.__members__)
+
+
+def _lookup_enum(table: Dict[str, Any], name: Any, default: Any) -> Any:
+    """대문자 이름으로 먼저 찾고, 없으면 from_string()처럼 대문자로 바꿔 다시 찾습니다."""
+    value = table.get(name)
+    if value is None:
+        value = table.get(name.upper(), default) if isinstance(name, str) else default
+    return value
+
+
 @dataclass
 class AlgorithmProblem:
     """표준화된 알고리즘 문제 데이터 구조"""
@@ -309,6 +324,87 @@ class AlgorithmProblem:
             is_active=data.get('is_active', True)
         )
 
+    @classmethod
+    def from_dicts(cls, records: Iterable[Dict[str, Any]]) -> List['AlgorithmProblem']:
+        """여러 딕셔너리를 한 번에 객체로 변환합니다 (from_dict()와 같은 결과).
+
+        열거형은 미리 만든 이름 테이블로 찾고, 같은 태그 조합/시각 문자열의 변환 결과를 묶음 안에서
+        재사용하며, 생성자와 기본값 팩토리를 거치지 않고 인스턴스 __dict__를 직접 만듭니다.
+        ID가 없는 문제에만 uuid를 만들고, 메타데이터 기본 시각은 묶음 전체에 하나를 씁니다.
+        """
+        new_problem = object.__new__
+        new_metadata = ProblemMetadata.__new__
+        test_case_from_dict = ProblemTestCase.from_dict
+        difficulties, platforms = _DIFFICULTY_BY_NAME, _PLATFORM_BY_NAME
+        medium, local = ProblemDifficulty.MEDIUM, ProblemPlatform.LOCAL
+
+        tag_sets: Dict[Tuple[str, ...], frozenset] = {}
+        datetimes: Dict[str, datetime] = {}
+        now_iso = datetime.now().isoformat()
+
+        def parse_datetime(value: str) -> datetime:
+            parsed = datetimes.get(value)
+            if parsed is None:
+                parsed = datetimes[value] = datetime.fromisoformat(value)
+            return parsed
+
+        def tag_set(names) -> Set[ProblemTag]:
+            if not names:
+                return set()
+            key = tuple(names)
+            tags = tag_sets.get(key)
+            if tags is None:
+                tags = tag_sets[key] = frozenset(
+                    tag for tag in (_lookup_enum(_TAG_BY_NAME, name, None) for name in key) if tag is not None
+                )
+            return set(tags)
+
+        problems = []
+        append = problems.append
+        for data in records:
+            get = data.get
+            metadata_data = get('metadata') or {}
+            metadata_get = metadata_data.get
+
+            metadata = new_metadata(ProblemMetadata)
+            metadata.__dict__ = {
+                'created_at': parse_datetime(metadata_get('created_at', now_iso)),
+                'updated_at': parse_datetime(metadata_get('updated_at', now_iso)),
+                'solved_count': metadata_get('solved_count', 0),
+                'submission_count': metadata_get('submission_count', 0),
+                'success_rate': metadata_get('success_rate', 0.0),
+                'average_solve_time': metadata_get('average_solve_time'),
+                'tags': tag_set(metadata_get('tags'))
+            }
+
+            difficulty = get('difficulty', 'MEDIUM')
+            platform = get('platform', 'LOCAL')
+            test_cases = get('test_cases')
+            problem = new_problem(cls)
+            problem.__dict__ = {
+                'id': get('id') or str(uuid.uuid4()),
+                'title': get('title', ''),
+                'description': get('description', ''),
+                'difficulty': difficulties.get(difficulty) or _lookup_enum(difficulties, difficulty, medium),
+                'platform': platforms.get(platform) or _lookup_enum(platforms, platform, local),
+                'platform_problem_id': get('platform_problem_id'),
+                'platform_url': get('platform_url'),
+                'time_limit': get('time_limit'),
+                'memory_limit': get('memory_limit'),
+                'problem_statement': get('problem_statement', ''),
+                'input_format': get('input_format', ''),
+                'output_format': get('output_format', ''),
+                'constraints': get('constraints', ''),
+                'examples': get('examples', []),
+                'test_cases': [test_case_from_dict(tc) for tc in test_cases] if test_cases else [],
+                'metadata': metadata,
+                'tags': tag_set(get('tags')),
+                'notes': get('notes', ''),
+                'is_active': get('is_active', True)
+            }
+            append(problem)
+        return problems
+
     def to_json(self) -> str:
         """JSON 문자열로 변환"""
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
@@ -328,8 +424,206 @@ class AlgorithmProblem:
         return f"AlgorithmProblem(id='{self.id}', title='{self.title}', difficulty={self.difficulty})"
 
 
+# 태그 -> 비트 (ProblemTag 정의 순서)
+TAG_BITS: Dict[ProblemTag, int] = {tag: 1 << index for index, tag in enumerate(ProblemTag)}
+_TAGS_BY_INDEX: Tuple[ProblemTag, ...] = tuple(ProblemTag)
+
+# 값이 비어 있는 필드가 인스턴스마다 새 객체를 갖지 않도록 공유하는 불변 기본값
+_EMPTY_TUPLE: Tuple = ()
+_EMPTY_TAGS: frozenset = frozenset()
+
+
+def tags_to_mask(tags: Iterable[ProblemTag]) -> int:
+    """태그 목록을 비트마스크로 변환합니다."""
+    mask = 0
+    for tag in tags:
+        mask |= TAG_BITS[tag]
+    return mask
+
+
+def mask_to_tags(mask: int) -> frozenset:
+    """비트마스크를 태그 집합으로 변환합니다."""
+    if not mask:
+        return _EMPTY_TAGS
+    tags = []
+    index = 0
+    while mask:
+        if mask & 1:
+            tags.append(_TAGS_BY_INDEX[index])
+        mask >>= 1
+        index += 1
+    return frozenset(tags)
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class CompactProblem:
+    """메모리를 적게 쓰는 AlgorithmProblem 표현
+
+    플랫폼 전체 목록처럼 많은 문제를 메모리에 들고 있을 때 사용합니다. AlgorithmProblem과 필드 이름과
+    to_dict()/from_dict() 형식이 같으며, 다음 방식으로 인스턴스당 메모리를 줄입니다.
+
+    - slots 사용 (인스턴스 __dict__ 없음)
+    - 태그는 int 비트마스크(tag_mask)로 저장 (tags 속성은 frozenset 반환, add_tag/remove_tag로 변경)
+    - 비어 있는 예제/테스트 케이스는 공유 빈 튜플, 메타데이터는 처음 접근할 때 생성
+    - 반복되는 형식 문자열은 intern
+
+    from_dict()/from_problem()으로 만드는 것을 기본으로 합니다.
+    """
+    id: str = ""
+    title: str = ""
+    description: str = ""
+    difficulty: ProblemDifficulty = ProblemDifficulty.MEDIUM
+    platform: ProblemPlatform = ProblemPlatform.LOCAL
+    platform_problem_id: Optional[str] = None
+    platform_url: Optional[str] = None
+    time_limit: Optional[float] = None  # 초 단위
+    memory_limit: Optional[int] = None  # MB 단위
+    problem_statement: str = ""
+    input_format: str = ""
+    output_format: str = ""
+    constraints: str = ""
+    examples: Tuple[Dict[str, str], ...] = _EMPTY_TUPLE
+    test_cases: Tuple[ProblemTestCase, ...] = _EMPTY_TUPLE
+    tag_mask: int = 0
+    notes: str = ""
+    is_active: bool = True
+    # 지연 생성되는 메타데이터 (metadata 속성으로 접근)
+    _metadata: Optional[ProblemMetadata] = None
+
+    def __post_init__(self):
+        if not self.id:
+            self.id = str(uuid.uuid4())
+        self.input_format = sys.intern(self.input_format)
+        self.output_format = sys.intern(self.output_format)
+        self.constraints = sys.intern(self.constraints)
+        self.notes = sys.intern(self.notes)
+        self.examples = tuple(self.examples) if self.examples else _EMPTY_TUPLE
+        self.test_cases = tuple(self.test_cases) if self.test_cases else _EMPTY_TUPLE
+
+    @property
+    def tags(self) -> frozenset:
+        """태그 집합 (읽기 전용, 변경은 add_tag/remove_tag 사용)"""
+        return mask_to_tags(self.tag_mask)
+
+    @tags.setter
+    def tags(self, tags: Iterable[ProblemTag]) -> None:
+        self.tag_mask = tags_to_mask(tags)
+
+    @property
+    def metadata(self) -> ProblemMetadata:
+        """문제 메타데이터 (처음 접근할 때 생성)"""
+        if self._metadata is None:
+            self._metadata = ProblemMetadata()
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Optional[ProblemMetadata]) -> None:
+        self._metadata = metadata
+
+    def _effective_metadata(self) -> Optional[ProblemMetadata]:
+        """비교용 메타데이터 (지연 생성된 뒤 값이 없는 메타데이터는 없는 것으로 봄)"""
+        metadata = self._metadata
+        if metadata is None or (
+                not metadata.solved_count and not metadata.submission_count and not metadata.success_rate
+                and metadata.average_solve_time is None and not metadata.tags):
+            return None
+        return metadata
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name) for f in fields(self) if f.name != '_metadata'
+        ) and self._effective_metadata() == other._effective_metadata()
+
+    __hash__ = None
+
+    def has_tag(self, tag: ProblemTag) -> bool:
+        """태그 포함 여부"""
+        return bool(self.tag_mask & TAG_BITS[tag])
+
+    def add_tag(self, tag: ProblemTag):
+        """태그 추가"""
+        self.tag_mask |= TAG_BITS[tag]
+        self.metadata.tags.add(tag)
+
+    def remove_tag(self, tag: ProblemTag):
+        """태그 제거"""
+        self.tag_mask &= ~TAG_BITS[tag]
+        if self._metadata is not None:
+            self._metadata.tags.discard(tag)
+
+    def add_test_case(self, test_case: ProblemTestCase):
+        """테스트 케이스 추가"""
+        self.test_cases = self.test_cases + (test_case,)
+
+    def get_difficulty_score(self) -> int:
+        """난이도 점수 반환 (1-4)"""
+        return self.difficulty.get_numeric_value()
+
+    def is_suitable_for_user(self, user_level: int) -> bool:
+        """사용자 레벨에 적합한 문제인지 확인"""
+        return abs(self.get_difficulty_score() - user_level) <= 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (AlgorithmProblem.to_dict()와 같은 형식, 메타데이터를 생성하지 않음)"""
+        return self._to_problem(self._metadata or ProblemMetadata()).to_dict()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactProblem':
+        """딕셔너리로부터 객체 생성 (AlgorithmProblem.to_dict() 결과도 사용 가능)"""
+        compact = cls.from_problem(AlgorithmProblem.from_dicts([data])[0])
+        # 저장된 메타데이터가 없으면 지연 생성 상태로 둠
+        if not data.get('metadata'):
+            compact.metadata = None
+        return compact
+
+    @classmethod
+    def from_problem(cls, problem: AlgorithmProblem) -> 'CompactProblem':
+        """AlgorithmProblem을 변환합니다 (메타데이터/테스트 케이스 객체는 공유)."""
+        return cls(
+            **{f.name: getattr(problem, f.name) for f in fields(cls) if f.name not in ('tag_mask', '_metadata')},
+            tag_mask=tags_to_mask(problem.tags), _metadata=problem.metadata
+        )
+
+    def to_problem(self) -> AlgorithmProblem:
+        """일반 AlgorithmProblem으로 변환합니다 (메타데이터 객체는 공유)."""
+        return self._to_problem(self.metadata)
+
+    def _to_problem(self, metadata: ProblemMetadata) -> AlgorithmProblem:
+        problem = AlgorithmProblem(
+            **{f.name: getattr(self, f.name) for f in fields(self) if f.name not in ('tag_mask', '_metadata')},
+            metadata=metadata, tags=set(self.tags)
+        )
+        problem.examples = list(self.examples)
+        problem.test_cases = list(self.test_cases)
+        return problem
+
+    def to_json(self) -> str:
+        """JSON 문자열로 변환"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    @classmethod
+    def from_json(cls, json_str: str) -> 'CompactProblem':
+        """JSON 문자열로부터 객체 생성"""
+        return cls.from_dict(json.loads(json_str))
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"[{self.platform.name}] {self.title} ({self.difficulty.name})"
+
+    def __repr__(self) -> str:
+        """표현식"""
+        return f"CompactProblem(id='{self.id}', title='{self.title}', difficulty={self.difficulty})"
+
+
 class ProblemCollection:
-    """문제 컬렉션 관리 클래스"""
+    """문제 컬렉션 관리 클래스
+
+    난이도/플랫폼/태그별 문제 ID 인덱스를 추가/제거 시점에 갱신하므로 조건 조회는 전체 문제를 훑지 않고
+    인덱스 집합의 교집합으로 처리합니다. 컬렉션에 넣은 뒤 문제의 난이도나 태그를 바꾸면
+    update_problem()으로 인덱스를 다시 맞춰야 합니다.
+    """
 
     def __init__(self, name: str = "Default Collection"):
         self.name = name
@@ -337,11 +631,59 @@ class ProblemCollection:
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
 
+        # 보조 인덱스: 값 -> 문제 ID 집합
+        self._by_difficulty: Dict[ProblemDifficulty, Set[str]] = {}
+        self._by_platform: Dict[ProblemPlatform, Set[str]] = {}
+        self._by_tag: Dict[ProblemTag, Set[str]] = {}
+        # 문제 ID -> (추가 순서, 색인 당시 난이도, 플랫폼, 태그)
+        self._index_entries: Dict[str, Tuple[int, ProblemDifficulty, ProblemPlatform, frozenset]] = {}
+        self._sequence = 0
+
+    def _index_problem(self, problem_id: str, problem: AlgorithmProblem) -> None:
+        """문제를 보조 인덱스에 등록합니다."""
+        tags = frozenset(problem.tags)
+        self._index_entries[problem_id] = (self._sequence, problem.difficulty, problem.platform, tags)
+        self._sequence += 1
+
+        self._by_difficulty.setdefault(problem.difficulty, set()).add(problem_id)
+        self._by_platform.setdefault(problem.platform, set()).add(problem_id)
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(problem_id)
+
+    def _unindex_problem(self, problem_id: str) -> None:
+        """색인 당시 값으로 문제를 보조 인덱스에서 제거합니다."""
+        entry = self._index_entries.pop(problem_id, None)
+        if entry is None:
+            return
+
+        _, difficulty, platform, tags = entry
+        self._discard(self._by_difficulty, difficulty, problem_id)
+        self._discard(self._by_platform, platform, problem_id)
+        for tag in tags:
+            self._discard(self._by_tag, tag, problem_id)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], value: Any, problem_id: str) -> None:
+        ids = index.get(value)
+        if ids is not None:
+            ids.discard(problem_id)
+            if not ids:
+                del index[value]
+
+    def _ordered(self, problem_ids: Iterable[str], limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """문제 ID들을 추가 순서대로 정렬해 문제 목록으로 반환합니다."""
+        entries = self._index_entries
+        ordered_ids = sorted(problem_ids, key=lambda problem_id: entries[problem_id][0])
+        if limit is not None:
+            ordered_ids = ordered_ids[:limit]
+        return [self.problems[problem_id] for problem_id in ordered_ids]
+
     def add_problem(self, problem: AlgorithmProblem) -> bool:
         """문제 추가"""
         if problem.id in self.problems:
             return False
         self.problems[problem.id] = problem
+        self._index_problem(problem.id, problem)
         self.updated_at = datetime.now()
         return True
 
@@ -349,25 +691,76 @@ class ProblemCollection:
         """문제 제거"""
         if problem_id in self.problems:
             del self.problems[problem_id]
+            self._unindex_problem(problem_id)
             self.updated_at = datetime.now()
             return True
         return False
 
+    def update_problem(self, problem: AlgorithmProblem) -> None:
+        """문제를 추가하거나 교체하고 현재 난이도/플랫폼/태그로 인덱스를 다시 등록합니다."""
+        self._unindex_problem(problem.id)
+        self.problems[problem.id] = problem
+        self._index_problem(problem.id, problem)
+        self.updated_at = datetime.now()
+
     def get_problem(self, problem_id: str) -> Optional[AlgorithmProblem]:
         """문제 조회"""
         return self.problems.get(problem_id)
 
     def get_problems_by_difficulty(self, difficulty: ProblemDifficulty) -> List[AlgorithmProblem]:
         """난이도별 문제 조회"""
-        return [p for p in self.problems.values() if p.difficulty == difficulty]
+        return self._ordered(self._by_difficulty.get(difficulty, ()))
 
     def get_problems_by_platform(self, platform: ProblemPlatform) -> List[AlgorithmProblem]:
         """플랫폼별 문제 조회"""
-        return [p for p in self.problems.values() if p.platform == platform]
+        return self._ordered(self._by_platform.get(platform, ()))
 
     def get_problems_by_tag(self, tag: ProblemTag) -> List[AlgorithmProblem]:
         """태그별 문제 조회"""
-        return [p for p in self.problems.values() if tag in p.tags]
+        return self._ordered(self._by_tag.get(tag, ()))
+
+    def query(self,
+              difficulty: Union[ProblemDifficulty, Iterable[ProblemDifficulty], None] = None,
+              platform: Union[ProblemPlatform, Iterable[ProblemPlatform], None] = None,
+              any_tags: Optional[Iterable[ProblemTag]] = None,
+              all_tags: Optional[Iterable[ProblemTag]] = None,
+              exclude_ids: Optional[Collection[str]] = None,
+              limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """조건을 모두 만족하는 문제를 추가 순서대로 반환합니다.
+
+        difficulty/platform은 하나의 값 또는 값 목록(그중 하나)이고, any_tags는 태그 중 하나 이상,
+        all_tags는 모든 태그를 가진 문제를 뜻합니다. exclude_ids에 있는 문제(예: 이미 푼 문제)는 제외합니다.
+        지정한 조건의 인덱스 집합을 작은 것부터 교집합하므로 비용은 후보 집합 크기에 비례합니다.
+        """
+        candidate_sets: List[Set[str]] = []
+
+        def any_of(index: Dict[Any, Set[str]], values) -> Set[str]:
+            if isinstance(values, Enum):
+                return index.get(values, set())
+            sets = [index[value] for value in values if value in index]
+            if len(sets) == 1:
+                return sets[0]
+            return set().union(*sets)
+
+        if difficulty is not None:
+            candidate_sets.append(any_of(self._by_difficulty, difficulty))
+        if platform is not None:
+            candidate_sets.append(any_of(self._by_platform, platform))
+        if any_tags is not None:
+            candidate_sets.append(any_of(self._by_tag, list(any_tags)))
+        if all_tags is not None:
+            candidate_sets.extend(self._by_tag.get(tag, set()) for tag in all_tags)
+
+        if candidate_sets:
+            candidate_sets.sort(key=len)
+            problem_ids = candidate_sets[0].intersection(*candidate_sets[1:])
+        else:
+            problem_ids = set(self.problems)
+
+        if exclude_ids:
+            problem_ids.difference_update(exclude_ids)
+
+        return self._ordered(problem_ids, limit)
 
     def get_all_problems(self) -> List[AlgorithmProblem]:
         """모든 문제 조회"""
@@ -393,9 +786,10 @@ class ProblemCollection:
         collection.created_at = datetime.fromisoformat(data.get('created_at', datetime.now().isoformat()))
         collection.updated_at = datetime.fromisoformat(data.get('updated_at', datetime.now().isoformat()))
 
-        for pid, problem_data in data.get('problems', {}).items():
-            problem = AlgorithmProblem.from_dict(problem_data)
+        problems_data = data.get('problems', {})
+        for pid, problem in zip(problems_data, AlgorithmProblem.from_dicts(problems_data.values())):
             collection.problems[pid] = problem
+            collection._index_problem(pid, problem)
 
         return collection
 
@@ -0,0 +1,412 @@
+"""
+문제 본문 하이드레이션 모듈
+
+이 모듈은 원격 플랫폼에서 가져온 문제의 비어 있는 본문(문제 설명, 입출력 형식, 예제)을
+일괄로 채우는 파이프라인을 제공합니다. 문제 페이지 HTML을 제한된 병렬도로 내려받아
+파싱한 뒤 프로바이더 캐시에 저장하며, 체크포인트 파일로 중단된 작업을 이어서 진행할 수 있습니다.
+
+HTML 파서는 네트워크 없이 문자열만으로 동작하므로 저장해 둔 HTML로도 파싱 결과를 확인할 수 있습니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from .problem_data_structures import AlgorithmProblem, ProblemPlatform, ProblemTestCase
+except ImportError:
+    from problem_data_structures import AlgorithmProblem, ProblemPlatform, ProblemTestCase
+
+
+logger = logging.getLogger(__name__)
+
+
+class _HTMLNode:
+    """파싱된 HTML 요소"""
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional['_HTMLNode'] = None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children: List[Any] = []  # _HTMLNode 또는 텍스트 문자열
+
+    @property
+    def classes(self) -> List[str]:
+        return self.attrs.get('class', '').split()
+
+    def find_all(self, tag: Optional[str] = None, class_name: Optional[str] = None) -> List['_HTMLNode']:
+        """조건에 맞는 하위 요소들을 문서 순서대로 반환합니다."""
+        found = []
+        for child in self.children:
+            if not isinstance(child, _HTMLNode):
+                continue
+            if (tag is None or child.tag == tag) and (class_name is None or class_name in child.classes):
+                found.append(child)
+            found.extend(child.find_all(tag, class_name))
+        return found
+
+    def find(self, tag: Optional[str] = None, class_name: Optional[str] = None) -> Optional['_HTMLNode']:
+        """조건에 맞는 첫 번째 하위 요소를 반환합니다."""
+        found = self.find_all(tag, class_name)
+        return found[0] if found else None
+
+    def get_text(self) -> str:
+        """요소의 텍스트를 줄바꿈 구조를 유지하여 반환합니다."""
+        parts: List[str] = []
+        self._collect_text(parts)
+        return ''.join(parts)
+
+    def _collect_text(self, parts: List[str], preformatted: bool = False) -> None:
+        for child in self.children:
+            if isinstance(child, str):
+                # pre 밖의 줄바꿈만 있는 공백은 HTML 들여쓰기이므로 무시
+                if preformatted or child.strip() or '\n' not in child:
+                    parts.append(child)
+                continue
+
+            if child.tag == 'br':
+                parts.append('\n')
+            elif child.tag == 'sup':
+                parts.append('^')
+
+            child._collect_text(parts, preformatted or child.tag == 'pre')
+
+            # 블록 요소 뒤에는 줄바꿈 (Codeforces 예제의 줄 단위 div 포함)
+            if child.tag in _BLOCK_TAGS and parts and not parts[-1].endswith('\n'):
+                parts.append('\n')
+
+
+_VOID_TAGS = {'br', 'img', 'hr', 'input', 'meta', 'link', 'col', 'source', 'wbr'}
+_BLOCK_TAGS = {'p', 'div', 'li', 'pre', 'ul', 'ol', 'h1', 'h2', 'h3', 'h4', 'tr', 'table'}
+
+
+class _TreeBuilder(HTMLParser):
+    """HTML 문자열로부터 _HTMLNode 트리를 만드는 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _HTMLNode('document', {})
+        self._current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = _HTMLNode(tag, {name: value or '' for name, value in attrs}, self._current)
+        self._current.children.append(node)
+        if tag not in _VOID_TAGS:
+            self._current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self._current.children.append(_HTMLNode(tag, {name: value or '' for name, value in attrs}, self._current))
+
+    def handle_endtag(self, tag):
+        # 닫히지 않은 요소(p, li 등)는 짝이 맞는 상위 요소까지 닫기
+        node = self._current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self._current = node.parent
+
+    def handle_data(self, data):
+        self._current.children.append(data)
+
+
+def _parse_html(html: str) -> _HTMLNode:
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def _clean_text(text: str) -> str:
+    """줄 끝 공백과 연속된 빈 줄을 정리합니다."""
+    lines = [line.rstrip() for line in text.replace('\xa0', ' ').splitlines()]
+    return re.sub(r'\n{3,}', '\n\n', '\n'.join(lines)).strip()
+
+
+def _section_text(section: Optional[_HTMLNode], title_class: str = 'section-title') -> str:
+    """섹션 제목을 제외한 본문 텍스트를 반환합니다."""
+    if section is None:
+        return ''
+    parts = [
+        child.get_text() if isinstance(child, _HTMLNode) else child
+        for child in section.children
+        if not (isinstance(child, _HTMLNode) and title_class in child.classes)
+    ]
+    return _clean_text('\n'.join(parts))
+
+
+def _parse_limit(node: Optional[_HTMLNode]) -> Optional[float]:
+    """'time limit per test 2 seconds' 같은 제한 값에서 숫자를 추출합니다."""
+    if node is None:
+        return None
+    match = re.search(r'(\d+(?:\.\d+)?)', _section_text(node, 'property-title'))
+    return float(match.group(1)) if match else None
+
+
+def parse_codeforces_statement(html: str) -> Dict[str, Any]:
+    """Codeforces 문제 페이지 HTML에서 본문과 예제를 추출합니다."""
+    root = _parse_html(html)
+    statement = root.find('div', 'problem-statement')
+    if statement is None:
+        raise ValueError("Codeforces 문제 본문을 찾을 수 없습니다")
+
+    # 헤더와 입출력/예제/노트 섹션을 제외한 첫 div가 문제 설명
+    section_classes = {'header', 'input-specification', 'output-specification', 'sample-tests', 'note'}
+    legend = next(
+        (child for child in statement.children
+         if isinstance(child, _HTMLNode) and child.tag == 'div' and not section_classes & set(child.classes)),
+        None
+    )
+
+    examples = []
+    for sample in statement.find_all('div', 'sample-test'):
+        inputs = [_clean_text(node.find('pre').get_text()) for node in sample.find_all('div', 'input')
+                  if node.find('pre')]
+        outputs = [_clean_text(node.find('pre').get_text()) for node in sample.find_all('div', 'output')
+                   if node.find('pre')]
+        for input_text, output_text in zip(inputs, outputs):
+            examples.append({'input': input_text, 'output': output_text, 'explanation': ''})
+
+    time_limit = _parse_limit(statement.find('div', 'time-limit'))
+    memory_limit = _parse_limit(statement.find('div', 'memory-limit'))
+
+    return {
+        'problem_statement': _section_text(legend),
+        'input_format': _section_text(statement.find('div', 'input-specification')),
+        'output_format': _section_text(statement.find('div', 'output-specification')),
+        'constraints': '',
+        'examples': examples,
+        'notes': _section_text(statement.find('div', 'note')),
+        'time_limit': time_limit,
+        'memory_limit': int(memory_limit) if memory_limit is not None else None
+    }
+
+
+_LEETCODE_EXAMPLE_PATTERN = re.compile(r'^\s*Example\s*\d*\s*:\s*$', re.MULTILINE)
+_LEETCODE_CONSTRAINTS_PATTERN = re.compile(r'^\s*Constraints\s*:\s*$', re.MULTILINE)
+_LEETCODE_FOLLOW_UP_PATTERN = re.compile(r'^\s*Follow[- ]up\b', re.MULTILINE | re.IGNORECASE)
+_LEETCODE_IO_PATTERN = re.compile(
+    r'Input\s*:\s*(?P<input>.*?)\s*Output\s*:\s*(?P<output>.*?)(?:\s*Explanation\s*:\s*(?P<explanation>.*))?$',
+    re.DOTALL
+)
+
+
+def parse_leetcode_statement(html: str) -> Dict[str, Any]:
+    """LeetCode 문제 본문(question.content) HTML에서 설명, 예제, 제약 조건을 추출합니다."""
+    text = _clean_text(_parse_html(html).get_text())
+    if not text:
+        raise ValueError("LeetCode 문제 본문이 비어 있습니다")
+
+    constraints = ''
+    constraints_match = _LEETCODE_CONSTRAINTS_PATTERN.search(text)
+    if constraints_match:
+        constraints = text[constraints_match.end():]
+        text = text[:constraints_match.start()]
+        follow_up_match = _LEETCODE_FOLLOW_UP_PATTERN.search(constraints)
+        if follow_up_match:
+            constraints = constraints[:follow_up_match.start()]
+
+    blocks = _LEETCODE_EXAMPLE_PATTERN.split(text)
+    examples = []
+    for block in blocks[1:]:
+        match = _LEETCODE_IO_PATTERN.search(block.strip())
+        if match:
+            examples.append({
+                'input': match.group('input').strip(),
+                'output': match.group('output').strip(),
+                'explanation': _clean_text(match.group('explanation') or '')
+            })
+
+    return {
+        'problem_statement': _clean_text(blocks[0]),
+        'input_format': '',
+        'output_format': '',
+        'constraints': _clean_text(constraints),
+        'examples': examples
+    }
+
+
+STATEMENT_PARSERS: Dict[ProblemPlatform, Callable[[str], Dict[str, Any]]] = {
+    ProblemPlatform.CODEFORCES: parse_codeforces_statement,
+    ProblemPlatform.LEETCODE: parse_leetcode_statement
+}
+
+
+def parse_statement(platform: ProblemPlatform, html: str) -> Dict[str, Any]:
+    """플랫폼에 맞는 파서로 문제 본문 HTML을 파싱합니다."""
+    parser = STATEMENT_PARSERS.get(platform)
+    if parser is None:
+        raise ValueError(f"본문 파서를 지원하지 않는 플랫폼: {platform}")
+    return parser(html)
+
+
+def apply_statement(problem: AlgorithmProblem, statement: Dict[str, Any]) -> AlgorithmProblem:
+    """파싱된 본문을 문제에 적용하고 예제로부터 테스트 케이스를 만듭니다."""
+    for field_name in ('problem_statement', 'input_format', 'output_format', 'constraints'):
+        if statement.get(field_name):
+            setattr(problem, field_name, statement[field_name])
+
+    # 변환 시 기록된 메모(Rating 등)는 유지하고 본문의 노트를 덧붙임 (여러 번 적용해도 한 번만 추가)
+    statement_notes = statement.get('notes')
+    if statement_notes and statement_notes not in problem.notes:
+        problem.notes = f"{problem.notes}\n\n{statement_notes}" if problem.notes else statement_notes
+    if statement.get('time_limit'):
+        problem.time_limit = statement['time_limit']
+    if statement.get('memory_limit'):
+        problem.memory_limit = statement['memory_limit']
+
+    examples = statement.get('examples') or []
+    if examples:
+        problem.examples = examples
+        if not problem.test_cases:
+            problem.test_cases = [
+                ProblemTestCase(
+                    input_data=example['input'],
+                    expected_output=example['output'],
+                    description=example.get('explanation') or None,
+                    time_limit=problem.time_limit,
+                    memory_limit=problem.memory_limit
+                )
+                for example in examples
+            ]
+
+    return problem
+
+
+class HydrationCheckpoint:
+    """하이드레이션 진행 상황 체크포인트 (JSON 파일)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.completed: set = set()
+        self.failed: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.completed = set(data.get('completed', []))
+                self.failed = data.get('failed', {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"체크포인트 읽기 실패, 처음부터 시작합니다 ({path}): {e}")
+
+    def mark_completed(self, problem_id: str) -> None:
+        with self._lock:
+            self.completed.add(problem_id)
+            self.failed.pop(problem_id, None)
+
+    def mark_failed(self, problem_id: str, error: str) -> None:
+        with self._lock:
+            self.failed[problem_id] = error
+
+    def save(self) -> None:
+        """체크포인트를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장합니다."""
+        if not self.path:
+            return
+
+        with self._lock:
+            data = {'completed': sorted(self.completed), 'failed': dict(self.failed)}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+
+class ProblemHydrator:
+    """문제 본문 일괄 하이드레이션 파이프라인"""
+
+    def __init__(self, provider, checkpoint_path: Optional[str] = None,
+                 max_workers: int = 4, checkpoint_interval: int = 20):
+        self.provider = provider
+        self.max_workers = max_workers
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint = HydrationCheckpoint(checkpoint_path)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def hydrate(self, problems: Iterable[AlgorithmProblem], resume: bool = True,
+                on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, int]:
+        """문제 본문을 병렬로 가져와 파싱하고 프로바이더 캐시에 저장합니다.
+
+        resume이 True이면 체크포인트에 완료로 기록되었거나 이미 캐시된 문제는 건너뜁니다.
+        처리 결과 개수(hydrated, skipped, failed)를 반환합니다.
+        """
+        pending = []
+        skipped = 0
+        hydrated_ids = self.provider.get_hydrated_problem_ids() if resume else set()
+        for problem in problems:
+            problem_id = problem.platform_problem_id
+            if not problem_id:
+                continue
+            if resume and (problem_id in hydrated_ids or problem_id in self.checkpoint.completed):
+                skipped += 1
+                continue
+            if resume and self.provider.get_cached_statement(problem_id) is not None:
+                # 본문 인덱스가 생기기 전에 저장된 본문은 인덱스에 등록만 함
+                self.provider.register_statement(problem_id)
+                skipped += 1
+                continue
+            pending.append(problem)
+
+        stats = {'hydrated': 0, 'skipped': skipped, 'failed': 0}
+        if not pending:
+            self.provider.flush_statement_index()
+            return stats
+
+        self.logger.info(f"본문 하이드레이션 시작: {len(pending)}개 (건너뜀 {skipped}개)")
+
+        processed = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hydration") as executor:
+            futures = {executor.submit(self._hydrate_one, problem): problem for problem in pending}
+            try:
+                for future in as_completed(futures):
+                    problem_id = futures[future].platform_problem_id
+                    error = future.exception() or future.result()
+                    if error:
+                        self.checkpoint.mark_failed(problem_id, str(error))
+                        stats['failed'] += 1
+                    else:
+                        self.checkpoint.mark_completed(problem_id)
+                        stats['hydrated'] += 1
+
+                    processed += 1
+                    if processed % self.checkpoint_interval == 0:
+                        self._save_progress()
+                    if on_progress:
+                        on_progress(processed, len(pending))
+            finally:
+                # 중단되더라도 그때까지의 진행 상황은 저장
+                for future in futures:
+                    future.cancel()
+                self._save_progress()
+
+        self.logger.info(f"본문 하이드레이션 완료: 성공 {stats['hydrated']}개, 실패 {stats['failed']}개")
+        return stats
+
+    def _save_progress(self) -> None:
+        """체크포인트와 프로바이더의 본문 인덱스를 함께 저장합니다."""
+        self.provider.flush_statement_index()
+        self.checkpoint.save()
+
+    def _hydrate_one(self, problem: AlgorithmProblem) -> Optional[str]:
+        """문제 하나의 본문을 가져와 저장합니다. 실패 시 오류 메시지를 반환합니다."""
+        html = self.provider.fetch_statement_html(problem)
+        if not html:
+            return "본문을 가져오지 못했습니다"
+
+        try:
+            statement = parse_statement(problem.platform, html)
+        except ValueError as e:
+            return str(e)
+
+        self.provider.save_statement(problem.platform_problem_id, statement)
+        apply_statement(problem, statement)
+        return None
@@ -0,0 +1,164 @@
+"""
+비트셋 기반 문제 질의 엔진
+
+이 모듈은 문제 목록의 각 문제에 0부터 시작하는 위치 번호를 붙이고, 난이도/플랫폼/태그별 소속을
+파이썬 정수 비트셋으로 저장하는 질의 엔진을 제공합니다. 위치 i의 문제가 조건을 만족하면 i번째 비트가 1입니다.
+
+"MEDIUM 이면서 DP 또는 GRAPH 태그, 푼 문제 제외" 같은 질의는 몇 번의 정수 AND/OR/AND-NOT 연산으로
+계산되므로 수만 개의 문제에서도 마이크로초 단위로 끝나며, 결과 비트셋을 문제 목록으로 바꿀 때만
+결과 크기에 비례하는 비용이 듭니다.
+"""
+
+import operator
+import random
+from typing import Any, Collection, Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    from .problem_data_structures import AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
+except ImportError:
+    from problem_data_structures import AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
+
+
+# 바이트 값 -> 1인 비트 위치
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+class ProblemQueryEngine:
+    """난이도/플랫폼/태그 비트셋으로 문제를 조회하는 질의 엔진
+
+    문제 목록이 바뀌면 새로 만들어야 합니다 (matches()로 같은 목록인지 확인).
+    """
+
+    def __init__(self, problems: Sequence[AlgorithmProblem]):
+        self._problems: List[AlgorithmProblem] = list(problems)
+        self._size = len(self._problems)
+        self._nbytes = (self._size + 7) // 8
+        self.all_mask = (1 << self._size) - 1
+
+        self._positions: Dict[str, int] = {}
+        buffers: Dict[Any, bytearray] = {}
+
+        def set_bit(key: Any, position: int) -> None:
+            buffer = buffers.get(key)
+            if buffer is None:
+                buffer = buffers[key] = bytearray(self._nbytes)
+            buffer[position >> 3] |= 1 << (position & 7)
+
+        for position, problem in enumerate(self._problems):
+            self._positions.setdefault(problem.id, position)
+            set_bit(problem.difficulty, position)
+            set_bit(problem.platform, position)
+            for tag in problem.tags:
+                set_bit(tag, position)
+
+        masks = {key: int.from_bytes(buffer, 'little') for key, buffer in buffers.items()}
+        self._difficulty_masks = {key: mask for key, mask in masks.items() if isinstance(key, ProblemDifficulty)}
+        self._platform_masks = {key: mask for key, mask in masks.items() if isinstance(key, ProblemPlatform)}
+        self._tag_masks = {key: mask for key, mask in masks.items() if isinstance(key, ProblemTag)}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def matches(self, problems: Sequence[AlgorithmProblem]) -> bool:
+        """엔진을 만든 문제 목록과 같은 목록인지 확인합니다.
+
+        문제 객체의 내용은 비교하지 않고 위치별 문제 객체의 동일성만 확인합니다 (5만 개에서 약 1ms).
+        같은 목록 객체에서 원소를 바꾼 경우도 감지합니다.
+        """
+        return len(problems) == self._size and all(map(operator.is_, problems, self._problems))
+
+    def difficulty_mask(self, difficulties: Union[ProblemDifficulty, Iterable[ProblemDifficulty]]) -> int:
+        """난이도 중 하나에 해당하는 문제의 비트셋"""
+        return self._any_mask(self._difficulty_masks, difficulties)
+
+    def platform_mask(self, platforms: Union[ProblemPlatform, Iterable[ProblemPlatform]]) -> int:
+        """플랫폼 중 하나에 해당하는 문제의 비트셋"""
+        return self._any_mask(self._platform_masks, platforms)
+
+    def tag_mask(self, tags: Union[ProblemTag, Iterable[ProblemTag]]) -> int:
+        """태그 중 하나 이상을 가진 문제의 비트셋"""
+        return self._any_mask(self._tag_masks, tags)
+
+    def ids_mask(self, problem_ids: Iterable[str]) -> int:
+        """문제 ID 목록에 해당하는 문제의 비트셋 (엔진에 없는 ID는 무시)"""
+        buffer = bytearray(self._nbytes)
+        positions = self._positions
+        for problem_id in problem_ids:
+            position = positions.get(problem_id)
+            if position is not None:
+                buffer[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(buffer, 'little')
+
+    @staticmethod
+    def _any_mask(masks: Dict[Any, int], values) -> int:
+        if values is None:
+            return 0
+        if not isinstance(values, (list, tuple, set, frozenset)) and values in masks:
+            return masks[values]
+        mask = 0
+        for value in values:
+            mask |= masks.get(value, 0)
+        return mask
+
+    def query_mask(self,
+                   difficulty: Union[ProblemDifficulty, Iterable[ProblemDifficulty], None] = None,
+                   platform: Union[ProblemPlatform, Iterable[ProblemPlatform], None] = None,
+                   any_tags: Optional[Iterable[ProblemTag]] = None,
+                   all_tags: Optional[Iterable[ProblemTag]] = None,
+                   exclude_mask: int = 0) -> int:
+        """조건을 모두 만족하는 문제의 비트셋을 계산합니다.
+
+        difficulty/platform은 하나의 값 또는 값 목록(그중 하나), any_tags는 태그 중 하나 이상,
+        all_tags는 모든 태그를 뜻합니다. exclude_mask(예: ids_mask(푼 문제))의 문제는 제외합니다.
+        """
+        mask = self.all_mask
+        if difficulty is not None:
+            mask &= self.difficulty_mask(difficulty)
+        if platform is not None:
+            mask &= self.platform_mask(platform)
+        if any_tags is not None:
+            mask &= self.tag_mask(any_tags)
+        if all_tags is not None:
+            for tag in all_tags:
+                mask &= self._tag_masks.get(tag, 0)
+        if exclude_mask:
+            mask &= ~exclude_mask
+        return mask
+
+    def count(self, mask: int) -> int:
+        """비트셋에 포함된 문제 수"""
+        return mask.bit_count()
+
+    def positions(self, mask: int) -> List[int]:
+        """비트셋에 포함된 문제의 위치를 오름차순으로 반환합니다."""
+        result = []
+        for byte_index, value in enumerate(mask.to_bytes(self._nbytes, 'little')):
+            if value:
+                base = byte_index << 3
+                result.extend(base + bit for bit in _BYTE_BITS[value])
+        return result
+
+    def problems(self, mask: int, limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """비트셋에 포함된 문제를 원래 순서대로 반환합니다."""
+        positions = self.positions(mask)
+        if limit is not None:
+            positions = positions[:limit]
+        return [self._problems[position] for position in positions]
+
+    def sample(self, mask: int, count: int, rng: Optional[random.Random] = None) -> List[AlgorithmProblem]:
+        """비트셋에 포함된 문제 중 count개를 무작위로 고릅니다."""
+        positions = self.positions(mask)
+        chosen = (rng or random).sample(positions, min(count, len(positions)))
+        return [self._problems[position] for position in chosen]
+
+    def query(self,
+              difficulty: Union[ProblemDifficulty, Iterable[ProblemDifficulty], None] = None,
+              platform: Union[ProblemPlatform, Iterable[ProblemPlatform], None] = None,
+              any_tags: Optional[Iterable[ProblemTag]] = None,
+              all_tags: Optional[Iterable[ProblemTag]] = None,
+              exclude_ids: Optional[Collection[str]] = None,
+              limit: Optional[int] = None) -> List[AlgorithmProblem]:
+        """query_mask로 조건에 맞는 문제를 찾아 목록으로 반환합니다."""
+        exclude_mask = self.ids_mask(exclude_ids) if exclude_ids else 0
+        mask = self.query_mask(difficulty, platform, any_tags, all_tags, exclude_mask)
+        return self.problems(mask, limit)
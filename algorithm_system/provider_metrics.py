@@ -0,0 +1,242 @@
+"""
+프로바이더 메트릭
+
+이 모듈은 원격 문제 프로바이더의 캐시 적중/실패, 요청 지연 시간, 다운로드 크기, 변환 시간,
+플랫폼별 오류율을 수집하는 메트릭 레지스트리를 제공합니다.
+
+수집한 값은 snapshot() / get_platform_summary()로 직접 조회하거나,
+render_prometheus()의 Prometheus 텍스트 형식으로 내보낼 수 있습니다.
+start_metrics_server()를 호출하면 /metrics 엔드포인트를 제공하는 HTTP 서버를 백그라운드에서 실행합니다.
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .request_layer import LatencyHistogram
+except ImportError:
+    from request_layer import LatencyHistogram
+
+
+logger = logging.getLogger(__name__)
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 ** 2, 10 * 1024 ** 2, 100 * 1024 ** 2)
+# 캐시 TTL 조정용: 1분, 5분, 15분, 1시간, 6시간, 1일, 1주
+CACHE_AGE_BUCKETS = (60, 300, 900, 3600, 6 * 3600, 24 * 3600, 7 * 24 * 3600)
+
+# 이름 -> (종류, 설명, 히스토그램 버킷)
+PROVIDER_METRICS: Dict[str, Tuple[str, str, Optional[Tuple[float, ...]]]] = {
+    'focus_timer_provider_cache_hits_total': (
+        'counter', "캐시 적중 횟수 (layer: memory, disk, stale)", None),
+    'focus_timer_provider_cache_misses_total': (
+        'counter', "캐시 실패 횟수", None),
+    'focus_timer_provider_cache_age_seconds': (
+        'histogram', "적중한 디스크 캐시 항목의 나이", CACHE_AGE_BUCKETS),
+    'focus_timer_provider_requests_total': (
+        'counter', "원격 요청 수 (outcome: success, http_error, exception)", None),
+    'focus_timer_provider_request_seconds': (
+        'histogram', "원격 요청 지연 시간", SECONDS_BUCKETS),
+    'focus_timer_provider_response_bytes': (
+        'histogram', "응답 본문 크기", BYTES_BUCKETS),
+    'focus_timer_provider_conversion_seconds': (
+        'histogram', "원본 레코드 묶음 변환 시간", SECONDS_BUCKETS),
+    'focus_timer_provider_problems_converted_total': (
+        'counter', "변환된 문제 수", None),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(label_key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(label_key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + '}'
+
+
+def _format_number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class MetricsRegistry:
+    """레이블별 카운터와 히스토그램을 보관하는 스레드 안전 레지스트리"""
+
+    def __init__(self, definitions: Optional[Dict[str, Tuple[str, str, Optional[Tuple[float, ...]]]]] = None):
+        self._definitions = dict(definitions or {})
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def define(self, name: str, metric_type: str, help_text: str = "",
+               buckets: Optional[Tuple[float, ...]] = None) -> None:
+        """메트릭을 정의합니다. metric_type은 'counter' 또는 'histogram'입니다."""
+        if metric_type not in ('counter', 'histogram'):
+            raise ValueError(f"지원하지 않는 메트릭 종류: {metric_type}")
+        with self._lock:
+            self._definitions[name] = (metric_type, help_text, buckets)
+
+    def inc(self, name: str, amount: float = 1.0, **labels) -> None:
+        """카운터를 증가시킵니다."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """히스토그램에 관측값을 기록합니다."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                buckets = self._definitions.get(name, ('histogram', '', None))[2]
+                histogram = series[key] = LatencyHistogram(buckets or SECONDS_BUCKETS)
+        histogram.observe(value)
+
+    def reset(self) -> None:
+        """수집한 값을 모두 지웁니다 (정의는 유지)."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """모든 메트릭의 현재 값을 반환합니다."""
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: dict(series) for name, series in self._histograms.items()}
+
+        return {
+            'counters': {
+                name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                for name, series in counters.items()
+            },
+            'histograms': {
+                name: [{'labels': dict(key), **histogram.snapshot()} for key, histogram in series.items()]
+                for name, series in histograms.items()
+            }
+        }
+
+    def get_platform_summary(self, platform: str) -> Dict[str, Any]:
+        """플랫폼의 캐시 적중률, 요청 수, 오류율, 평균 지연 시간 등을 요약합니다."""
+        snapshot = self.snapshot()
+
+        def counter_total(name: str, **match) -> float:
+            return sum(
+                sample['value'] for sample in snapshot['counters'].get(name, [])
+                if sample['labels'].get('platform') == platform
+                and all(sample['labels'].get(label) == value for label, value in match.items())
+            )
+
+        def histogram_summary(name: str) -> Dict[str, float]:
+            count, total = 0, 0.0
+            for sample in snapshot['histograms'].get(name, []):
+                if sample['labels'].get('platform') == platform:
+                    count += sample['count']
+                    total += sample['sum']
+            return {'count': count, 'sum': total, 'mean': total / count if count else 0.0}
+
+        hits = counter_total('focus_timer_provider_cache_hits_total')
+        misses = counter_total('focus_timer_provider_cache_misses_total')
+        requests_total = counter_total('focus_timer_provider_requests_total')
+        errors = requests_total - counter_total('focus_timer_provider_requests_total', outcome='success')
+
+        return {
+            'cache_hits': {
+                layer: counter_total('focus_timer_provider_cache_hits_total', layer=layer)
+                for layer in ('memory', 'disk', 'stale')
+            },
+            'cache_misses': misses,
+            'cache_hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'cache_age_seconds': histogram_summary('focus_timer_provider_cache_age_seconds'),
+            'requests': requests_total,
+            'errors': errors,
+            'error_rate': errors / requests_total if requests_total else 0.0,
+            'request_seconds': histogram_summary('focus_timer_provider_request_seconds'),
+            'response_bytes': histogram_summary('focus_timer_provider_response_bytes'),
+            'conversion_seconds': histogram_summary('focus_timer_provider_conversion_seconds'),
+            'problems_converted': counter_total('focus_timer_provider_problems_converted_total')
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식(0.0.4)으로 변환합니다."""
+        with self._lock:
+            definitions = dict(self._definitions)
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: dict(series) for name, series in self._histograms.items()}
+
+        lines = []
+        for name in sorted(set(counters) | set(histograms)):
+            metric_type, help_text, _ = definitions.get(
+                name, ('counter' if name in counters else 'histogram', '', None)
+            )
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+            for key, value in sorted(counters.get(name, {}).items()):
+                lines.append(f"{name}{_format_labels(key)} {_format_number(value)}")
+
+            for key, histogram in sorted(histograms.get(name, {}).items()):
+                data = histogram.snapshot()
+                for upper_bound, count in data['buckets']:
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', _format_number(upper_bound)))} {count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {_format_number(data['sum'])}")
+                lines.append(f"{name}_count{_format_labels(key)} {data['count']}")
+
+        return '\n'.join(lines) + '\n'
+
+
+_default_registry: Optional[MetricsRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_metrics() -> MetricsRegistry:
+    """프로바이더들이 공유하는 기본 메트릭 레지스트리를 반환합니다."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = MetricsRegistry(PROVIDER_METRICS)
+        return _default_registry
+
+
+def start_metrics_server(port: int = 9464, host: str = "127.0.0.1",
+                         registry: Optional[MetricsRegistry] = None) -> ThreadingHTTPServer:
+    """/metrics 경로로 Prometheus 텍스트를 제공하는 HTTP 서버를 데몬 스레드에서 시작합니다.
+
+    반환된 서버의 shutdown()으로 종료할 수 있습니다. port가 0이면 임의의 빈 포트를 사용합니다.
+    """
+    registry = registry or get_default_metrics()
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"메트릭 엔드포인트 시작: http://{host}:{server.server_address[1]}/metrics")
+    return server
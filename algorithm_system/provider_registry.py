@@ -0,0 +1,136 @@
+"""
+문제 프로바이더 레지스트리
+
+이 모듈은 플랫폼별 문제 프로바이더 팩토리를 등록하고, 실제로 사용할 때 처음 한 번만 인스턴스를 만드는
+레지스트리를 제공합니다. RemoteProblemManager는 생성 시 프로바이더를 만들지 않으므로
+세션/캐시 디렉터리/인증 파일 처리 비용은 사용하는 플랫폼에 대해서만 발생합니다.
+
+외부 패키지는 모듈을 수정하지 않고 엔트리 포인트로 프로바이더를 추가할 수 있습니다.
+엔트리 포인트 이름은 ProblemPlatform 멤버 이름(대소문자 무관)이고, 값은 프로바이더 클래스나
+팩토리 함수입니다. 팩토리는 cache_dir와 캐시 옵션(cache_format, cache_compression, cache_layout)을
+키워드 인자로 받습니다.
+
+    # pyproject.toml
+    [project.entry-points."focus_timer.problem_providers"]
+    atcoder = "focus_timer_atcoder:AtCoderProvider"
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    from importlib.metadata import EntryPoint, entry_points
+except ImportError:  # Python 3.7 이하
+    EntryPoint = None
+    entry_points = None
+
+try:
+    from .problem_data_structures import ProblemPlatform
+except ImportError:
+    from problem_data_structures import ProblemPlatform
+
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "focus_timer.problem_providers"
+
+ProviderFactory = Callable[..., Any]
+
+# 플랫폼 -> 팩토리 또는 아직 로드하지 않은 엔트리 포인트
+_registry: Dict[ProblemPlatform, Union[ProviderFactory, 'EntryPoint']] = {}
+_registry_lock = threading.Lock()
+_entry_points_discovered = False
+
+
+def register_provider(platform: ProblemPlatform, factory: Optional[ProviderFactory] = None):
+    """플랫폼의 프로바이더 팩토리를 등록합니다. 같은 플랫폼을 다시 등록하면 교체됩니다.
+
+    factory를 생략하면 클래스 데코레이터로 사용할 수 있습니다.
+    """
+    if factory is None:
+        def decorator(cls):
+            register_provider(platform, cls)
+            return cls
+        return decorator
+
+    with _registry_lock:
+        _registry[platform] = factory
+    return factory
+
+
+def unregister_provider(platform: ProblemPlatform) -> None:
+    """플랫폼 등록을 해제합니다."""
+    with _registry_lock:
+        _registry.pop(platform, None)
+
+
+def _entry_point_platform(name: str) -> Optional[ProblemPlatform]:
+    try:
+        return ProblemPlatform[name.upper()]
+    except KeyError:
+        return None
+
+
+def discover_entry_points() -> None:
+    """엔트리 포인트로 설치된 프로바이더를 찾아 등록합니다 (모듈은 처음 사용할 때 로드).
+
+    직접 register_provider로 등록한 플랫폼은 엔트리 포인트보다 우선합니다.
+    """
+    global _entry_points_discovered
+    if _entry_points_discovered or entry_points is None:
+        return
+
+    try:
+        found = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python 3.8~3.9: 그룹별 딕셔너리 반환
+        found = entry_points().get(ENTRY_POINT_GROUP, [])
+    except Exception as e:
+        logger.warning(f"프로바이더 엔트리 포인트 검색 실패: {e}")
+        found = []
+
+    with _registry_lock:
+        for entry_point in found:
+            platform = _entry_point_platform(entry_point.name)
+            if platform is None:
+                logger.warning(f"알 수 없는 플랫폼의 프로바이더 엔트리 포인트: {entry_point.name}")
+                continue
+            _registry.setdefault(platform, entry_point)
+        _entry_points_discovered = True
+
+
+def get_provider_factory(platform: ProblemPlatform) -> Optional[ProviderFactory]:
+    """플랫폼의 팩토리를 반환합니다. 엔트리 포인트는 이때 처음 로드됩니다."""
+    discover_entry_points()
+
+    with _registry_lock:
+        factory = _registry.get(platform)
+
+    if EntryPoint is not None and isinstance(factory, EntryPoint):
+        try:
+            loaded = factory.load()
+        except Exception as e:
+            logger.error(f"프로바이더 엔트리 포인트 로드 실패 ({factory.value}): {e}")
+            return None
+        with _registry_lock:
+            # 로드하는 동안 직접 등록된 팩토리가 있으면 그것을 유지
+            if _registry.get(platform) is factory:
+                _registry[platform] = loaded
+            factory = _registry[platform]
+
+    return factory
+
+
+def get_registered_platforms() -> List[ProblemPlatform]:
+    """등록된 플랫폼 목록을 등록 순서대로 반환합니다."""
+    discover_entry_points()
+    with _registry_lock:
+        return list(_registry.keys())
+
+
+def create_provider(platform: ProblemPlatform, **options) -> Optional[Any]:
+    """등록된 팩토리로 프로바이더 인스턴스를 만듭니다. 등록되지 않았으면 None."""
+    factory = get_provider_factory(platform)
+    if factory is None:
+        return None
+    return factory(**options)
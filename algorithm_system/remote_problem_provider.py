@@ -9,33 +9,130 @@ import requests
 import json
 import time
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, Callable, Iterable, Iterator, Sequence, Set
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 import os
 import hashlib
+import threading
+import uuid
+from bisect import bisect_right
 
 try:
     from .problem_data_structures import (
         AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag,
-        ProblemTestCase, ProblemMetadata
+        ProblemTestCase, ProblemMetadata, ProblemCollection
     )
+    from .problem_catalog import ProblemCatalog
+    from .memory_cache import LRUCache
+    from .cache_serializers import (
+        CacheSerializer, JSONSerializer, get_serializer, get_known_extensions,
+        read_cache_file, write_cache_file, migrate_cache_dir
+    )
+    from .lazy_catalog import LazyProblemCatalog, write_lazy_catalog
+    from .request_layer import RequestLayer, get_default_request_layer
+    from .problem_hydration import apply_statement
+    from .content_store import ContentStore, pack_problem_refs, unpack_problem_refs
+    from .streaming_json import iter_json_items
+    from .provider_registry import register_provider, create_provider, get_registered_platforms
+    from .duplicate_index import DuplicateIndex, problem_key
+    from .provider_metrics import MetricsRegistry, get_default_metrics
 except ImportError:
     from problem_data_structures import (
         AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag,
-        ProblemTestCase, ProblemMetadata
+        ProblemTestCase, ProblemMetadata, ProblemCollection
+    )
+    from problem_catalog import ProblemCatalog
+    from memory_cache import LRUCache
+    from cache_serializers import (
+        CacheSerializer, JSONSerializer, get_serializer, get_known_extensions,
+        read_cache_file, write_cache_file, migrate_cache_dir
     )
+    from lazy_catalog import LazyProblemCatalog, write_lazy_catalog
+    from request_layer import RequestLayer, get_default_request_layer
+    from problem_hydration import apply_statement
+    from content_store import ContentStore, pack_problem_refs, unpack_problem_refs
+    from streaming_json import iter_json_items
+    from provider_registry import register_provider, create_provider, get_registered_platforms
+    from duplicate_index import DuplicateIndex, problem_key
+    from provider_metrics import MetricsRegistry, get_default_metrics
+
+
+# 플랫폼 문제 ID로 문제 ID(UUID5)를 만들 때 쓰는 네임스페이스
+PROBLEM_ID_NAMESPACE = uuid.UUID('5b1f0c6e-3d2a-4c8e-9f47-a1d2c3b4e5f6')
 
 
 class RemoteProblemProvider(ABC):
     """외부 플랫폼 문제 제공자 추상 클래스"""
 
-    def __init__(self, platform: ProblemPlatform, cache_dir: str = "cache"):
+    CATALOG_CACHE_KEY = "problems_list_all"
+    CATALOG_MAX_AGE_HOURS = 6
+
+    # 재검증 중 만료된 데이터를 메모리에서 제공하는 시간 (초)
+    STALE_SERVE_SECONDS = 60
+    STATEMENT_CACHE_PREFIX = "statement_"
+    # 하이드레이션된 문제 ID 목록 (문제 목록을 만들 때 본문이 있는 문제만 본문 캐시를 읽기 위함)
+    STATEMENT_INDEX_CACHE_KEY = "statement_index"
+
+    def __init__(self, platform: ProblemPlatform, cache_dir: str = "cache",
+                 memory_cache_size: int = 32, cache_format: str = "json",
+                 cache_compression: Optional[str] = None,
+                 stale_while_revalidate: bool = True,
+                 request_layer: Optional[RequestLayer] = None,
+                 cache_layout: str = "content",
+                 metrics: Optional[MetricsRegistry] = None):
         self.platform = platform
         self.cache_dir = cache_dir
         self.session = requests.Session()
+        # call_with_session()으로 스레드별로 바꿔 쓰는 세션
+        self._thread_session = threading.local()
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
 
+        # 속도 제한/재시도/서킷 브레이커를 적용하는 공유 요청 계층
+        self.request_layer = request_layer or get_default_request_layer()
+
+        # 캐시/요청/변환 메트릭 (기본값은 프로세스 공유 레지스트리)
+        self.metrics = metrics or get_default_metrics()
+        self.metrics_label = platform.name.lower()
+
+        # 캐시 직렬화 형식 (사용할 수 없는 형식이면 JSON으로 대체)
+        try:
+            self.cache_serializer: CacheSerializer = get_serializer(cache_format, cache_compression)
+        except ValueError as e:
+            self.logger.warning(f"캐시 형식 설정 실패, JSON 사용: {e}")
+            self.cache_serializer = JSONSerializer()
+
+        # 캐시 저장 구조: content는 문제 본문을 해시 객체로 한 번만 저장, flat은 항목마다 전체 저장
+        if cache_layout not in ("content", "flat"):
+            self.logger.warning(f"알 수 없는 캐시 구조, content 사용: {cache_layout}")
+            cache_layout = "content"
+        self.cache_layout = cache_layout
+        self.content_store = ContentStore(cache_dir, self.cache_serializer)
+
+        # platform_problem_id -> 문제 딕셔너리 인덱스 (카탈로그 동기화 시 구축)
+        self._problem_index: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # 본문이 저장된 platform_problem_id 집합 (처음 사용할 때 로드)
+        self._statement_ids: Optional[Set[str]] = None
+        self._statement_index_dirty = False
+        self._statement_lock = threading.Lock()
+
+        # 디스크 캐시 앞단의 메모리 캐시 (역직렬화된 AlgorithmProblem 목록 보관)
+        self.memory_cache = LRUCache(max_entries=memory_cache_size)
+
+        # 전체 카탈로그의 mmap 기반 지연 디코딩 뷰
+        self._catalog_view: Optional[LazyProblemCatalog] = None
+
+        # stale-while-revalidate: 키별로 하나의 갱신 작업만 실행
+        self.stale_while_revalidate = stale_while_revalidate
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix=f"{platform.name.lower()}-refresh"
+        )
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
         # 캐시 디렉토리 생성
         os.makedirs(cache_dir, exist_ok=True)
 
@@ -54,45 +151,459 @@ class RemoteProblemProvider(ABC):
         """특정 문제의 상세 정보를 가져옵니다."""
         pass
 
+    def _make_problem_id(self, platform_problem_id: Optional[str]) -> str:
+        """플랫폼과 플랫폼 문제 ID로 정해지는 문제 ID를 만듭니다.
+
+        새로고침으로 다시 변환해도 같은 문제는 같은 ID를 가지므로, 캐시 객체와 메모리의 문제 ID가 어긋나지 않습니다.
+        플랫폼 문제 ID가 없으면 임의의 ID를 사용합니다.
+        """
+        if not platform_problem_id:
+            return str(uuid.uuid4())
+        return str(uuid.uuid5(PROBLEM_ID_NAMESPACE, f"{self.platform.name}:{platform_problem_id}"))
+
+    def _convert_records(self, records: Sequence[Dict[str, Any]]) -> List[AlgorithmProblem]:
+        """_convert_batch로 변환하고 변환 시간과 변환된 문제 수를 메트릭에 기록합니다."""
+        start = time.perf_counter()
+        problems = self._convert_batch(records)
+        self.metrics.observe(
+            'focus_timer_provider_conversion_seconds', time.perf_counter() - start, platform=self.metrics_label
+        )
+        self.metrics.inc('focus_timer_provider_problems_converted_total', len(problems), platform=self.metrics_label)
+        return problems
+
+    def _convert_batch(self, records: Sequence[Dict[str, Any]]) -> List[AlgorithmProblem]:
+        """원본 레코드 묶음을 AlgorithmProblem 목록으로 변환합니다. 변환에 실패한 레코드는 건너뜁니다.
+
+        레코드마다 _convert_to_algorithm_problem을 호출합니다.
+        """
+        problems = []
+        for record in records:
+            try:
+                problem = self._convert_to_algorithm_problem(record)
+            except Exception as e:
+                self.logger.warning(f"문제 변환 실패: {e}")
+                continue
+            if problem:
+                problems.append(problem)
+        return problems
+
     def _get_cache_path(self, key: str) -> str:
         """캐시 파일 경로를 반환합니다."""
+        return self._get_cache_stem(key) + self.cache_serializer.extension
+
+    def _get_cache_stem(self, key: str) -> str:
+        """확장자를 제외한 캐시 파일 경로를 반환합니다."""
         cache_key = hashlib.md5(key.encode()).hexdigest()
-        return os.path.join(self.cache_dir, f"{self.platform.name.lower()}_{cache_key}.json")
+        return os.path.join(self.cache_dir, f"{self.platform.name.lower()}_{cache_key}")
 
-    def _load_from_cache(self, key: str, max_age_hours: int = 24) -> Optional[Dict[str, Any]]:
-        """캐시에서 데이터를 로드합니다."""
+    def _find_cache_path(self, key: str) -> Optional[str]:
+        """현재 형식의 캐시 파일, 없으면 다른 형식(기존 JSON 등)의 캐시 파일 경로를 반환합니다."""
         cache_path = self._get_cache_path(key)
+        if os.path.exists(cache_path):
+            return cache_path
 
-        if not os.path.exists(cache_path):
-            return None
+        cache_stem = self._get_cache_stem(key)
+        for extension in get_known_extensions():
+            if os.path.exists(cache_stem + extension):
+                return cache_stem + extension
 
-        # 캐시 만료 확인
+        return None
+
+    def _get_cache_age_hours(self, key: str) -> Optional[float]:
+        """캐시 파일의 경과 시간(시간 단위)을 반환합니다. 캐시가 없으면 None."""
+        cache_path = self._find_cache_path(key)
+        if cache_path is None:
+            return None
         file_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(cache_path))
-        if file_age > timedelta(hours=max_age_hours):
+        return file_age / timedelta(hours=1)
+
+    def _touch_cache(self, key: str) -> None:
+        """캐시 내용을 다시 쓰지 않고 갱신 시각만 현재로 변경합니다."""
+        cache_path = self._find_cache_path(key)
+        if cache_path is not None:
+            os.utime(cache_path, None)
+
+    def _load_from_cache(self, key: str, max_age_hours: Optional[int] = 24) -> Optional[Dict[str, Any]]:
+        """캐시에서 데이터를 로드합니다. max_age_hours가 None이면 만료를 확인하지 않습니다."""
+        cache_path = self._find_cache_path(key)
+
+        if cache_path is None:
             return None
 
+        # 캐시 만료 확인
+        if max_age_hours is not None:
+            file_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(cache_path))
+            if file_age > timedelta(hours=max_age_hours):
+                return None
+
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # 문제 참조로 저장된 항목은 저장 구조 설정과 관계없이 복원
+            return unpack_problem_refs(self.content_store, read_cache_file(cache_path))
         except Exception as e:
             self.logger.warning(f"캐시 로드 실패: {e}")
             return None
 
+    def _get_cached_problems(self, key: str, max_age_hours: Optional[int],
+                             record_miss: bool = True) -> Optional[List[AlgorithmProblem]]:
+        """메모리 캐시, 디스크 캐시 순으로 문제 목록을 조회합니다.
+
+        record_miss가 False이면 캐시 미스를 기록하지 않습니다 (만료된 캐시를 대신 제공할 수 있는 호출자용).
+        """
+        problems = self.memory_cache.get(key)
+        if problems is not None:
+            self.metrics.inc('focus_timer_provider_cache_hits_total', platform=self.metrics_label, layer='memory')
+            return list(problems)
+
+        cached_data = self._load_from_cache(key, max_age_hours=max_age_hours)
+        if not isinstance(cached_data, dict):
+            if record_miss:
+                self.metrics.inc('focus_timer_provider_cache_misses_total', platform=self.metrics_label)
+            return None
+
+        problems = self._problems_from_dicts(cached_data.get("problems", []))
+        cache_age_hours = self._get_cache_age_hours(key) or 0
+        self.metrics.inc('focus_timer_provider_cache_hits_total', platform=self.metrics_label, layer='disk')
+        self.metrics.observe(
+            'focus_timer_provider_cache_age_seconds', cache_age_hours * 3600, platform=self.metrics_label
+        )
+
+        # 디스크 캐시의 남은 유효 시간만큼만 메모리에 보관
+        ttl_hours = None
+        if max_age_hours is not None:
+            ttl_hours = max_age_hours - cache_age_hours
+        return self._remember_problems(key, problems, ttl_hours)
+
+    def _get_problems_with_revalidation(self, key: str, max_age_hours: Optional[int],
+                                        fetch: Callable[[], List[AlgorithmProblem]]) -> List[AlgorithmProblem]:
+        """신선한 캐시를 반환하고, 만료된 캐시는 즉시 반환하면서 백그라운드에서 갱신합니다.
+
+        캐시가 전혀 없으면 갱신 작업을 기다립니다. 같은 키에 대한 동시 요청은
+        하나의 갱신 작업을 공유하므로 요청이 몰려도 원격 요청은 한 번만 발생합니다.
+        """
+        fresh_problems = self._get_cached_problems(key, max_age_hours, record_miss=False)
+        if fresh_problems is not None:
+            return fresh_problems
+
+        if self.stale_while_revalidate:
+            cached_data = self._load_from_cache(key, max_age_hours=None)
+            if isinstance(cached_data, dict):
+                stale_problems = self.apply_cached_statements(
+                    self._problems_from_dicts(cached_data.get("problems", []))
+                )
+                self.metrics.inc('focus_timer_provider_cache_hits_total', platform=self.metrics_label, layer='stale')
+                self.metrics.observe(
+                    'focus_timer_provider_cache_age_seconds', (self._get_cache_age_hours(key) or 0) * 3600,
+                    platform=self.metrics_label
+                )
+                self.memory_cache.set(key, stale_problems, ttl_seconds=self.STALE_SERVE_SECONDS)
+                self._start_refresh(key, fetch)
+                return list(stale_problems)
+
+        # 만료된 캐시도 제공할 수 없을 때만 미스로 기록
+        self.metrics.inc('focus_timer_provider_cache_misses_total', platform=self.metrics_label)
+        return self._start_refresh(key, fetch).result()
+
+    def _start_refresh(self, key: str, fetch: Callable[[], Any]) -> Future:
+        """키별 갱신 작업을 시작하거나 이미 진행 중인 작업을 반환합니다."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._refresh_executor.submit(self._run_refresh, key, fetch)
+                self._inflight[key] = future
+            return future
+
+    def _run_refresh(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """갱신 작업을 실행하고 완료되면 진행 중 목록에서 제거합니다."""
+        try:
+            return fetch()
+        except Exception as e:
+            self.logger.error(f"캐시 갱신 실패 ({key}): {e}")
+            return []
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> bool:
+        """진행 중인 백그라운드 갱신이 끝날 때까지 기다립니다. 모두 끝났으면 True."""
+        with self._inflight_lock:
+            futures = list(self._inflight.values())
+        _, not_done = wait(futures, timeout=timeout)
+        return not not_done
+
+    def get_catalog_age_hours(self) -> Optional[float]:
+        """전체 문제 목록 캐시의 경과 시간(시간 단위)을 반환합니다. 캐시가 없으면 None.
+
+        갱신에 성공하면 캐시를 다시 쓰거나 갱신 시각을 연장하므로, 만료된 목록을 제공 중인지 판단할 때 사용합니다.
+        """
+        return self._get_cache_age_hours(self.CATALOG_CACHE_KEY)
+
+    def _remember_problems(self, key: str, problems: List[AlgorithmProblem],
+                           ttl_hours: Optional[float]) -> List[AlgorithmProblem]:
+        """저장된 본문을 적용한 문제 목록을 메모리 캐시에 보관하고 호출자용 복사본을 반환합니다."""
+        self.apply_cached_statements(problems)
+        if ttl_hours is None or ttl_hours > 0:
+            ttl_seconds = ttl_hours * 3600 if ttl_hours is not None else None
+            self.memory_cache.set(key, problems, ttl_seconds=ttl_seconds)
+        return list(problems)
+
+    def clear_memory_cache(self) -> None:
+        """메모리 캐시, 문제 인덱스, 카탈로그 뷰를 비웁니다."""
+        self.memory_cache.clear()
+        self._problem_index = None
+        if self._catalog_view is not None:
+            self._catalog_view.close()
+            self._catalog_view = None
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """메모리 캐시 적중/실패/제거 통계를 반환합니다."""
+        return self.memory_cache.get_stats()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """이 플랫폼의 캐시/요청/변환 메트릭 요약을 반환합니다."""
+        return self.metrics.get_platform_summary(self.metrics_label)
+
     def _save_to_cache(self, key: str, data: Dict[str, Any]) -> None:
         """데이터를 캐시에 저장합니다."""
+        self.memory_cache.invalidate(key)
         cache_path = self._get_cache_path(key)
 
         try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if self.cache_layout == "content":
+                data = pack_problem_refs(self.content_store, data)
+            write_cache_file(cache_path, data, self.cache_serializer)
+
+            # 다른 형식으로 남아 있던 이전 캐시 파일은 제거
+            cache_stem = self._get_cache_stem(key)
+            for extension in get_known_extensions():
+                previous_path = cache_stem + extension
+                if previous_path != cache_path and os.path.exists(previous_path):
+                    os.remove(previous_path)
         except Exception as e:
             self.logger.error(f"캐시 저장 실패: {e}")
 
+    def migrate_cache(self) -> int:
+        """캐시 디렉토리의 기존 캐시 파일들을 현재 캐시 형식으로 변환합니다."""
+        migrated = migrate_cache_dir(self.cache_dir, self.cache_serializer, recursive=False)
+        self.memory_cache.clear()
+        self.logger.info(f"캐시 {len(migrated)}개를 {self.cache_serializer.name} 형식으로 변환")
+        return len(migrated)
+
+    def _save_catalog(self, problems_data: List[Dict[str, Any]]) -> None:
+        """전체 카탈로그를 platform_problem_id 인덱스와 함께 캐시에 저장합니다."""
+        index = {
+            problem_data['platform_problem_id']: position
+            for position, problem_data in enumerate(problems_data)
+            if problem_data.get('platform_problem_id')
+        }
+        self._save_to_cache(self.CATALOG_CACHE_KEY, {"problems": problems_data, "index": index})
+        self._problem_index = {pid: problems_data[position] for pid, position in index.items()}
+
+    def _load_problem_index(self) -> Dict[str, Dict[str, Any]]:
+        """캐시된 카탈로그에서 platform_problem_id 인덱스를 로드합니다."""
+        if self._problem_index is not None:
+            return self._problem_index
+
+        cached_data = self._load_from_cache(self.CATALOG_CACHE_KEY, max_age_hours=None)
+        if not isinstance(cached_data, dict):
+            return {}
+
+        problems_data = cached_data.get("problems", [])
+        index = cached_data.get("index")
+        if not isinstance(index, dict):
+            # 인덱스가 없는 이전 형식의 캐시는 한 번만 인덱스를 구축
+            index = {
+                problem_data.get('platform_problem_id'): position
+                for position, problem_data in enumerate(problems_data)
+                if isinstance(problem_data, dict) and problem_data.get('platform_problem_id')
+            }
+
+        self._problem_index = {
+            pid: problems_data[position] for pid, position in index.items()
+            if 0 <= position < len(problems_data)
+        }
+        return self._problem_index
+
+    def _lookup_problem(self, problem_id: str) -> Optional[AlgorithmProblem]:
+        """인덱스에서 platform_problem_id로 문제를 찾습니다."""
+        problem_data = self._load_problem_index().get(problem_id)
+        if problem_data is None:
+            return None
+        return AlgorithmProblem.from_dict(problem_data)
+
+    def _get_problem_from_catalog(self, problem_id: str) -> Optional[AlgorithmProblem]:
+        """카탈로그 인덱스로 문제를 조회하고, 카탈로그가 없거나 만료되었을 때만 동기화합니다."""
+        problem = self._lookup_problem(problem_id)
+        if problem is None:
+            catalog_age = self._get_cache_age_hours(self.CATALOG_CACHE_KEY)
+            if catalog_age is None or catalog_age > self.CATALOG_MAX_AGE_HOURS:
+                self._problem_index = None
+                self.get_problems()
+                problem = self._lookup_problem(problem_id)
+
+        if problem is not None:
+            statement = self.get_cached_statement(problem_id)
+            if statement:
+                apply_statement(problem, statement)
+
+        return problem
+
+    def fetch_statement_html(self, problem: AlgorithmProblem) -> Optional[str]:
+        """문제 본문 HTML을 가져옵니다. 본문을 제공하지 않는 플랫폼은 None을 반환합니다."""
+        return None
+
+    def get_cached_statement(self, problem_id: str) -> Optional[Dict[str, Any]]:
+        """하이드레이션으로 저장된 문제 본문을 반환합니다."""
+        return self._load_from_cache(f"{self.STATEMENT_CACHE_PREFIX}{problem_id}", max_age_hours=None)
+
+    def save_statement(self, problem_id: str, statement: Dict[str, Any]) -> None:
+        """파싱된 문제 본문을 캐시에 저장합니다. 본문은 만료되지 않습니다.
+
+        본문 인덱스에는 메모리에서만 추가되므로, 저장을 마친 뒤 flush_statement_index()를 호출해야 합니다.
+        """
+        self._save_to_cache(f"{self.STATEMENT_CACHE_PREFIX}{problem_id}", statement)
+        self.register_statement(problem_id)
+
+    def get_hydrated_problem_ids(self) -> Set[str]:
+        """본문이 저장된 platform_problem_id 집합을 반환합니다."""
+        with self._statement_lock:
+            if self._statement_ids is None:
+                cached_index = self._load_from_cache(self.STATEMENT_INDEX_CACHE_KEY, max_age_hours=None)
+                problem_ids = cached_index.get('problem_ids', []) if isinstance(cached_index, dict) else []
+                self._statement_ids = set(problem_ids)
+            return set(self._statement_ids)
+
+    def register_statement(self, problem_id: str) -> None:
+        """본문 인덱스에 문제 ID를 추가합니다 (인덱스 도입 전에 저장된 본문 등록에도 사용).
+
+        인덱스 파일은 flush_statement_index()를 호출할 때 한 번에 씁니다.
+        """
+        self.get_hydrated_problem_ids()
+        with self._statement_lock:
+            if problem_id in self._statement_ids:
+                return
+            self._statement_ids.add(problem_id)
+            self._statement_index_dirty = True
+
+    def flush_statement_index(self) -> None:
+        """등록 후 아직 쓰지 않은 본문 인덱스를 캐시에 저장합니다."""
+        with self._statement_lock:
+            if not self._statement_index_dirty:
+                return
+            self._save_to_cache(self.STATEMENT_INDEX_CACHE_KEY, {'problem_ids': sorted(self._statement_ids)})
+            self._statement_index_dirty = False
+
+    def apply_cached_statements(self, problems: List[AlgorithmProblem]) -> List[AlgorithmProblem]:
+        """본문이 저장된 문제들에 본문을 적용합니다. 본문 캐시는 저장된 문제에 대해서만 읽습니다."""
+        hydrated_ids = self.get_hydrated_problem_ids()
+        if not hydrated_ids:
+            return problems
+
+        for problem in problems:
+            if problem.platform_problem_id in hydrated_ids:
+                statement = self.get_cached_statement(problem.platform_problem_id)
+                if statement:
+                    apply_statement(problem, statement)
+        return problems
+
+    def get_catalog_view(self) -> Optional[LazyProblemCatalog]:
+        """전체 카탈로그의 읽기 전용 지연 디코딩 뷰를 반환합니다.
+
+        뷰 파일이 없거나 카탈로그 캐시보다 오래되었으면 캐시된 카탈로그(없으면 동기화 결과)로
+        다시 만듭니다. 문제는 접근할 때만 AlgorithmProblem으로 변환됩니다.
+        """
+        view_path = self._get_cache_stem(self.CATALOG_CACHE_KEY) + ".ftcat"
+        catalog_path = self._find_cache_path(self.CATALOG_CACHE_KEY)
+        if catalog_path is None:
+            self.get_problems()
+            catalog_path = self._find_cache_path(self.CATALOG_CACHE_KEY)
+            if catalog_path is None:
+                return None
+
+        view_is_current = (
+            os.path.exists(view_path)
+            and os.path.getmtime(view_path) >= os.path.getmtime(catalog_path)
+        )
+        if view_is_current and self._catalog_view is not None and not self._catalog_view.closed:
+            return self._catalog_view
+
+        if self._catalog_view is not None:
+            self._catalog_view.close()
+            self._catalog_view = None
+
+        try:
+            if not view_is_current:
+                cached_data = self._load_from_cache(self.CATALOG_CACHE_KEY, max_age_hours=None)
+                if not isinstance(cached_data, dict):
+                    return None
+                problems_data = [p for p in cached_data.get("problems", []) if isinstance(p, dict)]
+                write_lazy_catalog(view_path, problems_data)
+            self._catalog_view = LazyProblemCatalog(view_path)
+        except Exception as e:
+            self.logger.error(f"카탈로그 뷰 생성 실패: {e}")
+            return None
+
+        return self._catalog_view
+
+    def _remove_cache(self, key: str) -> None:
+        """캐시 항목을 삭제합니다."""
+        self.memory_cache.invalidate(key)
+        try:
+            cache_path = self._find_cache_path(key)
+            while cache_path is not None:
+                os.remove(cache_path)
+                cache_path = self._find_cache_path(key)
+        except OSError as e:
+            self.logger.warning(f"캐시 삭제 실패: {e}")
+
+    def _problems_from_dicts(self, problems_data: List[Dict[str, Any]]) -> List[AlgorithmProblem]:
+        """캐시된 딕셔너리 목록을 AlgorithmProblem 목록으로 변환합니다."""
+        return AlgorithmProblem.from_dicts(problem_data for problem_data in problems_data if isinstance(problem_data, dict))
+
+    def _send_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """공유 요청 계층을 통해 HTTP 요청을 보내고 지연 시간, 응답 크기, 결과를 메트릭에 기록합니다.
+
+        stream=True 요청의 응답 크기는 본문을 읽는 쪽(_iter_response_items)에서 기록합니다.
+        """
+        start = time.perf_counter()
+        try:
+            session = getattr(self._thread_session, 'session', None) or self.session
+            response = self.request_layer.request(
+                self.platform.name.lower(), method, url, session=session, **kwargs
+            )
+        except Exception:
+            self._record_request(time.perf_counter() - start, 'exception')
+            raise
+
+        self._record_request(time.perf_counter() - start, 'success' if response.ok else 'http_error')
+        if not kwargs.get('stream'):
+            self.metrics.observe(
+                'focus_timer_provider_response_bytes', len(response.content), platform=self.metrics_label
+            )
+        return response
+
+    def call_with_session(self, session: requests.Session, func: Callable[..., Any], *args) -> Any:
+        """현재 스레드에서 func를 실행하는 동안 요청에 session을 사용합니다.
+
+        자체 연결 풀을 가진 호출자(비동기 래퍼)가 공유 세션의 어댑터를 바꾸지 않고 요청을 보낼 때 씁니다.
+        프로바이더 내부 스레드(백그라운드 갱신, 페이지 병렬 수집)의 요청은 기본 세션을 그대로 사용합니다.
+        """
+        previous = getattr(self._thread_session, 'session', None)
+        self._thread_session.session = session
+        try:
+            return func(*args)
+        finally:
+            self._thread_session.session = previous
+
+    def _record_request(self, elapsed: float, outcome: str) -> None:
+        """요청 결과와 지연 시간을 메트릭에 기록합니다."""
+        self.metrics.inc('focus_timer_provider_requests_total', platform=self.metrics_label, outcome=outcome)
+        self.metrics.observe('focus_timer_provider_request_seconds', elapsed, platform=self.metrics_label)
+
     def _make_request(self, url: str, params: Optional[Dict] = None,
                      headers: Optional[Dict] = None, timeout: int = 30) -> Optional[Dict[str, Any]]:
         """HTTP 요청을 수행합니다."""
         try:
-            response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+            response = self._send_request('GET', url, params=params, headers=headers, timeout=timeout)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -102,65 +613,346 @@ class RemoteProblemProvider(ABC):
             self.logger.error(f"JSON 파싱 실패: {e}")
             return None
 
+    def _stream_json_items(self, url: str, path: Sequence[str], params: Optional[Dict] = None,
+                           timeout: int = 30, chunk_size: int = 64 * 1024,
+                           expected: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """응답 본문을 내려받는 도중에 path 위치 배열의 요소를 하나씩 디코딩하여 반환합니다.
+
+        요청/파싱 오류와 expected(최상위 키와 기대값) 불일치는 호출자에게 그대로 전달됩니다.
+        반복을 중간에 멈추면 연결을 닫아 다운로드도 중단합니다.
+        """
+        response = self._send_request('GET', url, params=params, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            response.close()
+            raise
+        yield from self._iter_response_items(response, path, chunk_size, expected)
+
+    def _iter_response_items(self, response: requests.Response, path: Sequence[str],
+                             chunk_size: int = 64 * 1024,
+                             expected: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """stream=True 응답 본문에서 path 위치 배열의 요소를 디코딩되는 대로 반환하고, 끝나면 연결을 닫습니다."""
+        downloaded = 0
+
+        def counted_chunks() -> Iterator[bytes]:
+            nonlocal downloaded
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                downloaded += len(chunk)
+                yield chunk
+
+        try:
+            yield from iter_json_items(counted_chunks(), path, expected)
+        finally:
+            response.close()
+            self.metrics.observe('focus_timer_provider_response_bytes', downloaded, platform=self.metrics_label)
+
+    def _make_conditional_request(self, url: str, path: Sequence[str], etag: Optional[str] = None,
+                                  last_modified: Optional[str] = None,
+                                  params: Optional[Dict] = None,
+                                  timeout: int = 30,
+                                  expected: Optional[Dict[str, Any]] = None
+                                  ) -> Tuple[Optional[int], Optional[Iterator[Any]], Dict[str, str]]:
+        """ETag / If-Modified-Since 조건부 HTTP 요청을 스트리밍으로 수행합니다.
+
+        (상태 코드, path 위치 배열 요소의 반복자, 응답 검증자) 튜플을 반환합니다.
+        본문은 반복자를 소비하는 동안 내려받으며, 이때 발생하는 요청/파싱 오류와 expected 불일치는
+        호출자에게 전달됩니다.
+        304 응답이면 본문을 읽지 않고 반복자는 None입니다.
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        try:
+            response = self._send_request('GET', url, params=params, headers=headers, timeout=timeout, stream=True)
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"요청 실패: {e}")
+            return None, None, {}
+
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        if response.status_code == 304:
+            response.close()
+            return 304, None, validators
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            response.close()
+            self.logger.error(f"요청 실패: {e}")
+            return None, None, {}
+        return response.status_code, self._iter_response_items(response, path, expected=expected), validators
+
 
 class CodeforcesProvider(RemoteProblemProvider):
     """Codeforces API 연동"""
 
-    def __init__(self, cache_dir: str = "cache"):
-        super().__init__(ProblemPlatform.CODEFORCES, cache_dir)
+    SYNC_STATE_CACHE_KEY = "sync_state"
+
+    # 정상 응답의 최상위 status 값 (FAILED 응답은 HTTP 200이어도 실패로 처리)
+    OK_RESPONSE = {'status': 'OK'}
+
+    # 스트리밍 변환 시 한 번에 변환할 레코드 수
+    CONVERT_BATCH_SIZE = 500
+
+    # rating이 경계값 미만이면 해당 난이도
+    DIFFICULTY_THRESHOLDS = (1200, 1800, 2400)
+    DIFFICULTY_LEVELS = (
+        ProblemDifficulty.EASY, ProblemDifficulty.MEDIUM, ProblemDifficulty.HARD, ProblemDifficulty.EXPERT
+    )
+
+    TAG_MAPPING = {
+        'brute force': ProblemTag.BRUTE_FORCE,
+        'greedy': ProblemTag.GREEDY,
+        'dp': ProblemTag.DYNAMIC_PROGRAMMING,
+        'divide and conquer': ProblemTag.DIVIDE_AND_CONQUER,
+        'backtracking': ProblemTag.BACKTRACKING,
+        'arrays': ProblemTag.ARRAY,
+        'strings': ProblemTag.STRING,
+        'stacks': ProblemTag.STACK,
+        'queues': ProblemTag.QUEUE,
+        'trees': ProblemTag.TREE,
+        'graphs': ProblemTag.GRAPH,
+        'dfs and similar': ProblemTag.DFS,
+        'bfs': ProblemTag.BFS,
+        'shortest paths': ProblemTag.DIJKSTRA,
+        'math': ProblemTag.MATH,
+        'number theory': ProblemTag.NUMBER_THEORY,
+        'combinatorics': ProblemTag.COMBINATORICS,
+        'geometry': ProblemTag.GEOMETRY,
+        'binary search': ProblemTag.BINARY_SEARCH,
+        'sortings': ProblemTag.SORTING,
+        'bitmasks': ProblemTag.BIT_MANIPULATION,
+        'data structures': ProblemTag.HASH_TABLE,
+        'two pointers': ProblemTag.TWO_POINTERS,
+        'sliding window': ProblemTag.SLIDING_WINDOW
+    }
+
+    def __init__(self, cache_dir: str = "cache", incremental_sync: bool = True, **cache_options):
+        super().__init__(ProblemPlatform.CODEFORCES, cache_dir, **cache_options)
         self.base_url = "https://codeforces.com/api"
+        self.incremental_sync = incremental_sync
 
     def get_problems(self, limit: Optional[int] = None) -> List[AlgorithmProblem]:
         """Codeforces에서 문제 목록을 가져옵니다."""
+        if self.incremental_sync:
+            problems = self._get_problems_with_revalidation(
+                self.CATALOG_CACHE_KEY, self.CATALOG_MAX_AGE_HOURS,
+                lambda: self.sync_problems(force=True)
+            )
+            return problems[:limit] if limit else problems
+
         cache_key = f"problems_list_{limit or 'all'}"
-        cached_data = self._load_from_cache(cache_key, max_age_hours=6)
+        return self._get_problems_with_revalidation(
+            cache_key, 6, lambda: self._fetch_problems(limit, cache_key)
+        )
 
-        if cached_data and isinstance(cached_data, dict):
-            problems_data = cached_data.get("problems", [])
-            return [AlgorithmProblem.from_dict(problem_data) for problem_data in problems_data if isinstance(problem_data, dict)]
+    def iter_problems(self, limit: Optional[int] = None) -> Iterator[AlgorithmProblem]:
+        """전체 문제 목록을 스트리밍으로 내려받으며 변환된 문제를 하나씩 반환합니다.
+
+        응답 전체를 메모리에 올리지 않으며, limit개를 반환하면 다운로드를 중단합니다.
+        요청이나 JSON 파싱 오류는 호출자에게 전달됩니다.
+        """
+        if limit is not None and limit <= 0:
+            return
 
         url = f"{self.base_url}/problemset.problems"
-        data = self._make_request(url)
+        count = 0
+        batch = []
+
+        def convert_batch() -> List[AlgorithmProblem]:
+            problems = self._convert_records(batch)
+            batch.clear()
+            return problems
+
+        for problem_data in self._stream_json_items(url, ("result", "problems"), expected=self.OK_RESPONSE):
+            batch.append(problem_data)
+            # limit이 가까우면 필요한 만큼만 모아 변환 (남은 응답은 내려받지 않음)
+            batch_size = self.CONVERT_BATCH_SIZE if limit is None else min(self.CONVERT_BATCH_SIZE, limit - count)
+            if len(batch) < batch_size:
+                continue
+
+            for problem in convert_batch():
+                yield problem
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+        for problem in convert_batch():
+            yield problem
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+    def _fetch_problems(self, limit: Optional[int], cache_key: str) -> List[AlgorithmProblem]:
+        """전체 문제 목록을 스트리밍으로 내려받아 변환하고 캐시에 저장합니다."""
+        try:
+            problems = list(self.iter_problems(limit))
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.logger.error(f"문제 목록 스트리밍 실패: {e}")
+            return []
 
-        if not data or data.get('status') != 'OK':
+        if not problems:
             self.logger.error("Codeforces API 응답 오류")
             return []
 
-        problems = []
-        problems_data = data.get('result', {}).get('problems', [])
+        # 캐시에 저장
+        problems_data = [problem.to_dict() for problem in problems]
+        if limit is None:
+            self._save_catalog(problems_data)
+        else:
+            self._save_to_cache(cache_key, {"problems": problems_data})
+
+        return self._remember_problems(cache_key, problems, 6)
+
+    def sync_problems(self, force: bool = False) -> List[AlgorithmProblem]:
+        """전체 문제 목록을 증분 동기화합니다.
+
+        캐시가 만료되면 조건부 요청을 보내 변경이 없으면(304) 캐시 갱신 시각만 연장하고,
+        변경이 있으면 새로 추가되었거나 내용이 바뀐 문제만 변환하여 기존 캐시와 병합합니다.
+        """
+        if not force:
+            fresh_problems = self._get_cached_problems(self.CATALOG_CACHE_KEY, self.CATALOG_MAX_AGE_HOURS)
+            if fresh_problems:
+                return fresh_problems
 
-        for problem_data in problems_data[:limit]:
+        cached_data = self._load_from_cache(self.CATALOG_CACHE_KEY, max_age_hours=None)
+        cached_problems = cached_data.get("problems", []) if isinstance(cached_data, dict) else []
+
+        state = self._load_from_cache(self.SYNC_STATE_CACHE_KEY, max_age_hours=None) or {}
+        url = f"{self.base_url}/problemset.problems"
+
+        # 캐시가 있을 때만 검증자를 보내야 304 응답을 재사용할 수 있음
+        status, raw_problems, validators = self._make_conditional_request(
+            url, ("result", "problems"),
+            etag=state.get('etag') if cached_problems else None,
+            last_modified=state.get('last_modified') if cached_problems else None,
+            expected=self.OK_RESPONSE
+        )
+
+        if status == 304 and cached_problems:
+            self.logger.info("Codeforces 문제 목록 변경 없음 (304)")
+            self._touch_cache(self.CATALOG_CACHE_KEY)
+            state['last_sync'] = datetime.now().isoformat()
+            self._save_to_cache(self.SYNC_STATE_CACHE_KEY, state)
+            return self._remember_problems(
+                self.CATALOG_CACHE_KEY, self._problems_from_dicts(cached_problems), self.CATALOG_MAX_AGE_HOURS
+            )
+
+        # 응답 본문을 통째로 올리지 않고 내려받는 대로 병합
+        merged_problems = []
+        if raw_problems is not None:
             try:
-                problem = self._convert_to_algorithm_problem(problem_data)
-                if problem:
-                    problems.append(problem)
+                merged_problems, fingerprints, changed_count, max_contest_id = self._merge_problems(
+                    raw_problems, cached_problems, state.get('fingerprints', {})
+                )
+            except (requests.exceptions.RequestException, ValueError) as e:
+                self.logger.error(f"문제 목록 스트리밍 실패: {e}")
+                merged_problems = []
+
+        if not merged_problems:
+            self.logger.error("Codeforces API 응답 오류")
+            # 동기화 실패 시 만료된 캐시라도 반환
+            return self.apply_cached_statements(self._problems_from_dicts(cached_problems))
+
+        previous_max_contest_id = state.get('max_contest_id') or 0
+        if changed_count or len(merged_problems) != len(cached_problems) or "index" not in (cached_data or {}):
+            self._save_catalog(merged_problems)
+        else:
+            self._touch_cache(self.CATALOG_CACHE_KEY)
+
+        self._save_to_cache(self.SYNC_STATE_CACHE_KEY, {
+            'etag': validators.get('etag'),
+            'last_modified': validators.get('last_modified'),
+            'max_contest_id': max(max_contest_id, previous_max_contest_id),
+            'last_sync': datetime.now().isoformat(),
+            'fingerprints': fingerprints
+        })
+
+        new_contests = f", 새 대회 {previous_max_contest_id + 1}~{max_contest_id}" \
+            if max_contest_id > previous_max_contest_id else ""
+        self.logger.info(
+            f"Codeforces 증분 동기화 완료: 전체 {len(merged_problems)}개, 신규/변경 {changed_count}개{new_contests}"
+        )
+        return self._remember_problems(
+            self.CATALOG_CACHE_KEY, self._problems_from_dicts(merged_problems), self.CATALOG_MAX_AGE_HOURS
+        )
+
+    def _merge_problems(self, raw_problems: Iterable[Dict[str, Any]],
+                        cached_problems: List[Dict[str, Any]],
+                        fingerprints: Dict[str, str]) -> Tuple[List[Dict[str, Any]], Dict[str, str], int, int]:
+        """원본 문제 목록을 기존 캐시와 병합합니다. 변경되지 않은 문제는 변환하지 않습니다.
+
+        (병합된 목록, 새 지문, 신규/변경 문제 수, 가장 큰 contestId) 튜플을 반환합니다.
+        """
+        cached_by_id = {
+            problem.get('platform_problem_id'): problem
+            for problem in cached_problems if isinstance(problem, dict)
+        }
+
+        merged_problems = []
+        new_fingerprints = {}
+        changed_count = 0
+        max_contest_id = 0
+
+        for cf_problem in raw_problems:
+            contest_id = cf_problem.get('contestId')
+            if isinstance(contest_id, int) and contest_id > max_contest_id:
+                max_contest_id = contest_id
+            problem_id = f"{cf_problem.get('contestId', '')}{cf_problem.get('index', '')}"
+            fingerprint = self._fingerprint(cf_problem)
+            cached_problem = cached_by_id.get(problem_id)
+
+            if cached_problem is not None and fingerprints.get(problem_id) == fingerprint:
+                merged_problems.append(cached_problem)
+                new_fingerprints[problem_id] = fingerprint
+                continue
+
+            try:
+                problem = self._convert_to_algorithm_problem(cf_problem)
             except Exception as e:
                 self.logger.warning(f"문제 변환 실패: {e}")
                 continue
+            if not problem:
+                continue
 
-        # 캐시에 저장
-        cache_data = {"problems": [problem.to_dict() for problem in problems]}
-        self._save_to_cache(cache_key, cache_data)
+            # 내용만 바뀐 문제는 기존 ID를 유지
+            if cached_problem is not None and cached_problem.get('id'):
+                problem.id = cached_problem['id']
 
-        return problems
+            merged_problems.append(problem.to_dict())
+            new_fingerprints[problem_id] = fingerprint
+            changed_count += 1
 
-    def get_problem_details(self, problem_id: str) -> Optional[AlgorithmProblem]:
-        """특정 문제의 상세 정보를 가져옵니다."""
-        cache_key = f"problem_details_{problem_id}"
-        cached_data = self._load_from_cache(cache_key, max_age_hours=24)
+        return merged_problems, new_fingerprints, changed_count, max_contest_id
 
-        if cached_data:
-            return AlgorithmProblem.from_dict(cached_data)
+    def _fingerprint(self, cf_problem: Dict[str, Any]) -> str:
+        """원본 문제 데이터의 변경 감지용 해시를 계산합니다."""
+        payload = json.dumps(cf_problem, sort_keys=True, ensure_ascii=False)
+        return hashlib.md5(payload.encode()).hexdigest()[:16]
 
-        # Codeforces는 개별 문제 API가 없으므로 문제 목록에서 찾기
-        problems = self.get_problems(limit=1000)  # 충분한 수의 문제 가져오기
+    def get_problem_details(self, problem_id: str) -> Optional[AlgorithmProblem]:
+        """특정 문제의 상세 정보를 가져옵니다."""
+        # Codeforces는 개별 문제 API가 없으므로 카탈로그 인덱스에서 찾기
+        return self._get_problem_from_catalog(problem_id)
 
-        for problem in problems:
-            if problem.platform_problem_id == problem_id:
-                self._save_to_cache(cache_key, problem.to_dict())
-                return problem
+    def fetch_statement_html(self, problem: AlgorithmProblem) -> Optional[str]:
+        """Codeforces 문제 페이지 HTML을 가져옵니다."""
+        if not problem.platform_url:
+            return None
 
-        return None
+        try:
+            response = self._send_request('GET', problem.platform_url, timeout=30)
+            response.raise_for_status()
+            return response.text
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"문제 페이지 요청 실패 ({problem.platform_problem_id}): {e}")
+            return None
 
     def _convert_to_algorithm_problem(self, cf_problem: Dict[str, Any]) -> Optional[AlgorithmProblem]:
         """Codeforces 문제 데이터를 AlgorithmProblem으로 변환합니다."""
@@ -175,12 +967,14 @@ class CodeforcesProvider(RemoteProblemProvider):
                 if tag:
                     tags.add(tag)
 
+            platform_problem_id = f"{cf_problem.get('contestId', '')}{cf_problem.get('index', '')}"
             problem = AlgorithmProblem(
+                id=self._make_problem_id(platform_problem_id),
                 title=cf_problem.get('name', ''),
                 description=f"Codeforces 문제: {cf_problem.get('name', '')}",
                 difficulty=difficulty,
                 platform=ProblemPlatform.CODEFORCES,
-                platform_problem_id=f"{cf_problem.get('contestId', '')}{cf_problem.get('index', '')}",
+                platform_problem_id=platform_problem_id,
                 platform_url=f"https://codeforces.com/problemset/problem/{cf_problem.get('contestId', '')}/{cf_problem.get('index', '')}",
                 time_limit=2.0,  # Codeforces 기본값
                 memory_limit=256,  # Codeforces 기본값
@@ -201,53 +995,55 @@ class CodeforcesProvider(RemoteProblemProvider):
 
     def _map_difficulty(self, rating: int) -> ProblemDifficulty:
         """Codeforces rating을 난이도로 매핑합니다."""
-        if rating < 1200:
-            return ProblemDifficulty.EASY
-        elif rating < 1800:
-            return ProblemDifficulty.MEDIUM
-        elif rating < 2400:
-            return ProblemDifficulty.HARD
-        else:
-            return ProblemDifficulty.EXPERT
+        return self.DIFFICULTY_LEVELS[bisect_right(self.DIFFICULTY_THRESHOLDS, rating)]
 
     def _map_tag(self, cf_tag: str) -> Optional[ProblemTag]:
         """Codeforces 태그를 ProblemTag로 매핑합니다."""
-        tag_mapping = {
-            'brute force': ProblemTag.BRUTE_FORCE,
-            'greedy': ProblemTag.GREEDY,
-            'dp': ProblemTag.DYNAMIC_PROGRAMMING,
-            'divide and conquer': ProblemTag.DIVIDE_AND_CONQUER,
-            'backtracking': ProblemTag.BACKTRACKING,
-            'arrays': ProblemTag.ARRAY,
-            'strings': ProblemTag.STRING,
-            'stacks': ProblemTag.STACK,
-            'queues': ProblemTag.QUEUE,
-            'trees': ProblemTag.TREE,
-            'graphs': ProblemTag.GRAPH,
-            'dfs and similar': ProblemTag.DFS,
-            'bfs': ProblemTag.BFS,
-            'shortest paths': ProblemTag.DIJKSTRA,
-            'math': ProblemTag.MATH,
-            'number theory': ProblemTag.NUMBER_THEORY,
-            'combinatorics': ProblemTag.COMBINATORICS,
-            'geometry': ProblemTag.GEOMETRY,
-            'binary search': ProblemTag.BINARY_SEARCH,
-            'sortings': ProblemTag.SORTING,
-            'bitmasks': ProblemTag.BIT_MANIPULATION,
-            'data structures': ProblemTag.HASH_TABLE,
-            'two pointers': ProblemTag.TWO_POINTERS,
-            'sliding window': ProblemTag.SLIDING_WINDOW
-        }
-
-        return tag_mapping.get(cf_tag.lower())
+        return self.TAG_MAPPING.get(cf_tag.lower())
 
 
 class LeetCodeProvider(RemoteProblemProvider):
     """LeetCode API 연동 (비공식)"""
 
-    def __init__(self, cache_dir: str = "cache"):
-        super().__init__(ProblemPlatform.LEETCODE, cache_dir)
-        self.base_url = "https://leetcode.com/graphql"
+    DIFFICULTY_MAPPING = {
+        'Easy': ProblemDifficulty.EASY,
+        'Medium': ProblemDifficulty.MEDIUM,
+        'Hard': ProblemDifficulty.HARD
+    }
+
+    TAG_MAPPING = {
+        'Array': ProblemTag.ARRAY,
+        'String': ProblemTag.STRING,
+        'Linked List': ProblemTag.LINKED_LIST,
+        'Stack': ProblemTag.STACK,
+        'Queue': ProblemTag.QUEUE,
+        'Tree': ProblemTag.TREE,
+        'Graph': ProblemTag.GRAPH,
+        'Hash Table': ProblemTag.HASH_TABLE,
+        'Trie': ProblemTag.TRIE,
+        'Depth-First Search': ProblemTag.DFS,
+        'Breadth-First Search': ProblemTag.BFS,
+        'Dynamic Programming': ProblemTag.DYNAMIC_PROGRAMMING,
+        'Greedy': ProblemTag.GREEDY,
+        'Backtracking': ProblemTag.BACKTRACKING,
+        'Binary Search': ProblemTag.BINARY_SEARCH,
+        'Two Pointers': ProblemTag.TWO_POINTERS,
+        'Sliding Window': ProblemTag.SLIDING_WINDOW,
+        'Sorting': ProblemTag.SORTING,
+        'Bit Manipulation': ProblemTag.BIT_MANIPULATION,
+        'Math': ProblemTag.MATH,
+        'Geometry': ProblemTag.GEOMETRY,
+        'Combinatorics': ProblemTag.COMBINATORICS
+    }
+
+    def __init__(self, cache_dir: str = "cache", base_url: str = "https://leetcode.com/graphql",
+                 page_size: int = 100, max_concurrency: int = 4, **cache_options):
+        super().__init__(ProblemPlatform.LEETCODE, cache_dir, **cache_options)
+        self.base_url = base_url
+
+        # 페이지 단위 병렬 수집 설정
+        self.page_size = page_size
+        self.max_concurrency = max(1, max_concurrency)
 
         # LeetCode GraphQL 쿼리
         self.problems_query = """
@@ -281,62 +1077,172 @@ class LeetCodeProvider(RemoteProblemProvider):
         }
         """
 
+        # 문제 본문 쿼리
+        self.content_query = """
+        query questionContent($titleSlug: String!) {
+            question(titleSlug: $titleSlug) {
+                content
+            }
+        }
+        """
+
     def get_problems(self, limit: Optional[int] = None) -> List[AlgorithmProblem]:
         """LeetCode에서 문제 목록을 가져옵니다."""
         cache_key = f"problems_list_{limit or 'all'}"
-        cached_data = self._load_from_cache(cache_key, max_age_hours=6)
+        return self._get_problems_with_revalidation(
+            cache_key, 6, lambda: self._fetch_problems(limit, cache_key)
+        )
+
+    def _fetch_problems(self, limit: Optional[int], cache_key: str) -> List[AlgorithmProblem]:
+        """문제 목록을 원격에서 가져와 캐시에 저장합니다."""
+        # 한 페이지를 넘는 요청은 페이지 단위로 병렬 수집
+        if limit is None or limit > self.page_size:
+            problems, complete = self.fetch_all_problems(limit=limit)
+            if complete:
+                problems_data = [problem.to_dict() for problem in problems]
+                if limit is None:
+                    self._save_catalog(problems_data)
+                else:
+                    self._save_to_cache(cache_key, {"problems": problems_data})
+                self._clear_page_caches()
+                return self._remember_problems(cache_key, problems, 6)
+            return problems
+
+        data = self._fetch_page(0, limit)
+        if not data:
+            return []
+
+        problems = self._convert_questions(data.get('questions', []))
+
+        # 캐시에 저장
+        cache_data = {"problems": [problem.to_dict() for problem in problems]}
+        self._save_to_cache(cache_key, cache_data)
+
+        return self._remember_problems(cache_key, problems, 6)
+
+    def fetch_all_problems(self, limit: Optional[int] = None,
+                           on_page: Optional[Callable[[int, List[AlgorithmProblem]], None]] = None
+                           ) -> Tuple[List[AlgorithmProblem], bool]:
+        """problemsetQuestionList 페이지들을 제한된 동시성으로 병렬 수집합니다.
+
+        각 페이지는 도착하는 즉시 변환되어 페이지 캐시에 기록되므로, 중단된 수집은
+        다음 호출에서 이미 받은 페이지를 건너뛰고 이어서 진행합니다.
+        (문제 목록, 모든 페이지 수집 성공 여부) 튜플을 반환하며 결과는 페이지 순서대로 정렬됩니다.
+        """
+        first_page = self._load_or_fetch_page(0)
+        if first_page is None:
+            return [], False
+
+        total = first_page['total']
+        if limit:
+            total = min(total, limit)
+
+        pages: Dict[int, List[AlgorithmProblem]] = {0: first_page['problems']}
+        if on_page:
+            on_page(0, first_page['problems'])
+
+        page_count = (total + self.page_size - 1) // self.page_size
+        failed_pages = []
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {
+                executor.submit(self._load_or_fetch_page, page_index): page_index
+                for page_index in range(1, page_count)
+            }
+            for future in as_completed(futures):
+                page_index = futures[future]
+                try:
+                    page = future.result()
+                except Exception as e:
+                    self.logger.warning(f"페이지 {page_index} 수집 실패: {e}")
+                    page = None
+
+                if page is None:
+                    failed_pages.append(page_index)
+                    continue
 
-        if cached_data and isinstance(cached_data, dict):
-            problems_data = cached_data.get("problems", [])
-            return [AlgorithmProblem.from_dict(problem_data) for problem_data in problems_data if isinstance(problem_data, dict)]
+                pages[page_index] = page['problems']
+                if on_page:
+                    on_page(page_index, page['problems'])
 
+        if failed_pages:
+            self.logger.warning(f"LeetCode 페이지 {len(failed_pages)}개 수집 실패: {sorted(failed_pages)}")
+
+        problems = []
+        for page_index in sorted(pages):
+            problems.extend(pages[page_index])
+
+        return problems[:total], not failed_pages
+
+    def _load_or_fetch_page(self, page_index: int) -> Optional[Dict[str, Any]]:
+        """페이지 캐시를 확인하고 없으면 원격에서 가져와 캐시에 기록합니다."""
+        page_key = self._page_cache_key(page_index)
+        cached_page = self._load_from_cache(page_key, max_age_hours=6)
+        if cached_page and isinstance(cached_page, dict):
+            return {
+                'total': cached_page.get('total', 0),
+                'problems': self._problems_from_dicts(cached_page.get('problems', []))
+            }
+
+        data = self._fetch_page(page_index * self.page_size, self.page_size)
+        if data is None:
+            return None
+
+        problems = self._convert_questions(data.get('questions', []))
+        total = data.get('total') or 0
+        self._save_to_cache(page_key, {
+            'total': total,
+            'problems': [problem.to_dict() for problem in problems]
+        })
+        return {'total': total, 'problems': problems}
+
+    def _fetch_page(self, skip: int, limit: int) -> Optional[Dict[str, Any]]:
+        """problemsetQuestionList 한 페이지를 요청합니다."""
         variables = {
             "categorySlug": "",
-            "limit": limit or 100,
-            "skip": 0,
+            "limit": limit,
+            "skip": skip,
             "filters": {}
         }
 
         data = self._make_graphql_request(self.problems_query, variables)
-
         if not data:
-            return []
+            return None
 
-        problems = []
-        questions = data.get('data', {}).get('problemsetQuestionList', {}).get('questions', [])
+        return (data.get('data') or {}).get('problemsetQuestionList') or None
 
-        for question in questions:
-            try:
-                problem = self._convert_to_algorithm_problem(question)
-                if problem:
-                    problems.append(problem)
-            except Exception as e:
-                self.logger.warning(f"문제 변환 실패: {e}")
-                continue
+    def _convert_questions(self, questions: List[Dict[str, Any]]) -> List[AlgorithmProblem]:
+        """LeetCode 질문 목록을 AlgorithmProblem 목록으로 변환합니다."""
+        return self._convert_records(questions)
 
-        # 캐시에 저장
-        cache_data = {"problems": [problem.to_dict() for problem in problems]}
-        self._save_to_cache(cache_key, cache_data)
+    def _page_cache_key(self, page_index: int) -> str:
+        """페이지 캐시 키를 반환합니다."""
+        return f"problems_page_{self.page_size}_{page_index}"
 
-        return problems
+    def _clear_page_caches(self) -> None:
+        """전체 목록 저장 후 더 이상 필요 없는 페이지 캐시를 정리합니다."""
+        page_index = 0
+        while self._find_cache_path(self._page_cache_key(page_index)) is not None:
+            self._remove_cache(self._page_cache_key(page_index))
+            page_index += 1
 
     def get_problem_details(self, problem_id: str) -> Optional[AlgorithmProblem]:
         """특정 문제의 상세 정보를 가져옵니다."""
-        cache_key = f"problem_details_{problem_id}"
-        cached_data = self._load_from_cache(cache_key, max_age_hours=24)
-
-        if cached_data:
-            return AlgorithmProblem.from_dict(cached_data)
+        # 카탈로그 인덱스에서 찾기
+        return self._get_problem_from_catalog(problem_id)
 
-        # 문제 목록에서 찾기
-        problems = self.get_problems(limit=1000)
+    def fetch_statement_html(self, problem: AlgorithmProblem) -> Optional[str]:
+        """LeetCode 문제 본문(question.content) HTML을 가져옵니다."""
+        if not problem.platform_url:
+            return None
 
-        for problem in problems:
-            if problem.platform_problem_id == problem_id:
-                self._save_to_cache(cache_key, problem.to_dict())
-                return problem
+        title_slug = problem.platform_url.rstrip('/').rsplit('/', 1)[-1]
+        data = self._make_graphql_request(self.content_query, {"titleSlug": title_slug})
+        if not data:
+            return None
 
-        return None
+        question = (data.get('data') or {}).get('question') or {}
+        return question.get('content')
 
     def _make_graphql_request(self, query: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """GraphQL 요청을 수행합니다."""
@@ -351,7 +1257,7 @@ class LeetCodeProvider(RemoteProblemProvider):
         }
 
         try:
-            response = self.session.post(self.base_url, json=payload, headers=headers, timeout=30)
+            response = self._send_request('POST', self.base_url, json=payload, headers=headers, timeout=30)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -374,12 +1280,14 @@ class LeetCodeProvider(RemoteProblemProvider):
                 if tag:
                     tags.add(tag)
 
+            platform_problem_id = lc_question.get('frontendQuestionId', '')
             problem = AlgorithmProblem(
+                id=self._make_problem_id(platform_problem_id),
                 title=lc_question.get('title', ''),
                 description=f"LeetCode 문제: {lc_question.get('title', '')}",
                 difficulty=difficulty,
                 platform=ProblemPlatform.LEETCODE,
-                platform_problem_id=lc_question.get('frontendQuestionId', ''),
+                platform_problem_id=platform_problem_id,
                 platform_url=f"https://leetcode.com/problems/{lc_question.get('titleSlug', '')}/",
                 time_limit=1.0,  # LeetCode 기본값
                 memory_limit=64,  # LeetCode 기본값
@@ -400,48 +1308,18 @@ class LeetCodeProvider(RemoteProblemProvider):
 
     def _map_difficulty(self, lc_difficulty: str) -> ProblemDifficulty:
         """LeetCode 난이도를 ProblemDifficulty로 매핑합니다."""
-        mapping = {
-            'Easy': ProblemDifficulty.EASY,
-            'Medium': ProblemDifficulty.MEDIUM,
-            'Hard': ProblemDifficulty.HARD
-        }
-        return mapping.get(lc_difficulty, ProblemDifficulty.MEDIUM)
+        return self.DIFFICULTY_MAPPING.get(lc_difficulty, ProblemDifficulty.MEDIUM)
 
     def _map_tag(self, lc_tag: str) -> Optional[ProblemTag]:
         """LeetCode 태그를 ProblemTag로 매핑합니다."""
-        tag_mapping = {
-            'Array': ProblemTag.ARRAY,
-            'String': ProblemTag.STRING,
-            'Linked List': ProblemTag.LINKED_LIST,
-            'Stack': ProblemTag.STACK,
-            'Queue': ProblemTag.QUEUE,
-            'Tree': ProblemTag.TREE,
-            'Graph': ProblemTag.GRAPH,
-            'Hash Table': ProblemTag.HASH_TABLE,
-            'Trie': ProblemTag.TRIE,
-            'Depth-First Search': ProblemTag.DFS,
-            'Breadth-First Search': ProblemTag.BFS,
-            'Dynamic Programming': ProblemTag.DYNAMIC_PROGRAMMING,
-            'Greedy': ProblemTag.GREEDY,
-            'Backtracking': ProblemTag.BACKTRACKING,
-            'Binary Search': ProblemTag.BINARY_SEARCH,
-            'Two Pointers': ProblemTag.TWO_POINTERS,
-            'Sliding Window': ProblemTag.SLIDING_WINDOW,
-            'Sorting': ProblemTag.SORTING,
-            'Bit Manipulation': ProblemTag.BIT_MANIPULATION,
-            'Math': ProblemTag.MATH,
-            'Geometry': ProblemTag.GEOMETRY,
-            'Combinatorics': ProblemTag.COMBINATORICS
-        }
-
-        return tag_mapping.get(lc_tag)
+        return self.TAG_MAPPING.get(lc_tag)
 
 
 class KaggleProvider(RemoteProblemProvider):
     """Kaggle API 연동"""
 
-    def __init__(self, api_token_path: str = "kaggle.json", cache_dir: str = "cache"):
-        super().__init__(ProblemPlatform.KAGGLE, cache_dir)
+    def __init__(self, api_token_path: str = "kaggle.json", cache_dir: str = "cache", **cache_options):
+        super().__init__(ProblemPlatform.KAGGLE, cache_dir, **cache_options)
         self.api_token_path = api_token_path
         self.base_url = "https://www.kaggle.com/api/v1"
 
@@ -464,12 +1342,12 @@ class KaggleProvider(RemoteProblemProvider):
     def get_problems(self, limit: Optional[int] = None) -> List[AlgorithmProblem]:
         """Kaggle에서 알고리즘 관련 데이터셋을 가져옵니다."""
         cache_key = f"problems_list_{limit or 'all'}"
-        cached_data = self._load_from_cache(cache_key, max_age_hours=12)
-
-        if cached_data and isinstance(cached_data, dict):
-            problems_data = cached_data.get("problems", [])
-            return [AlgorithmProblem.from_dict(problem_data) for problem_data in problems_data if isinstance(problem_data, dict)]
+        return self._get_problems_with_revalidation(
+            cache_key, 12, lambda: self._fetch_problems(limit, cache_key)
+        )
 
+    def _fetch_problems(self, limit: Optional[int], cache_key: str) -> List[AlgorithmProblem]:
+        """데이터셋 목록을 원격에서 가져와 캐시에 저장합니다."""
         # Kaggle API를 통한 데이터셋 검색
         search_url = f"{self.base_url}/datasets/search"
         params = {
@@ -500,7 +1378,7 @@ class KaggleProvider(RemoteProblemProvider):
         cache_data = {"problems": [problem.to_dict() for problem in problems]}
         self._save_to_cache(cache_key, cache_data)
 
-        return problems
+        return self._remember_problems(cache_key, problems, 12)
 
     def get_problem_details(self, problem_id: str) -> Optional[AlgorithmProblem]:
         """특정 문제의 상세 정보를 가져옵니다."""
@@ -508,7 +1386,11 @@ class KaggleProvider(RemoteProblemProvider):
         cached_data = self._load_from_cache(cache_key, max_age_hours=24)
 
         if cached_data:
-            return AlgorithmProblem.from_dict(cached_data)
+            # 이전 형식은 문제 딕셔너리 자체를 저장
+            cached_problems = cached_data.get('problems', [cached_data])
+            if not cached_problems:
+                return None
+            return AlgorithmProblem.from_dict(cached_problems[0])
 
         # 데이터셋 상세 정보 가져오기
         dataset_url = f"{self.base_url}/datasets/{problem_id}"
@@ -519,7 +1401,7 @@ class KaggleProvider(RemoteProblemProvider):
 
         problem = self._convert_to_algorithm_problem(data)
         if problem:
-            self._save_to_cache(cache_key, problem.to_dict())
+            self._save_to_cache(cache_key, {'problems': [problem.to_dict()]})
 
         return problem
 
@@ -540,12 +1422,14 @@ class KaggleProvider(RemoteProblemProvider):
             if 'array' in title:
                 tags.add(ProblemTag.ARRAY)
 
+            platform_problem_id = kaggle_dataset.get('ref', '')
             problem = AlgorithmProblem(
+                id=self._make_problem_id(platform_problem_id),
                 title=kaggle_dataset.get('title', ''),
                 description=kaggle_dataset.get('description', ''),
                 difficulty=ProblemDifficulty.MEDIUM,  # Kaggle은 대부분 중간 난이도
                 platform=ProblemPlatform.KAGGLE,
-                platform_problem_id=kaggle_dataset.get('ref', ''),
+                platform_problem_id=platform_problem_id,
                 platform_url=f"https://www.kaggle.com/datasets/{kaggle_dataset.get('ref', '')}",
                 time_limit=5.0,  # Kaggle은 더 긴 시간 제한
                 memory_limit=512,  # Kaggle은 더 큰 메모리 제한
@@ -565,21 +1449,56 @@ class KaggleProvider(RemoteProblemProvider):
             return None
 
 
+# 기본 프로바이더 등록 (외부 플랫폼은 provider_registry의 엔트리 포인트로 추가)
+register_provider(ProblemPlatform.CODEFORCES, CodeforcesProvider)
+register_provider(ProblemPlatform.LEETCODE, LeetCodeProvider)
+register_provider(ProblemPlatform.KAGGLE, KaggleProvider)
+
+
 class RemoteProblemManager:
-    """외부 플랫폼 문제 관리자"""
+    """외부 플랫폼 문제 관리자
 
-    def __init__(self, cache_dir: str = "cache"):
+    프로바이더는 get_provider로 처음 요청될 때 레지스트리의 팩토리로 생성됩니다.
+    """
+
+    def __init__(self, cache_dir: str = "cache", catalog_max_age_hours: float = 6,
+                 cache_format: str = "json", cache_compression: Optional[str] = None,
+                 cache_layout: str = "content"):
         self.cache_dir = cache_dir
-        self.providers = {
-            ProblemPlatform.CODEFORCES: CodeforcesProvider(cache_dir),
-            ProblemPlatform.LEETCODE: LeetCodeProvider(cache_dir),
-            ProblemPlatform.KAGGLE: KaggleProvider(cache_dir=cache_dir)
+        self.cache_options = {
+            'cache_format': cache_format,
+            'cache_compression': cache_compression,
+            'cache_layout': cache_layout
         }
+        # 생성된 프로바이더만 보관 (플랫폼 -> 인스턴스)
+        self.providers: Dict[ProblemPlatform, RemoteProblemProvider] = {}
+        self._providers_lock = threading.Lock()
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # 난이도/태그 조회용 인덱스 카탈로그
+        self.catalog_max_age_hours = catalog_max_age_hours
+        self.catalog = ProblemCatalog(os.path.join(cache_dir, "catalog.sqlite3"))
+
+        # 플랫폼 간 중복 문제 인덱스 (동기화/수집되는 문제를 점진적으로 추가)
+        self.duplicate_index = DuplicateIndex()
+
     def get_provider(self, platform: ProblemPlatform) -> Optional[RemoteProblemProvider]:
-        """플랫폼별 프로바이더를 반환합니다."""
-        return self.providers.get(platform)
+        """플랫폼별 프로바이더를 반환합니다. 처음 요청될 때 생성합니다."""
+        provider = self.providers.get(platform)
+        if provider is not None:
+            return provider
+
+        with self._providers_lock:
+            provider = self.providers.get(platform)
+            if provider is None:
+                try:
+                    provider = create_provider(platform, cache_dir=self.cache_dir, **self.cache_options)
+                except Exception as e:
+                    self.logger.error(f"프로바이더 생성 실패 ({platform}): {e}")
+                    return None
+                if provider is not None:
+                    self.providers[platform] = provider
+        return provider
 
     def get_all_problems(self, platform: ProblemPlatform, limit: Optional[int] = None) -> List[AlgorithmProblem]:
         """특정 플랫폼에서 모든 문제를 가져옵니다."""
@@ -594,6 +1513,59 @@ class RemoteProblemManager:
             self.logger.error(f"문제 가져오기 실패 ({platform}): {e}")
             return []
 
+    def get_problems_from_all_platforms(
+            self, limit: Optional[int] = None, timeout: Optional[float] = 60.0,
+            platforms: Optional[List[ProblemPlatform]] = None,
+            on_result: Optional[Callable[[ProblemPlatform, List[AlgorithmProblem]], None]] = None
+    ) -> ProblemCollection:
+        """여러 플랫폼에서 동시에 문제를 가져와 중복 없이 하나의 컬렉션으로 합칩니다.
+
+        다른 플랫폼에 이미 들어온 같은 문제는 duplicate_index로 찾아 제외합니다.
+        각 프로바이더는 별도 스레드에서 실행되므로 전체 소요 시간은 가장 느린 플랫폼에 맞춰지며,
+        on_result 콜백으로 플랫폼별 결과를 완료되는 순서대로 받을 수 있습니다.
+        timeout(초) 안에 끝나지 않은 플랫폼은 제외하고 그때까지의 결과만 반환합니다.
+        """
+        platforms = platforms or self.get_supported_platforms()
+        collection = ProblemCollection("All Platforms")
+        if not platforms:
+            return collection
+        seen = set()
+
+        executor = ThreadPoolExecutor(max_workers=len(platforms), thread_name_prefix="platform-fetch")
+        futures = {executor.submit(self.get_all_problems, platform, limit): platform for platform in platforms}
+        pending = set(futures)
+
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                platform = futures[future]
+                problems = future.result()
+
+                self.duplicate_index.add_many(problems)
+                for problem in problems:
+                    key = problem_key(problem)
+                    if key in seen:
+                        continue
+                    if any(duplicate in seen for duplicate in self.duplicate_index.find_duplicates(problem)):
+                        continue
+                    seen.add(key)
+                    collection.add_problem(problem)
+
+                self.logger.info(f"{platform} 문제 {len(problems)}개 수신")
+                if on_result:
+                    try:
+                        on_result(platform, problems)
+                    except Exception as e:
+                        self.logger.error(f"결과 콜백 실패 ({platform}): {e}")
+        except FutureTimeoutError:
+            timed_out = ", ".join(str(futures[future]) for future in pending)
+            self.logger.warning(f"제한 시간 초과로 제외된 플랫폼: {timed_out}")
+        finally:
+            # 늦게 끝나는 프로바이더를 기다리지 않고 반환
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return collection
+
     def get_problem_details(self, platform: ProblemPlatform, problem_id: str) -> Optional[AlgorithmProblem]:
         """특정 문제의 상세 정보를 가져옵니다."""
         provider = self.get_provider(platform)
@@ -607,29 +1579,51 @@ class RemoteProblemManager:
             self.logger.error(f"문제 상세 정보 가져오기 실패 ({platform}): {e}")
             return None
 
+    def sync_catalog(self, platform: ProblemPlatform, force: bool = False) -> bool:
+        """플랫폼의 전체 문제 목록을 로컬 카탈로그에 동기화합니다."""
+        if not force and self.catalog.is_synced(platform, self.catalog_max_age_hours):
+            return True
+
+        problems = self.get_all_problems(platform)
+        provider = self.get_provider(platform)
+        if provider is not None:
+            # 만료된 목록을 받았다면 백그라운드 갱신을 기다린 뒤 갱신된 목록을 다시 가져옴
+            provider.wait_for_refreshes()
+            problems = self.get_all_problems(platform) or problems
+        if not problems:
+            # 동기화 실패 시 기존 카탈로그(있다면)를 그대로 사용
+            return self.catalog.is_synced(platform)
+
+        # 동기화 시각은 목록을 원격에서 가져온 시각 (갱신에 실패해 만료된 목록이면 다음 조회 때 다시 동기화)
+        data_age = provider.get_catalog_age_hours() if provider is not None else None
+        catalog_age = self.catalog.get_sync_age_hours(platform)
+        if data_age is not None and catalog_age is not None and catalog_age <= data_age:
+            return True
+        synced_at = time.time() - data_age * 3600 if data_age is not None else None
+
+        try:
+            self.catalog.replace_platform(platform, problems, synced_at)
+            self.duplicate_index.add_many(problems)
+            return True
+        except Exception as e:
+            self.logger.error(f"카탈로그 동기화 실패 ({platform}): {e}")
+            return False
+
     def get_problems_by_difficulty(self, platform: ProblemPlatform,
                                  difficulty: ProblemDifficulty,
                                  limit: Optional[int] = None) -> List[AlgorithmProblem]:
         """특정 난이도의 문제들을 가져옵니다."""
-        all_problems = self.get_all_problems(platform, limit=limit * 3 if limit else None)
-        filtered_problems = [p for p in all_problems if p.difficulty == difficulty]
-
-        if limit:
-            filtered_problems = filtered_problems[:limit]
-
-        return filtered_problems
+        if not self.sync_catalog(platform):
+            return []
+        return self.catalog.get_by_difficulty(platform, difficulty, limit)
 
     def get_problems_by_tag(self, platform: ProblemPlatform,
                            tag: ProblemTag,
                            limit: Optional[int] = None) -> List[AlgorithmProblem]:
         """특정 태그의 문제들을 가져옵니다."""
-        all_problems = self.get_all_problems(platform, limit=limit * 3 if limit else None)
-        filtered_problems = [p for p in all_problems if tag in p.tags]
-
-        if limit:
-            filtered_problems = filtered_problems[:limit]
-
-        return filtered_problems
+        if not self.sync_catalog(platform):
+            return []
+        return self.catalog.get_by_tag(platform, tag, limit)
 
     def refresh_cache(self, platform: ProblemPlatform) -> bool:
         """특정 플랫폼의 캐시를 새로고침합니다."""
@@ -640,9 +1634,11 @@ class RemoteProblemManager:
         try:
             # 캐시 파일들 삭제
             import glob
-            cache_pattern = os.path.join(provider.cache_dir, f"{platform.name.lower()}_*.json")
+            cache_pattern = os.path.join(provider.cache_dir, f"{platform.name.lower()}_*")
+            provider.clear_memory_cache()
             for cache_file in glob.glob(cache_pattern):
                 os.remove(cache_file)
+            self.catalog.clear_platform(platform)
 
             self.logger.info(f"{platform} 캐시 새로고침 완료")
             return True
@@ -650,6 +1646,10 @@ class RemoteProblemManager:
             self.logger.error(f"캐시 새로고침 실패 ({platform}): {e}")
             return False
 
+    def get_metrics(self) -> Dict[ProblemPlatform, Dict[str, Any]]:
+        """생성된 프로바이더별 메트릭 요약을 반환합니다."""
+        return {platform: provider.get_metrics() for platform, provider in list(self.providers.items())}
+
     def get_supported_platforms(self) -> List[ProblemPlatform]:
-        """지원하는 플랫폼 목록을 반환합니다."""
-        return list(self.providers.keys())
\ No newline at end of file
+        """지원하는 (등록된) 플랫폼 목록을 반환합니다. 프로바이더를 생성하지는 않습니다."""
+        return get_registered_platforms()
\ No newline at end of file
@@ -0,0 +1,344 @@
+"""
+원격 요청 계층
+
+이 모듈은 원격 문제 제공자들이 공유하는 HTTP 요청 계층을 제공합니다.
+플랫폼별 토큰 버킷 속도 제한, 지터가 적용된 지수 백오프 재시도,
+업스트림 장애 시 즉시 실패하는 서킷 브레이커, 엔드포인트별 지연 시간 히스토그램을 포함합니다.
+"""
+
+import logging
+import random
+import threading
+import time
+from bisect import bisect_left
+from enum import Enum, auto
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+
+class CircuitBreakerOpenError(requests.exceptions.RequestException):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않았을 때 발생하는 예외"""
+
+
+class RateLimitTimeoutError(requests.exceptions.RequestException):
+    """속도 제한 토큰을 제한 시간 안에 얻지 못했을 때 발생하는 예외"""
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate_per_second: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_second)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+    def try_acquire(self) -> float:
+        """토큰을 하나 얻으면 0을, 아니면 다음 토큰까지 기다려야 할 시간(초)을 반환합니다."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate_per_second
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """토큰을 얻을 때까지 기다립니다. 제한 시간 안에 얻지 못하면 False."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            wait_time = self.try_acquire()
+            if wait_time == 0:
+                return True
+            if deadline is not None and time.monotonic() + wait_time > deadline:
+                return False
+            time.sleep(wait_time)
+
+
+class CircuitState(Enum):
+    """서킷 브레이커 상태"""
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커"""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._half_open_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인합니다. 열린 상태에서는 회복 시간이 지나야 시험 요청 하나를 허용합니다."""
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+                self._half_open_in_flight = False
+
+            # HALF_OPEN: 시험 요청은 한 번에 하나만
+            if self._half_open_in_flight:
+                return False
+            self._half_open_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """성공을 기록하고 회로를 닫습니다."""
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.consecutive_failures = 0
+            self._half_open_in_flight = False
+
+    def release(self) -> None:
+        """결과를 기록하지 않고 시험 요청 권한만 반납합니다 (상태는 유지)."""
+        with self._lock:
+            self._half_open_in_flight = False
+
+    def record_failure(self) -> None:
+        """실패를 기록하고 임계값을 넘거나 시험 요청이 실패하면 회로를 엽니다."""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+            self._half_open_in_flight = False
+
+
+# 지연 시간 히스토그램 키에 쓰는 경로 세그먼트 수 (나머지는 '*'로 묶음)
+MAX_ROUTE_SEGMENTS = 3
+
+
+def route_template(url: str) -> str:
+    """URL을 호스트와 경로 템플릿으로 바꿉니다.
+
+    숫자로만 된 세그먼트는 {id}로, MAX_ROUTE_SEGMENTS개 이후의 세그먼트는 '*' 하나로 바꾸므로
+    문제 페이지처럼 URL이 문제마다 다른 요청도 히스토그램 수가 늘어나지 않습니다.
+        https://codeforces.com/problemset/problem/1234/A -> codeforces.com/problemset/problem/{id}/*
+    """
+    parsed = urlparse(url)
+    segments = [
+        '{id}' if segment.isdigit() else segment
+        for segment in parsed.path.split('/') if segment
+    ]
+    if len(segments) > MAX_ROUTE_SEGMENTS:
+        segments = segments[:MAX_ROUTE_SEGMENTS] + ['*']
+    return parsed.netloc + '/' + '/'.join(segments)
+
+
+class LatencyHistogram:
+    """누적 버킷 기반 지연 시간 히스토그램 (초 단위)"""
+
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """관측값을 기록합니다."""
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.total += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """버킷별 누적 개수와 합계를 반환합니다."""
+        with self._lock:
+            cumulative = []
+            running = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float('inf'),), self._counts):
+                running += bucket_count
+                cumulative.append((upper_bound, running))
+            return {
+                'buckets': cumulative,
+                'count': self.count,
+                'sum': self.total,
+                'mean': self.total / self.count if self.count else 0.0
+            }
+
+
+class RetryPolicy:
+    """지터가 적용된 지수 백오프 재시도 정책"""
+
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def get_delay(self, attempt: int) -> float:
+        """재시도 전 대기 시간을 계산합니다 (full jitter)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class PlatformPolicy:
+    """플랫폼별 속도 제한 및 서킷 브레이커 묶음"""
+
+    def __init__(self, rate_per_second: float = 2.0, burst: Optional[float] = None,
+                 failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.rate_limiter = TokenBucket(rate_per_second, burst)
+        self.circuit_breaker = CircuitBreaker(failure_threshold, recovery_timeout)
+
+
+class RequestLayer:
+    """속도 제한, 재시도, 서킷 브레이커, 지연 시간 측정을 적용하는 공유 요청 계층"""
+
+    # 플랫폼별 기본 요청 한도 (Codeforces API는 2초당 1회 권장)
+    DEFAULT_PLATFORM_LIMITS = {
+        'codeforces': {'rate_per_second': 0.5, 'burst': 1},
+        'leetcode': {'rate_per_second': 5.0, 'burst': 5},
+        'kaggle': {'rate_per_second': 2.0, 'burst': 2}
+    }
+
+    def __init__(self, retry_policy: Optional[RetryPolicy] = None,
+                 rate_limit_timeout: Optional[float] = 60.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limit_timeout = rate_limit_timeout
+        self._sleep = sleep
+        self._policies: Dict[str, PlatformPolicy] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def configure_platform(self, platform_key: str, rate_per_second: float = 2.0,
+                           burst: Optional[float] = None, failure_threshold: int = 5,
+                           recovery_timeout: float = 30.0) -> None:
+        """플랫폼의 속도 제한과 서킷 브레이커 설정을 지정합니다."""
+        with self._lock:
+            self._policies[platform_key] = PlatformPolicy(
+                rate_per_second, burst, failure_threshold, recovery_timeout
+            )
+
+    def get_policy(self, platform_key: str) -> PlatformPolicy:
+        """플랫폼 정책을 반환합니다. 없으면 기본값으로 생성합니다."""
+        with self._lock:
+            policy = self._policies.get(platform_key)
+            if policy is None:
+                policy = PlatformPolicy(**self.DEFAULT_PLATFORM_LIMITS.get(platform_key, {}))
+                self._policies[platform_key] = policy
+            return policy
+
+    def request(self, platform_key: str, method: str, url: str,
+                session: Optional[requests.Session] = None, **kwargs) -> requests.Response:
+        """요청 계층 정책을 적용하여 HTTP 요청을 수행합니다.
+
+        재시도 가능한 상태 코드(429, 5xx)가 끝까지 반복되면 마지막 응답을 그대로 반환하며,
+        연결 오류는 마지막 시도 후 예외로 전달됩니다.
+        """
+        session = session or requests
+        policy = self.get_policy(platform_key)
+        breaker = policy.circuit_breaker
+        histogram = self._get_histogram(f"{platform_key} {method.upper()} {route_template(url)}")
+
+        for attempt in range(self.retry_policy.max_attempts):
+            # 토큰을 먼저 얻어야 시험 요청 권한을 잡은 채로 대기하거나 시간 초과로 빠져나가지 않음
+            if not policy.rate_limiter.acquire(timeout=self.rate_limit_timeout):
+                raise RateLimitTimeoutError(f"{platform_key} 요청 한도 대기 시간 초과")
+
+            if not breaker.allow_request():
+                raise CircuitBreakerOpenError(f"{platform_key} 서킷 브레이커 열림: 요청을 보내지 않습니다")
+
+            is_last_attempt = attempt == self.retry_policy.max_attempts - 1
+            outcome_recorded = False
+            start_time = time.monotonic()
+            try:
+                try:
+                    response = session.request(method, url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    histogram.observe(time.monotonic() - start_time)
+                    breaker.record_failure()
+                    outcome_recorded = True
+                    if is_last_attempt:
+                        raise
+                    delay = self.retry_policy.get_delay(attempt)
+                    self.logger.warning(f"요청 실패, {delay:.2f}초 후 재시도 ({attempt + 1}/{self.retry_policy.max_attempts}): {e}")
+                    self._sleep(delay)
+                    continue
+
+                histogram.observe(time.monotonic() - start_time)
+
+                if response.status_code not in self.retry_policy.RETRYABLE_STATUS_CODES:
+                    breaker.record_success()
+                    outcome_recorded = True
+                    return response
+
+                breaker.record_failure()
+                outcome_recorded = True
+                if is_last_attempt:
+                    return response
+            finally:
+                # 업스트림 상태와 무관한 예외(잘못된 URL 등)로 끝나면 결과 없이 시험 요청 권한만 반납
+                if not outcome_recorded:
+                    breaker.release()
+
+            delay = self._get_retry_after(response) or self.retry_policy.get_delay(attempt)
+            self.logger.warning(
+                f"HTTP {response.status_code}, {delay:.2f}초 후 재시도 ({attempt + 1}/{self.retry_policy.max_attempts})"
+            )
+            response.close()
+            self._sleep(delay)
+
+        raise requests.exceptions.RetryError(f"{platform_key} 요청 재시도 횟수 초과")
+
+    def _get_retry_after(self, response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더(초 단위)를 해석합니다."""
+        retry_after = response.headers.get('Retry-After')
+        try:
+            return min(float(retry_after), self.retry_policy.max_delay) if retry_after else None
+        except ValueError:
+            return None
+
+    def _get_histogram(self, endpoint: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._histograms[endpoint] = histogram
+            return histogram
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 지연 시간 히스토그램을 반환합니다."""
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {endpoint: histogram.snapshot() for endpoint, histogram in histograms.items()}
+
+    def get_circuit_states(self) -> Dict[str, str]:
+        """플랫폼별 서킷 브레이커 상태를 반환합니다."""
+        with self._lock:
+            policies = dict(self._policies)
+        return {key: policy.circuit_breaker.state.name for key, policy in policies.items()}
+
+
+_default_request_layer: Optional[RequestLayer] = None
+_default_request_layer_lock = threading.Lock()
+
+
+def get_default_request_layer() -> RequestLayer:
+    """프로바이더들이 공유하는 기본 요청 계층을 반환합니다."""
+    global _default_request_layer
+    with _default_request_layer_lock:
+        if _default_request_layer is None:
+            _default_request_layer = RequestLayer()
+        return _default_request_layer
@@ -0,0 +1,201 @@
+"""
+스트리밍 JSON 파서
+
+이 모듈은 큰 JSON 응답에서 지정한 경로의 배열 요소를 내려받는 도중에 하나씩 디코딩하는 파서를 제공합니다.
+예를 들어 Codeforces problemset.problems 응답의 result.problems 배열을 전체 문서를 메모리에 올리지 않고
+요소 단위로 처리할 수 있으며, 메모리 사용량은 배열 요소 하나와 읽기 버퍼 크기로 제한됩니다.
+
+외부 의존성 없이 json.JSONDecoder.raw_decode로 요소를 디코딩합니다. 잘못된 입력은 해당 값을 읽는 시점에
+ValueError로 실패하며, 값 하나가 max_value_size 문자를 넘으면 나머지를 버퍼에 쌓지 않고 실패합니다.
+"""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Union
+
+
+_WHITESPACE = ' \t\n\r'
+
+# 소비한 버퍼를 잘라내는 기준 크기
+_COMPACT_THRESHOLD = 64 * 1024
+
+# 값 하나에 허용하는 기본 최대 크기 (문자 수)
+DEFAULT_MAX_VALUE_SIZE = 16 * 1024 * 1024
+
+# 버퍼 끝에서 이 거리 안의 디코딩 오류는 값이 잘린 것일 수 있음 (가장 긴 리터럴 '-Infinity' 기준)
+_TRUNCATION_MARGIN = 10
+
+# 숫자 뒤에 이어질 수 있는 문자 (청크 경계에서 잘린 숫자 판별용)
+_NUMBER_CHARS = frozenset('0123456789+-.eE')
+
+
+class _StreamReader:
+    """청크 단위 입력을 문자열 버퍼로 읽는 리더"""
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]], max_value_size: int = DEFAULT_MAX_VALUE_SIZE):
+        self._chunks = iter(chunks)
+        self.max_value_size = max_value_size
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """다음 청크를 버퍼에 추가합니다. 더 읽을 데이터가 없으면 False."""
+        if self.eof:
+            return False
+
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                if self.pos > _COMPACT_THRESHOLD:
+                    self.buffer = self.buffer[self.pos:]
+                    self.pos = 0
+                self.buffer += text
+                return True
+
+        self.buffer += self._decoder.decode(b'', final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """공백을 건너뛰고 다음 문자를 반환합니다 (소비하지 않음)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("JSON 입력이 예상보다 일찍 끝났습니다")
+
+    def expect(self, expected: str) -> str:
+        """다음 문자가 expected 중 하나인지 확인하고 소비합니다."""
+        char = self.peek()
+        if char not in expected:
+            raise ValueError(f"JSON 구문 오류: 위치 {self.pos}에서 '{expected}' 대신 '{char}'")
+        self.pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """다음 JSON 값 하나를 디코딩합니다.
+
+        값이 버퍼 끝에서 잘렸을 때만 더 읽고, 버퍼 안에서 이미 잘못된 토큰이면 바로 실패합니다.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self._is_truncated(e) and self._fill_value():
+                    continue
+                raise
+
+            # 버퍼 끝에서 끝난 숫자는 다음 청크에서 숫자가 더 이어질 수 있음 ('1' + '.5')
+            if not self.eof and self._may_continue(value, end) and self._fill_value():
+                continue
+
+            self.pos = end
+            return value
+
+    def _is_truncated(self, error: json.JSONDecodeError) -> bool:
+        """디코딩 오류가 버퍼 끝에서 값이 잘려서 생긴 것인지 판단합니다."""
+        if self.eof:
+            return False
+        # 문자열 스캐너는 닫는 따옴표 없이 입력 끝에 닿았을 때만 이 오류를 냄
+        if error.msg.startswith("Unterminated string"):
+            return True
+        return len(self.buffer) - error.pos < _TRUNCATION_MARGIN
+
+    def _may_continue(self, value: Any, end: int) -> bool:
+        """디코딩한 값 뒤에 같은 값이 더 이어질 수 있는지 확인합니다."""
+        if end == len(self.buffer):
+            return True
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return all(char in _NUMBER_CHARS for char in self.buffer[end:])
+
+    def _fill_value(self) -> bool:
+        """현재 값을 마저 읽기 위해 버퍼를 채웁니다. 값이 max_value_size를 넘으면 ValueError."""
+        if len(self.buffer) - self.pos > self.max_value_size:
+            raise ValueError(f"JSON 값이 최대 크기({self.max_value_size}자)를 넘습니다: 위치 {self.pos}")
+        return self.fill()
+
+
+def _iter_path(reader: _StreamReader, path: Sequence[str], expected: Optional[Dict[str, Any]] = None,
+               read_to_end: bool = False) -> Iterator[Any]:
+    """현재 위치의 객체에서 path를 따라 내려가 배열 요소를 반환합니다.
+
+    expected의 키는 이 객체에서 값을 확인하며, 확인할 키가 남아 있거나 read_to_end이면
+    배열을 읽은 뒤에도 객체 끝까지 읽습니다.
+    """
+    pending = dict(expected or {})
+    read_to_end = read_to_end or bool(pending)
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.read_value()
+            reader.expect(':')
+
+            if key in pending:
+                _check_expected(key, reader.read_value(), pending.pop(key))
+            elif key == path[0]:
+                char = reader.peek()
+                if len(path) == 1 and char == '[':
+                    yield from _iter_array(reader)
+                elif len(path) > 1 and char == '{':
+                    yield from _iter_path(reader, path[1:], read_to_end=read_to_end)
+                else:
+                    reader.read_value()
+                if not read_to_end:
+                    return
+            else:
+                # 경로에 없는 값은 디코딩 후 버림
+                reader.read_value()
+
+            if reader.expect(',}') == '}':
+                break
+
+    for key, expected_value in pending.items():
+        raise ValueError(f"JSON 응답에 '{key}' 값이 없습니다 (기대값 {expected_value!r})")
+
+
+def _check_expected(key: str, value: Any, expected_value: Any) -> None:
+    if value != expected_value:
+        raise ValueError(f"JSON 응답의 '{key}' 값이 {expected_value!r}가 아닙니다: {value!r}")
+
+
+def _iter_array(reader: _StreamReader) -> Iterator[Any]:
+    """현재 위치의 배열 요소를 하나씩 반환합니다."""
+    reader.expect('[')
+    if reader.peek() == ']':
+        reader.pos += 1
+        return
+
+    while True:
+        yield reader.read_value()
+        if reader.expect(',]') == ']':
+            return
+
+
+def iter_json_items(chunks: Iterable[Union[bytes, str]], path: Sequence[str],
+                    expected: Optional[Dict[str, Any]] = None,
+                    max_value_size: int = DEFAULT_MAX_VALUE_SIZE) -> Iterator[Any]:
+    """JSON 청크 스트림에서 path 위치 배열의 요소를 디코딩되는 대로 반환합니다.
+
+    path는 최상위 객체부터의 키 목록입니다 (예: ("result", "problems")).
+    경로가 없거나 배열이 아니면 아무 요소도 반환하지 않으며, 구문 오류는 ValueError로 전달됩니다.
+    배열을 모두 읽으면 나머지 문서는 읽지 않습니다.
+
+    expected는 최상위 객체에서 확인할 키와 값입니다 (예: {"status": "OK"}). 값이 다르면 그 키를 읽는
+    즉시, 키가 없으면 문서 끝에서 ValueError가 발생합니다. 키가 배열 뒤에 있으면 요소를 반환한 뒤에
+    실패할 수 있으므로 호출자는 반복이 끝날 때까지 결과를 확정하지 않아야 합니다.
+    """
+    if not path:
+        raise ValueError("JSON 경로가 비어 있습니다")
+
+    reader = _StreamReader(chunks, max_value_size)
+    yield from _iter_path(reader, list(path), expected)
@@ -0,0 +1,78 @@
+"""
+시작 워밍업 테스트
+
+    python -m pytest tests
+"""
+
+from algorithm_system.app_warmup import AppWarmup, WarmupProgressView, WarmupStep
+
+
+class RecordingScheduler:
+    """BackgroundTaskOptimizer처럼 작업 반환값을 task_results에 보관하는 동기 스케줄러"""
+
+    def __init__(self):
+        self.task_results = {}
+
+    def add_task(self, task_id, task_func, priority=5, callback=None):
+        self.task_results[task_id] = {'result': task_func()}
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay_ms, func):
+        self.scheduled.append(func)
+
+
+class FakeTree:
+    def __init__(self):
+        self.rows = []
+
+    def get_children(self):
+        return list(range(len(self.rows)))
+
+    def delete(self, item):
+        self.rows.pop()
+
+    def insert(self, parent, index, values):
+        self.rows.append(values)
+
+
+def make_warmup(scheduler):
+    return AppWarmup([
+        WarmupStep("problems", "문제 카탈로그", lambda: ["p"] * 1000, stage=0),
+        WarmupStep("recommendations", "추천 문제", lambda: ["p1", "p2"], stage=1)
+    ], scheduler=scheduler)
+
+
+def test_results_are_released_after_poll():
+    scheduler = RecordingScheduler()
+    warmup = make_warmup(scheduler)
+    root, tree, shown = FakeRoot(), FakeTree(), []
+    view = WarmupProgressView(root, warmup, tree, shown.append, lambda: shown.append(None))
+
+    view.start()
+    assert warmup.is_complete
+    assert set(scheduler.task_results) == {"warmup_problems", "warmup_recommendations"}
+    # 반환값 대신 results로만 전달되므로 스케줄러에는 큰 결과가 남지 않음
+    assert all(entry['result'] is None for entry in scheduler.task_results.values())
+
+    root.scheduled.pop()()
+    assert shown == [["p1", "p2"]]
+    assert scheduler.task_results == {}
+    assert warmup.results == {}
+    assert root.scheduled == []
+
+
+def test_failed_recommendations_fall_back_to_refresh():
+    warmup = AppWarmup([WarmupStep("recommendations", "추천 문제", lambda: 1 / 0)])
+    root, tree, shown = FakeRoot(), FakeTree(), []
+    view = WarmupProgressView(root, warmup, tree, shown.append, lambda: shown.append("refresh"))
+
+    view.start()
+    assert warmup.wait(5)
+    root.scheduled.pop()()
+
+    assert shown == ["refresh"]
+    assert "recommendations" in warmup.errors
@@ -0,0 +1,44 @@
+"""
+비동기 프로바이더 테스트
+
+    python -m pytest tests
+"""
+
+import asyncio
+
+from algorithm_system.async_provider import AsyncProblemProvider
+from algorithm_system.remote_problem_provider import CodeforcesProvider
+
+
+def test_wrapper_uses_its_own_session(tmp_path):
+    provider = CodeforcesProvider(cache_dir=str(tmp_path))
+    shared_adapter = provider.session.get_adapter("https://codeforces.com")
+    async_provider = AsyncProblemProvider(provider, max_concurrency=4)
+    try:
+        # 동기 API가 쓰는 세션의 어댑터는 그대로 두고, 비동기 호출 중에만 자체 세션을 사용
+        assert provider.session.get_adapter("https://codeforces.com") is shared_adapter
+        assert async_provider.session is not provider.session
+        assert async_provider.session.headers['User-Agent'] == provider.session.headers['User-Agent']
+
+        def current_session():
+            return getattr(provider._thread_session, 'session', None)
+
+        assert asyncio.run(async_provider._run(current_session)) is async_provider.session
+        assert current_session() is None
+    finally:
+        async_provider.close()
+
+
+def test_wrapper_works_across_event_loops(tmp_path):
+    provider = CodeforcesProvider(cache_dir=str(tmp_path))
+    async_provider = AsyncProblemProvider(provider, max_concurrency=1)
+    try:
+        async def run_many():
+            # 동시성 1에서 여러 작업이 세마포어를 기다리도록 함
+            return await asyncio.gather(*(async_provider._run(lambda value=value: value) for value in range(3)))
+
+        # 첫 루프에서 만든 세마포어가 다음 asyncio.run()에 재사용되지 않아야 함
+        assert asyncio.run(run_many()) == [0, 1, 2]
+        assert asyncio.run(run_many()) == [0, 1, 2]
+    finally:
+        async_provider.close()
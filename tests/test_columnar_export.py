@@ -0,0 +1,148 @@
+"""
+열 지향 내보내기 테스트
+
+feather/parquet/numpy 형식으로 내보낸 카탈로그를 다시 읽어 열 값과 집계가 보존되는지 확인합니다.
+numpy가 없으면 전체를, pyarrow가 없으면 feather/parquet 테스트를 건너뜁니다.
+
+    python -m pytest tests
+"""
+
+import math
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from algorithm_system.columnar_export import (
+    detect_format, export_catalog, export_collection, export_columnar, load_columnar
+)
+from algorithm_system.problem_catalog import ProblemCatalog
+from algorithm_system.problem_data_structures import (
+    AlgorithmProblem, ProblemCollection, ProblemDifficulty, ProblemMetadata, ProblemPlatform, ProblemTag,
+    tags_to_mask
+)
+
+
+FORMATS = ['feather', 'parquet', 'numpy']
+
+
+def require_format(format_name: str) -> None:
+    if format_name in ('feather', 'parquet'):
+        pytest.importorskip("pyarrow")
+
+
+def make_problems():
+    return [
+        AlgorithmProblem(
+            id="cf-4A", title="Watermelon", platform=ProblemPlatform.CODEFORCES, platform_problem_id="4A",
+            difficulty=ProblemDifficulty.EASY, tags={ProblemTag.MATH, ProblemTag.BRUTE_FORCE},
+            time_limit=1.0, memory_limit=64,
+            metadata=ProblemMetadata(solved_count=30, submission_count=100, success_rate=0.3)
+        ),
+        AlgorithmProblem(
+            id="cf-1B", title="Spreadsheets", platform=ProblemPlatform.CODEFORCES, platform_problem_id="1B",
+            difficulty=ProblemDifficulty.MEDIUM, tags={ProblemTag.MATH, ProblemTag.STRING},
+            metadata=ProblemMetadata(solved_count=10, submission_count=40, success_rate=0.25),
+            is_active=False
+        ),
+        AlgorithmProblem(
+            id="lc-1", title="Two Sum", platform=ProblemPlatform.LEETCODE, platform_problem_id="1",
+            difficulty=ProblemDifficulty.EASY, tags={ProblemTag.ARRAY, ProblemTag.HASH_TABLE},
+            metadata=ProblemMetadata(solved_count=50, submission_count=100, success_rate=0.5)
+        )
+    ]
+
+
+@pytest.mark.parametrize("format_name", FORMATS)
+def test_round_trip_preserves_columns(tmp_path, format_name):
+    require_format(format_name)
+    problems = make_problems()
+    path = str(tmp_path / "catalog.bin")
+
+    assert export_columnar(problems, path, format_name) == format_name
+    assert detect_format(path) == format_name
+
+    columns = load_columnar(path)
+    assert len(columns) == 3
+    assert list(columns.column('id')) == ["cf-4A", "cf-1B", "lc-1"]
+    assert list(columns.column('title')) == ["Watermelon", "Spreadsheets", "Two Sum"]
+    assert list(columns.column('platform_problem_id')) == ["4A", "1B", "1"]
+    assert [int(mask) for mask in columns.column('tag_mask')] == [tags_to_mask(p.tags) for p in problems]
+    assert list(columns.column('memory_limit')) == [64, -1, -1]
+    time_limits = columns.column('time_limit')
+    assert time_limits[0] == 1.0 and math.isnan(time_limits[1])
+    assert [bool(value) for value in columns.column('is_active')] == [True, False, True]
+
+
+@pytest.mark.parametrize("format_name", FORMATS)
+def test_aggregates(tmp_path, format_name):
+    require_format(format_name)
+    path = str(tmp_path / "catalog.bin")
+    export_columnar(make_problems(), path, format_name)
+    columns = load_columnar(path)
+
+    histogram = columns.difficulty_histogram()
+    assert histogram['EASY'] == 2 and histogram['MEDIUM'] == 1 and histogram['HARD'] == 0
+    assert columns.difficulty_histogram(ProblemPlatform.LEETCODE)['EASY'] == 1
+
+    assert columns.tag_counts() == {'MATH': 2, 'BRUTE_FORCE': 1, 'STRING': 1, 'ARRAY': 1, 'HASH_TABLE': 1}
+    assert columns.tag_counts(ProblemPlatform.CODEFORCES)['MATH'] == 2
+
+    tags, matrix = columns.tag_cooccurrence()
+    math_index, string_index = tags.index(ProblemTag.MATH), tags.index(ProblemTag.STRING)
+    assert matrix[math_index][math_index] == 2
+    assert matrix[math_index][string_index] == 1
+    assert matrix[string_index][tags.index(ProblemTag.ARRAY)] == 0
+
+    summary = columns.platform_summary()
+    assert set(summary) == {'CODEFORCES', 'LEETCODE'}
+    assert summary['CODEFORCES']['count'] == 2
+    assert summary['CODEFORCES']['active_rate'] == 0.5
+    assert summary['CODEFORCES']['solved_count'] == 40
+    assert summary['CODEFORCES']['solve_rate'] == pytest.approx(40 / 140)
+    assert summary['LEETCODE']['mean_success_rate'] == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("format_name", FORMATS)
+def test_empty_catalog(tmp_path, format_name):
+    require_format(format_name)
+    catalog = ProblemCatalog(str(tmp_path / "catalog.sqlite3"))
+    path = str(tmp_path / "empty.bin")
+    try:
+        export_catalog(catalog, path, format=format_name)
+    finally:
+        catalog.close()
+
+    columns = load_columnar(path)
+    assert len(columns) == 0
+    assert set(columns.difficulty_histogram().values()) == {0}
+    assert columns.tag_counts() == {}
+    assert columns.platform_summary() == {}
+    assert columns.tag_cooccurrence()[1].sum() == 0
+
+
+@pytest.mark.parametrize("format_name", FORMATS)
+def test_export_catalog_and_collection(tmp_path, format_name):
+    require_format(format_name)
+    problems = make_problems()
+
+    catalog = ProblemCatalog(str(tmp_path / "catalog.sqlite3"))
+    try:
+        catalog.replace_platform(ProblemPlatform.CODEFORCES, problems[:2])
+        catalog_path = str(tmp_path / "catalog.bin")
+        export_catalog(catalog, catalog_path, format=format_name)
+    finally:
+        catalog.close()
+    assert sorted(load_columnar(catalog_path).column('id')) == ["cf-1B", "cf-4A"]
+
+    collection = ProblemCollection()
+    for problem in problems:
+        collection.add_problem(problem)
+    collection_path = str(tmp_path / "collection.bin")
+    export_collection(collection, collection_path, format_name)
+    assert load_columnar(collection_path).platform_summary()['LEETCODE']['count'] == 1
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_columnar(make_problems(), str(tmp_path / "catalog.bin"), "csv")
@@ -0,0 +1,67 @@
+"""
+콘텐츠 주소 캐시 저장 구조 테스트
+
+같은 문제가 여러 캐시 항목에 들어가도 객체가 한 번만 저장되는지, 새로고침으로 다시 변환한 문제가
+같은 ID와 같은 객체를 쓰는지, 참조되지 않는 객체만 정리되는지 확인합니다.
+
+    python -m pytest tests
+"""
+
+from algorithm_system.content_store import ContentStore, collect_garbage
+from algorithm_system.remote_problem_provider import CodeforcesProvider
+
+
+def make_records(count: int):
+    return [
+        {'contestId': 100 + i, 'index': 'A', 'name': f"Problem {i}", 'rating': 800 + i * 100, 'tags': ['dp']}
+        for i in range(count)
+    ]
+
+
+def count_objects(cache_dir: str) -> int:
+    return len(list(ContentStore(cache_dir).iter_objects()))
+
+
+def test_content_layout_is_default(tmp_path):
+    assert CodeforcesProvider(cache_dir=str(tmp_path)).cache_layout == "content"
+
+
+def test_converted_problem_ids_are_stable(tmp_path):
+    provider = CodeforcesProvider(cache_dir=str(tmp_path))
+    first = provider._convert_batch(make_records(3))
+    second = provider._convert_batch(make_records(3))
+
+    assert [problem.id for problem in first] == [problem.id for problem in second]
+    assert len({problem.id for problem in first}) == 3
+
+
+def test_list_entries_share_problem_objects(tmp_path):
+    provider = CodeforcesProvider(cache_dir=str(tmp_path))
+    problems_data = [problem.to_dict() for problem in provider._convert_batch(make_records(5))]
+
+    provider._save_to_cache("problems_list_all", {"problems": problems_data})
+    provider._save_to_cache("problems_list_2", {"problems": problems_data[:2]})
+    assert count_objects(str(tmp_path)) == 5
+
+    # 새로고침으로 다시 변환해도 같은 객체를 참조하고, 저장된 ID는 메모리의 ID와 같음
+    refreshed = provider._convert_batch(make_records(5))
+    provider._save_to_cache("problems_list_all", {"problems": [problem.to_dict() for problem in refreshed]})
+    assert count_objects(str(tmp_path)) == 5
+
+    loaded = provider._load_from_cache("problems_list_all", max_age_hours=None)["problems"]
+    assert [problem_data['id'] for problem_data in loaded] == [problem.id for problem in refreshed]
+
+
+def test_garbage_collection_removes_only_unreferenced_objects(tmp_path):
+    provider = CodeforcesProvider(cache_dir=str(tmp_path))
+    problems_data = [problem.to_dict() for problem in provider._convert_batch(make_records(4))]
+    provider._save_to_cache("problems_list_all", {"problems": problems_data})
+    provider._save_to_cache("problems_list_all", {"problems": problems_data[:1]})
+
+    assert len(collect_garbage(str(tmp_path), min_age_seconds=0, dry_run=True)) == 3
+    assert count_objects(str(tmp_path)) == 4
+
+    removed = collect_garbage(str(tmp_path), min_age_seconds=0)
+    assert len(removed) == 3
+    assert count_objects(str(tmp_path)) == 1
+    assert provider._load_from_cache("problems_list_all", max_age_hours=None)["problems"] == problems_data[:1]
@@ -0,0 +1,157 @@
+"""
+LeetCode 페이지 병렬 수집 테스트
+
+로컬 GraphQL 스텁 서버(http.server, 포트 0)로 페이지 오프셋, 마지막 페이지에서 멈추는지,
+일부 페이지가 실패했을 때 받은 페이지만 반환하고 다음 호출에서 이어 받는지 확인합니다.
+
+    python -m pytest tests
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from algorithm_system.remote_problem_provider import LeetCodeProvider
+from algorithm_system.request_layer import RequestLayer, RetryPolicy
+
+
+PAGE_SIZE = 10
+TOTAL_QUESTIONS = 25
+
+
+class StubGraphQLServer(ThreadingHTTPServer):
+    """problemsetQuestionList 요청에 skip/limit 범위의 질문을 돌려주는 스텁 서버"""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubGraphQLHandler)
+        self.requests = []
+        self.failing_skips = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/graphql"
+
+
+class StubGraphQLHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        skip, limit = payload['variables']['skip'], payload['variables']['limit']
+
+        with server.lock:
+            server.requests.append((skip, limit))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(0.02)
+        with server.lock:
+            server.in_flight -= 1
+
+        if skip in server.failing_skips:
+            self.send_response(500)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        questions = [
+            {
+                'frontendQuestionId': str(number),
+                'title': f"Question {number}",
+                'titleSlug': f"question-{number}",
+                'difficulty': 'Easy',
+                'acRate': 50.0,
+                'topicTags': [{'name': 'Array', 'slug': 'array'}]
+            }
+            for number in range(skip + 1, min(TOTAL_QUESTIONS, skip + limit) + 1)
+        ]
+        body = json.dumps({
+            'data': {'problemsetQuestionList': {'total': TOTAL_QUESTIONS, 'questions': questions}}
+        }).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    stub = StubGraphQLServer()
+    thread = threading.Thread(target=stub.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def provider(tmp_path, server):
+    request_layer = RequestLayer(retry_policy=RetryPolicy(max_attempts=1))
+    request_layer.configure_platform('leetcode', rate_per_second=1000, burst=1000)
+    return LeetCodeProvider(
+        cache_dir=str(tmp_path), base_url=server.url, page_size=PAGE_SIZE, max_concurrency=2,
+        request_layer=request_layer
+    )
+
+
+def question_ids(problems):
+    return [int(problem.platform_problem_id) for problem in problems]
+
+
+def test_fetches_every_page_in_order(server, provider):
+    arrived = []
+    problems, complete = provider.fetch_all_problems(on_page=lambda index, page: arrived.append(index))
+
+    assert complete
+    assert question_ids(problems) == list(range(1, TOTAL_QUESTIONS + 1))
+    # 첫 페이지의 total로 페이지 수를 정하고 마지막 페이지 다음은 요청하지 않음
+    assert sorted(server.requests) == [(0, PAGE_SIZE), (10, PAGE_SIZE), (20, PAGE_SIZE)]
+    assert sorted(arrived) == [0, 1, 2]
+    assert server.max_in_flight <= 2
+
+
+def test_limit_stops_before_remaining_pages(server, provider):
+    problems, complete = provider.fetch_all_problems(limit=15)
+
+    assert complete
+    assert question_ids(problems) == list(range(1, 16))
+    assert sorted(skip for skip, _ in server.requests) == [0, 10]
+
+
+def test_partial_failure_resumes_from_page_cache(server, provider):
+    server.failing_skips.add(10)
+    problems, complete = provider.fetch_all_problems()
+
+    assert not complete
+    assert question_ids(problems) == list(range(1, 11)) + list(range(21, TOTAL_QUESTIONS + 1))
+
+    # 실패한 페이지만 다시 요청하고 나머지는 페이지 캐시에서 읽음
+    server.failing_skips.clear()
+    server.requests.clear()
+    problems, complete = provider.fetch_all_problems()
+
+    assert complete
+    assert question_ids(problems) == list(range(1, TOTAL_QUESTIONS + 1))
+    assert server.requests == [(10, PAGE_SIZE)]
+
+
+def test_incomplete_fetch_is_not_saved_as_catalog(server, provider):
+    server.failing_skips.add(20)
+    provider.get_problems()
+
+    assert provider._load_from_cache(provider.CATALOG_CACHE_KEY, max_age_hours=None) is None
+    assert provider._find_cache_path(provider._page_cache_key(0)) is not None
+
+    server.failing_skips.clear()
+    assert question_ids(provider._fetch_problems(None, "problems_list_all")) == list(range(1, TOTAL_QUESTIONS + 1))
+    assert provider._find_cache_path(provider._page_cache_key(0)) is None
@@ -0,0 +1,147 @@
+"""
+문제 본문 하이드레이션 테스트
+
+저장해 둔 문제 페이지 HTML(fixtures)로 파서를 확인하고, 저장된 본문이 프로바이더의 문제 목록에
+적용되는지 확인합니다.
+
+    python -m pytest tests
+"""
+
+import os
+
+from algorithm_system.problem_data_structures import AlgorithmProblem, ProblemPlatform
+from algorithm_system.problem_hydration import (
+    ProblemHydrator, apply_statement, parse_codeforces_statement, parse_leetcode_statement, parse_statement
+)
+from algorithm_system.remote_problem_provider import CodeforcesProvider
+
+import pytest
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_parse_codeforces_statement():
+    statement = parse_codeforces_statement(read_fixture("codeforces_4A.html"))
+
+    assert statement['problem_statement'].startswith("One hot summer day Pete and his friend Billy")
+    assert "\n\nPete and Billy are great fans of even numbers" in statement['problem_statement']
+    assert statement['input_format'].startswith("The first (and the only) input line contains integer number w")
+    assert "(1 ≤ w ≤ 100)" in statement['input_format']
+    assert statement['output_format'].startswith("Print YES, if the boys can divide")
+    assert statement['examples'] == [{'input': '8', 'output': 'YES', 'explanation': ''}]
+    assert statement['notes'].startswith("For example, the boys can divide")
+    assert statement['time_limit'] == 1.0
+    assert statement['memory_limit'] == 64
+
+
+def test_parse_codeforces_statement_without_statement_block():
+    with pytest.raises(ValueError):
+        parse_codeforces_statement("<html><body><p>Not found</p></body></html>")
+
+
+def test_parse_leetcode_statement():
+    statement = parse_leetcode_statement(read_fixture("leetcode_two_sum.html"))
+
+    assert statement['problem_statement'].startswith("Given an array of integers nums and an integer target")
+    assert "Example" not in statement['problem_statement']
+    assert statement['examples'] == [
+        {
+            'input': 'nums = [2,7,11,15], target = 9',
+            'output': '[0,1]',
+            'explanation': 'Because nums[0] + nums[1] == 9, we return [0, 1].'
+        },
+        {'input': 'nums = [3,2,4], target = 6', 'output': '[1,2]', 'explanation': ''}
+    ]
+    assert statement['constraints'].splitlines() == [
+        '2 <= nums.length <= 10^4',
+        '-10^9 <= nums[i] <= 10^9',
+        'Only one valid answer exists.'
+    ]
+
+
+def test_parse_statement_rejects_unsupported_platform():
+    with pytest.raises(ValueError):
+        parse_statement(ProblemPlatform.KAGGLE, "<p>dataset</p>")
+
+
+def test_apply_statement_builds_test_cases():
+    problem = AlgorithmProblem(title="Watermelon", platform=ProblemPlatform.CODEFORCES, platform_problem_id="4A")
+    apply_statement(problem, parse_codeforces_statement(read_fixture("codeforces_4A.html")))
+
+    assert problem.problem_statement.startswith("One hot summer day")
+    assert problem.time_limit == 1.0
+    assert problem.memory_limit == 64
+    assert [(tc.input_data, tc.expected_output) for tc in problem.test_cases] == [('8', 'YES')]
+    assert problem.test_cases[0].time_limit == 1.0
+
+
+def test_hydrated_statements_are_applied_to_problem_lists(tmp_path):
+    provider = CodeforcesProvider(cache_dir=str(tmp_path))
+    provider.fetch_statement_html = lambda problem: read_fixture("codeforces_4A.html")
+    problems = [
+        AlgorithmProblem(title="Watermelon", platform=ProblemPlatform.CODEFORCES, platform_problem_id="4A"),
+        AlgorithmProblem(title="Way Too Long Words", platform=ProblemPlatform.CODEFORCES, platform_problem_id="71A")
+    ]
+
+    stats = ProblemHydrator(provider, max_workers=1).hydrate(problems[:1])
+    assert stats == {'hydrated': 1, 'skipped': 0, 'failed': 0}
+
+    # 새 프로바이더 인스턴스에서 캐시로부터 만든 목록에도 본문이 적용되어야 함
+    reloaded = CodeforcesProvider(cache_dir=str(tmp_path))
+    assert reloaded.get_hydrated_problem_ids() == {"4A"}
+    fresh_problems = [
+        AlgorithmProblem(title=problem.title, platform=problem.platform,
+                         platform_problem_id=problem.platform_problem_id)
+        for problem in problems
+    ]
+    remembered = reloaded._remember_problems("problems_test", fresh_problems, 1)
+
+    assert remembered[0].problem_statement.startswith("One hot summer day")
+    assert remembered[0].examples == [{'input': '8', 'output': 'YES', 'explanation': ''}]
+    assert remembered[1].problem_statement == ""
+
+    # 이미 저장된 본문은 다시 가져오지 않음
+    assert ProblemHydrator(reloaded, max_workers=1).hydrate(fresh_problems[:1])['skipped'] == 1
+
+
+def test_apply_statement_keeps_conversion_notes():
+    problem = AlgorithmProblem(title="Watermelon", platform=ProblemPlatform.CODEFORCES,
+                               platform_problem_id="4A", notes="Rating: 800")
+    statement = parse_codeforces_statement(read_fixture("codeforces_4A.html"))
+    apply_statement(problem, statement)
+    apply_statement(problem, statement)
+
+    assert problem.notes.startswith("Rating: 800\n\n")
+    assert problem.notes.count(statement['notes']) == 1
+
+
+def test_statement_index_is_written_per_checkpoint(tmp_path):
+    provider = CodeforcesProvider(cache_dir=str(tmp_path))
+    provider.fetch_statement_html = lambda problem: read_fixture("codeforces_4A.html")
+    index_writes = []
+    save_to_cache = provider._save_to_cache
+
+    def counting_save(key, data):
+        if key == provider.STATEMENT_INDEX_CACHE_KEY:
+            index_writes.append(len(data['problem_ids']))
+        save_to_cache(key, data)
+
+    provider._save_to_cache = counting_save
+    problems = [
+        AlgorithmProblem(title=f"Problem {i}", platform=ProblemPlatform.CODEFORCES, platform_problem_id=f"{i}A")
+        for i in range(1, 8)
+    ]
+
+    stats = ProblemHydrator(provider, max_workers=2, checkpoint_interval=3).hydrate(problems)
+
+    assert stats['hydrated'] == 7
+    # 본문마다가 아니라 체크포인트마다(3, 6번째) 한 번, 마지막에 한 번만 씀
+    assert len(index_writes) <= 3
+    assert index_writes[-1] == 7
+    assert CodeforcesProvider(cache_dir=str(tmp_path)).get_hydrated_problem_ids() == {f"{i}A" for i in range(1, 8)}
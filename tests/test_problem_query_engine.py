@@ -0,0 +1,46 @@
+"""
+비트셋 질의 엔진 테스트
+
+    python -m pytest tests
+"""
+
+from algorithm_system.problem_data_structures import AlgorithmProblem, ProblemDifficulty, ProblemPlatform, ProblemTag
+from algorithm_system.problem_query_engine import ProblemQueryEngine
+
+
+def make_problems():
+    return [
+        AlgorithmProblem(id="p1", difficulty=ProblemDifficulty.EASY, platform=ProblemPlatform.CODEFORCES,
+                         tags={ProblemTag.DYNAMIC_PROGRAMMING}),
+        AlgorithmProblem(id="p2", difficulty=ProblemDifficulty.MEDIUM, platform=ProblemPlatform.CODEFORCES,
+                         tags={ProblemTag.GRAPH, ProblemTag.DFS}),
+        AlgorithmProblem(id="p3", difficulty=ProblemDifficulty.MEDIUM, platform=ProblemPlatform.LEETCODE,
+                         tags={ProblemTag.DYNAMIC_PROGRAMMING, ProblemTag.ARRAY})
+    ]
+
+
+def test_query_combines_masks():
+    problems = make_problems()
+    engine = ProblemQueryEngine(problems)
+
+    mask = engine.query_mask(
+        difficulty=ProblemDifficulty.MEDIUM,
+        any_tags=[ProblemTag.DYNAMIC_PROGRAMMING, ProblemTag.GRAPH],
+        exclude_mask=engine.ids_mask(["p2"])
+    )
+
+    assert engine.count(mask) == 1
+    assert [problem.id for problem in engine.problems(mask)] == ["p3"]
+
+
+def test_matches_detects_replaced_elements():
+    problems = make_problems()
+    engine = ProblemQueryEngine(problems)
+
+    assert engine.matches(problems)
+    assert engine.matches(list(problems))
+    assert not engine.matches(problems[:2])
+
+    # 같은 목록 객체에서 원소만 바뀐 경우도 다른 목록으로 봄
+    problems[1] = AlgorithmProblem(id="p4", difficulty=ProblemDifficulty.HARD)
+    assert not engine.matches(problems)
@@ -0,0 +1,18 @@
+"""
+원격 문제 관리자 테스트
+
+    python -m pytest tests
+"""
+
+from algorithm_system.remote_problem_provider import RemoteProblemManager
+
+
+def test_all_platforms_without_platforms_returns_empty_collection(tmp_path, monkeypatch):
+    manager = RemoteProblemManager(cache_dir=str(tmp_path))
+    monkeypatch.setattr(manager, "get_supported_platforms", lambda: [])
+    try:
+        collection = manager.get_problems_from_all_platforms()
+    finally:
+        manager.catalog.close()
+
+    assert len(collection.problems) == 0
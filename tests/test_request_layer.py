@@ -0,0 +1,163 @@
+"""
+공유 요청 계층 테스트
+
+정해진 상태 코드를 차례로 돌려주는 로컬 HTTP 서버(http.server, 포트 0)로 Retry-After 처리,
+5xx 재시도 상한, 서킷 브레이커 상태 전이(열림 → 반열림 → 닫힘), 속도 제한 대기 시간 초과를 확인합니다.
+
+    python -m pytest tests
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from algorithm_system.request_layer import (
+    CircuitBreakerOpenError, CircuitState, RateLimitTimeoutError, RequestLayer, RetryPolicy
+)
+
+
+class ScriptedServer(ThreadingHTTPServer):
+    """요청마다 responses에서 (상태 코드, 헤더)를 하나씩 꺼내 응답하는 서버 (비면 200)"""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), ScriptedHandler)
+        self.responses = []
+        self.request_count = 0
+        self.on_request = None
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api/problems"
+
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+            status, headers = server.responses.pop(0) if server.responses else (200, {})
+        if server.on_request:
+            server.on_request()
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+@pytest.fixture
+def server():
+    stub = ScriptedServer()
+    thread = threading.Thread(target=stub.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+def make_layer(sleeps, max_attempts=3, **platform_options):
+    layer = RequestLayer(retry_policy=RetryPolicy(max_attempts=max_attempts), sleep=sleeps.append)
+    platform_options.setdefault('rate_per_second', 1000)
+    platform_options.setdefault('burst', 1000)
+    layer.configure_platform('test', **platform_options)
+    return layer
+
+
+def test_retry_after_is_honored_on_429(server):
+    sleeps = []
+    layer = make_layer(sleeps)
+    server.responses = [(429, {'Retry-After': '2'})]
+
+    response = layer.request('test', 'GET', server.url, timeout=5)
+
+    assert response.status_code == 200
+    assert server.request_count == 2
+    assert sleeps == [2.0]
+
+
+def test_retry_after_is_capped_by_max_delay(server):
+    sleeps = []
+    layer = make_layer(sleeps)
+    server.responses = [(429, {'Retry-After': '3600'})]
+
+    layer.request('test', 'GET', server.url, timeout=5)
+
+    assert sleeps == [layer.retry_policy.max_delay]
+
+
+def test_5xx_retries_stop_at_max_attempts(server):
+    sleeps = []
+    layer = make_layer(sleeps, max_attempts=3, failure_threshold=10)
+    server.responses = [(503, {})] * 5
+
+    response = layer.request('test', 'GET', server.url, timeout=5)
+
+    # 마지막 응답을 그대로 반환하고 재시도 사이에만 대기
+    assert response.status_code == 503
+    assert server.request_count == 3
+    assert len(sleeps) == 2
+    assert all(0 <= delay <= layer.retry_policy.max_delay for delay in sleeps)
+
+
+def test_circuit_breaker_opens_half_opens_and_closes(server):
+    sleeps = []
+    layer = make_layer(sleeps, max_attempts=1, failure_threshold=2, recovery_timeout=0.1)
+    breaker = layer.get_policy('test').circuit_breaker
+    server.responses = [(500, {}), (500, {})]
+
+    for _ in range(2):
+        assert layer.request('test', 'GET', server.url, timeout=5).status_code == 500
+    assert breaker.state == CircuitState.OPEN
+
+    # 회복 시간 전에는 서버에 요청하지 않고 즉시 실패
+    with pytest.raises(CircuitBreakerOpenError):
+        layer.request('test', 'GET', server.url, timeout=5)
+    assert server.request_count == 2
+
+    # 회복 시간이 지나면 시험 요청 하나가 반열림 상태로 나가고, 성공하면 닫힘
+    time.sleep(0.15)
+    states_during_trial = []
+    server.on_request = lambda: states_during_trial.append(breaker.state)
+    assert layer.request('test', 'GET', server.url, timeout=5).status_code == 200
+    assert states_during_trial == [CircuitState.HALF_OPEN]
+    assert breaker.state == CircuitState.CLOSED
+    assert layer.get_circuit_states() == {'test': 'CLOSED'}
+
+
+def test_failed_trial_request_reopens_breaker(server):
+    sleeps = []
+    layer = make_layer(sleeps, max_attempts=1, failure_threshold=1, recovery_timeout=0.1)
+    breaker = layer.get_policy('test').circuit_breaker
+    server.responses = [(502, {}), (502, {})]
+
+    layer.request('test', 'GET', server.url, timeout=5)
+    assert breaker.state == CircuitState.OPEN
+
+    time.sleep(0.15)
+    assert layer.request('test', 'GET', server.url, timeout=5).status_code == 502
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitBreakerOpenError):
+        layer.request('test', 'GET', server.url, timeout=5)
+    assert server.request_count == 2
+
+
+def test_rate_limiter_timeout(server):
+    sleeps = []
+    layer = make_layer(sleeps, rate_per_second=1, burst=1)
+    layer.rate_limit_timeout = 0.1
+
+    layer.request('test', 'GET', server.url, timeout=5)
+    with pytest.raises(RateLimitTimeoutError):
+        layer.request('test', 'GET', server.url, timeout=5)
+
+    # 토큰을 얻지 못한 요청은 서버에 도달하지 않고 브레이커 상태에도 영향이 없음
+    assert server.request_count == 1
+    assert layer.get_policy('test').circuit_breaker.state == CircuitState.CLOSED
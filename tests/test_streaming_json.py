@@ -0,0 +1,113 @@
+"""
+스트리밍 JSON 파서 테스트
+
+청크 경계 위치와 상관없이 배열 요소를 같은 값으로 디코딩하는지, 잘못된 입력과 너무 큰 값에서
+입력을 끝까지 읽지 않고 실패하는지, 최상위 status 확인으로 Codeforces FAILED 응답을 거부하는지 확인합니다.
+
+    python -m pytest tests
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from algorithm_system.remote_problem_provider import CodeforcesProvider
+from algorithm_system.request_layer import RequestLayer, RetryPolicy
+from algorithm_system.streaming_json import iter_json_items
+
+
+PATH = ("result", "problems")
+
+PROBLEMS = [
+    {'contestId': i, 'index': 'A', 'name': f"Problem \"{i}\" é", 'rating': 800 + i * 100,
+     'points': 1e-3 * i, 'tags': ['dp'], 'interactive': False, 'solved': None}
+    for i in range(1, 6)
+]
+
+
+def split_chunks(data: bytes, size: int):
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+def test_items_are_identical_for_every_split_point():
+    data = json.dumps({'status': 'OK', 'result': {'problems': PROBLEMS, 'other': [1]}}, ensure_ascii=False).encode()
+
+    for split in range(1, len(data)):
+        assert list(iter_json_items([data[:split], data[split:]], PATH, {'status': 'OK'})) == PROBLEMS
+
+
+def test_malformed_value_fails_without_reading_to_eof():
+    pulled = []
+
+    def chunks():
+        yield '{"result": {"problems": [{"a": 1}, {"a": nope}, '
+        while True:
+            pulled.append(1)
+            yield '{"a": 1}, ' * 1000
+
+    with pytest.raises(ValueError):
+        list(iter_json_items(chunks(), PATH))
+    assert len(pulled) <= 1
+
+
+def test_oversized_value_is_rejected():
+    def chunks():
+        yield '{"result": {"problems": ["'
+        while True:
+            yield 'x' * 4096
+
+    with pytest.raises(ValueError):
+        list(iter_json_items(chunks(), PATH, max_value_size=64 * 1024))
+
+
+@pytest.mark.parametrize("document", [
+    {'status': 'FAILED', 'comment': 'Call limit exceeded'},
+    {'result': {'problems': PROBLEMS}, 'status': 'FAILED'},
+    {'result': {'problems': PROBLEMS}}
+])
+def test_expected_status_mismatch_is_rejected(document):
+    data = json.dumps(document).encode()
+    with pytest.raises(ValueError):
+        list(iter_json_items(split_chunks(data, 7), PATH, {'status': 'OK'}))
+
+
+def test_status_after_result_is_checked():
+    data = json.dumps({'result': {'problems': PROBLEMS}, 'status': 'OK'}).encode()
+    assert list(iter_json_items(split_chunks(data, 7), PATH, {'status': 'OK'})) == PROBLEMS
+
+
+class CodeforcesStubHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps(self.server.document).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_failed_codeforces_response_keeps_previous_sync(tmp_path):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CodeforcesStubHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    request_layer = RequestLayer(retry_policy=RetryPolicy(max_attempts=1))
+    request_layer.configure_platform('codeforces', rate_per_second=1000, burst=1000)
+    provider = CodeforcesProvider(cache_dir=str(tmp_path), request_layer=request_layer)
+    provider.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        server.document = {'status': 'OK', 'result': {'problems': PROBLEMS[:3]}}
+        assert len(provider.sync_problems(force=True)) == 3
+        state = provider._load_from_cache(provider.SYNC_STATE_CACHE_KEY, max_age_hours=None)
+
+        # HTTP 200이어도 status가 FAILED이면 이전 카탈로그와 동기화 상태를 그대로 둠
+        server.document = {'result': {'problems': PROBLEMS}, 'status': 'FAILED'}
+        assert len(provider.sync_problems(force=True)) == 3
+        assert provider._load_from_cache(provider.SYNC_STATE_CACHE_KEY, max_age_hours=None) == state
+    finally:
+        server.shutdown()
+        server.server_close()